@@ -1,34 +1,47 @@
 import customtkinter as ctk
-import random
 import time
 from tkinter import messagebox
 import threading
 import tkinter
 
+from games.memory_model import HIDDEN, MATCHED, MATCH_CHECK_MS, MEMORY_THEMES, MemoryBoard, theme_faces
+from games.memory_renderer import MemoryCanvasRenderer
+from games.memory_solver import balanced_deal
+from utils.frame_clock import FrameClock
+
+# Grid sizes offered in the Size menu; from CANVAS_MIN_GRID up the cards are
+# drawn on one Canvas instead of one CTkButton each
+GRID_SIZES = ["4x4", "6x6", "8x8", "10x10", "12x12", "16x16", "20x20"]
+CANVAS_MIN_GRID = 8
+
+
 class MemoryGame:
-    def __init__(self, parent, game_manager=None, return_callback=None):
+    def __init__(self, parent, game_manager=None, return_callback=None, clock=None):
         self.parent = parent
+        # Timers run on the shared FrameClock (GameManager's, or a private one)
+        self.timers = (clock or FrameClock(parent)).client("memory")
         self.game_manager = game_manager
         self.game_frame = None
-        self.cards = []
-        self.card_buttons = []
-        self.flipped_cards = []
-        self.matched_pairs = 0
-        self.moves = 0
+        self.board = None  # MemoryBoard: card values and hidden/flipped/matched state
+        self.card_buttons = []  # One button per card, same order as board.values
+        # Card buttons are kept per grid size and reconfigured for each new game
+        self.pool_cards = True
+        self.card_pools = {}
+        self.shown_pool = None
+        self.dirty_cards = set()  # Indices whose button no longer shows a hidden card
+        self.card_canvas = None  # Canvas and renderer for large grids
+        self.card_renderer = None
+        self.canvas_shown = False
         self.start_time = None
         self.game_active = False
         self.grid_size = 4  # 4x4 grid (16 cards, 8 pairs)
         self.timer_job = None  # Track timer job for proper cleanup
         self.checking_match = False  # Prevent multiple simultaneous checks
+        self.balanced_deals = False  # Deal only shuffles of average difficulty
         self.return_callback = return_callback
         
-        # Card themes
-        self.themes = {
-            "Numbers": list(range(1, 19)),  # Extended for 6x6 support (18 pairs max)
-            "Letters": ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R'],
-            "Symbols": ['★', '♠', '♥', '♦', '♣', '♪', '☀', '☽', '⚡', '❄', '🔥', '💧', '🌟', '⭐', '✨', '💫', '🌙', '☄'],
-            "Emojis": ['🎮', '🎯', '🎨', '🎪', '🎭', '🎲', '🎸', '🎹', '🎵', '🎬', '🎤', '🎧', '🎺', '🎻', '🥁', '🎪', '🎠', '🎡']
-        }
+        # Card themes; theme_faces() generates extra faces for large grids
+        self.themes = MEMORY_THEMES
         self.current_theme = "Numbers"
         
         # Initialize the game window
@@ -84,12 +97,22 @@ class MemoryGame:
         difficulty_menu = ctk.CTkOptionMenu(
             controls_frame,
             variable=self.difficulty_var,
-            values=["4x4", "6x6"],
+            values=GRID_SIZES,
             command=self.change_difficulty,
             width=80
         )
         difficulty_menu.pack(side="left", padx=(0, 20))
         
+        # Balanced deals: every game needs about the same number of moves
+        self.balanced_var = ctk.BooleanVar(value=self.balanced_deals)
+        balanced_checkbox = ctk.CTkCheckBox(
+            controls_frame,
+            text="Balanced",
+            variable=self.balanced_var,
+            command=self.toggle_balanced_deals
+        )
+        balanced_checkbox.pack(side="left", padx=(0, 20))
+        
         # New Game button
         new_game_btn = ctk.CTkButton(
             controls_frame,
@@ -132,6 +155,11 @@ class MemoryGame:
         # Game area
         self.game_frame = ctk.CTkFrame(main_container, fg_color="#0f0f23")
         self.game_frame.pack(fill="both", expand=True)
+        self.card_pools = {}
+        self.shown_pool = None
+        self.card_canvas = None
+        self.card_renderer = None
+        self.canvas_shown = False
         
         # Back button
         back_btn = ctk.CTkButton(
@@ -153,11 +181,14 @@ class MemoryGame:
         if self.game_active:
             self.start_new_game()
             
+    def toggle_balanced_deals(self):
+        self.balanced_deals = bool(self.balanced_var.get())
+        if self.game_active:
+            self.start_new_game()
+            
     def change_difficulty(self, difficulty):
-        if difficulty == "4x4":
-            self.grid_size = 4
-        elif difficulty == "6x6":
-            self.grid_size = 6
+        if difficulty in GRID_SIZES:
+            self.grid_size = int(difficulty.split("x")[0])
         
         if self.game_active:
             self.start_new_game()
@@ -166,17 +197,18 @@ class MemoryGame:
         # Cleanup previous game
         self.cleanup()
         
-        # Clear existing game
-        if self.game_frame and self.game_frame.winfo_exists():
+        # Without pooling, clear existing game
+        if not self.pool_cards and self.game_frame and self.game_frame.winfo_exists():
             for widget in self.game_frame.winfo_children():
                 widget.destroy()
+            self.card_pools = {}
+            self.shown_pool = None
+            self.card_buttons = []
+            self.card_canvas = None
+            self.card_renderer = None
+            self.canvas_shown = False
             
         # Reset game state
-        self.cards = []
-        self.card_buttons = []
-        self.flipped_cards = []
-        self.matched_pairs = 0
-        self.moves = 0
         self.start_time = time.time()
         self.game_active = True
         self.checking_match = False
@@ -188,19 +220,18 @@ class MemoryGame:
         
         # Start timer
         self.update_timer()
+        self.timer_job = self.timers.every(1000, self.update_timer)
         
     def create_cards(self):
         total_pairs = (self.grid_size * self.grid_size) // 2
-        theme_values = self.themes[self.current_theme][:total_pairs]
-        
-        # Ensure we have enough values for the selected grid size
-        if len(theme_values) < total_pairs:
-            # Fallback to numbers if theme doesn't have enough values
-            theme_values = list(range(1, total_pairs + 1))
+        theme_values = theme_faces(self.current_theme, total_pairs)
         
         # Create pairs
-        self.cards = theme_values * 2
-        random.shuffle(self.cards)
+        if self.balanced_deals:
+            values = balanced_deal(theme_values)
+            self.board = MemoryBoard(self.grid_size, values=values)
+        else:
+            self.board = MemoryBoard(self.grid_size, faces=theme_values)
         
         # Update pairs label safely
         try:
@@ -212,18 +243,52 @@ class MemoryGame:
     def create_card_grid(self):
         if not self.game_frame or not self.game_frame.winfo_exists():
             return
+        if self.grid_size >= CANVAS_MIN_GRID:
+            self.create_card_canvas()
+            return
+        if self.canvas_shown:
+            self.card_canvas.grid_remove()
+            self.game_frame.grid_rowconfigure(0, weight=0)
+            self.game_frame.grid_columnconfigure(0, weight=0)
+            self.canvas_shown = False
             
+        # Turn the previous game's face-up and matched cards back over
+        for index in self.dirty_cards:
+            try:
+                self.card_buttons[index].configure(
+                    text="?", fg_color="#2b2b52", hover_color="#3d3d73", text_color="#ffffff"
+                )
+            except (IndexError, tkinter.TclError):
+                pass
+        self.dirty_cards = set()
+
+        # Hide the other size's cards; their grid options are remembered
+        if self.shown_pool is not None and self.shown_pool != self.grid_size:
+            for btn in self.card_pools.get(self.shown_pool, []):
+                btn.grid_remove()
+            for i in range(self.shown_pool):
+                self.game_frame.grid_rowconfigure(i, weight=0)
+                self.game_frame.grid_columnconfigure(i, weight=0)
+
         # Configure grid
         for i in range(self.grid_size):
             self.game_frame.grid_rowconfigure(i, weight=1)
             self.game_frame.grid_columnconfigure(i, weight=1)
+
+        pool = self.card_pools.get(self.grid_size)
+        if pool is not None:
+            if self.shown_pool != self.grid_size:
+                for btn in pool:
+                    btn.grid()
+            self.card_buttons = pool
+            self.shown_pool = self.grid_size
+            return
             
         # Create card buttons
         self.card_buttons = []
         card_size = max(60, min(100, 400 // self.grid_size))
         
         for i in range(self.grid_size):
-            row_buttons = []
             for j in range(self.grid_size):
                 idx = i * self.grid_size + j
                 
@@ -238,98 +303,105 @@ class MemoryGame:
                     command=lambda index=idx: self.flip_card(index)
                 )
                 btn.grid(row=i, column=j, padx=2, pady=2, sticky="nsew")
-                row_buttons.append(btn)
-                
-            self.card_buttons.append(row_buttons)
-            
-    def flip_card(self, index):
-        if not self.game_active or len(self.flipped_cards) >= 2 or self.checking_match:
+                self.card_buttons.append(btn)
+        self.card_pools[self.grid_size] = self.card_buttons
+        self.shown_pool = self.grid_size
+
+    def create_card_canvas(self):
+        """Show the current board on the shared Canvas, hiding any button grid"""
+        if self.shown_pool is not None:
+            for btn in self.card_pools.get(self.shown_pool, []):
+                btn.grid_remove()
+            for i in range(self.shown_pool):
+                self.game_frame.grid_rowconfigure(i, weight=0)
+                self.game_frame.grid_columnconfigure(i, weight=0)
+            self.shown_pool = None
+
+        if self.card_canvas is None:
+            self.card_canvas = tkinter.Canvas(
+                self.game_frame, width=640, height=480,
+                bg="#0f0f23", highlightthickness=0
+            )
+            self.card_canvas.bind("<Button-1>", self.on_canvas_click)
+            self.card_canvas.bind("<Configure>", self.on_canvas_resize)
+        if not self.canvas_shown:
+            self.game_frame.grid_rowconfigure(0, weight=1)
+            self.game_frame.grid_columnconfigure(0, weight=1)
+            self.card_canvas.grid(row=0, column=0, sticky="nsew")
+            self.canvas_shown = True
+
+        if self.card_renderer is None:
+            width = max(self.card_canvas.winfo_width(), int(self.card_canvas["width"]))
+            height = max(self.card_canvas.winfo_height(), int(self.card_canvas["height"]))
+            self.card_renderer = MemoryCanvasRenderer(self.card_canvas, self.board, width, height)
+        else:
+            self.card_renderer.set_board(self.board)
+
+    def on_canvas_click(self, event):
+        if self.card_renderer is None:
             return
-        
-        # Validate index
-        if index < 0 or index >= len(self.cards):
+        index = self.card_renderer.index_at(event.x, event.y)
+        if index is not None:
+            self.flip_card(index)
+
+    def on_canvas_resize(self, event):
+        if self.card_renderer is not None:
+            self.card_renderer.resize(event.width, event.height)
+
+    def show_card(self, index):
+        """Mirror board.state[index] on the card's button or canvas items"""
+        if self.canvas_shown:
+            self.card_renderer.update_card(index)
             return
-            
-        row, col = index // self.grid_size, index % self.grid_size
-        
-        # Validate button exists
+        self.dirty_cards.add(index)
+        state = self.board.state[index]
         try:
-            if (row >= len(self.card_buttons) or col >= len(self.card_buttons[row])):
-                return
-            btn = self.card_buttons[row][col]
-            if not btn.winfo_exists():
-                return
+            btn = self.card_buttons[index]
+            if state == HIDDEN:
+                btn.configure(text="?", fg_color="#2b2b52", text_color="#ffffff")
+            elif state == MATCHED:
+                btn.configure(fg_color="#00ff88", hover_color="#00ff88")
+            else:
+                btn.configure(
+                    text=str(self.board.values[index]), fg_color="#ffd700", text_color="#000000"
+                )
         except (IndexError, tkinter.TclError):
-            return
+            # Widgets went away mid-game; the model is still correct
+            pass
             
-        # Don't flip already flipped or matched cards
-        if (row, col) in self.flipped_cards or btn.cget("fg_color") == "#00ff88":
+    def flip_card(self, index):
+        # Rules run on the board model; buttons only mirror it
+        if not self.game_active or self.checking_match or not self.board:
             return
-            
-        # Flip card
-        try:
-            btn.configure(text=str(self.cards[index]), fg_color="#ffd700", text_color="#000000")
-            self.flipped_cards.append((row, col))
-        except tkinter.TclError:
+        if not self.board.flip(index):
             return
+        self.show_card(index)
         
         # Check for match
-        if len(self.flipped_cards) == 2:
-            self.moves += 1
+        if self.board.pair_pending:
             self.update_stats()
             self.checking_match = True
-            # Use after() instead of threading for GUI operations
-            self.parent.after(1000, self.check_match)
+            # Resolve on the Tk thread through the shared clock
+            self.timers.after(MATCH_CHECK_MS, lambda board=self.board: self.check_match(board))
             
-    def check_match(self):
-        if len(self.flipped_cards) != 2 or not self.game_active:
-            self.checking_match = False
+    def check_match(self, board=None):
+        # A check scheduled before New Game must not resolve the new board
+        if board is not None and board is not self.board:
             return
-            
-        try:
-            pos1, pos2 = self.flipped_cards
-            idx1 = pos1[0] * self.grid_size + pos1[1]
-            idx2 = pos2[0] * self.grid_size + pos2[1]
-            
-            # Validate indices and buttons
-            if (idx1 >= len(self.cards) or idx2 >= len(self.cards) or
-                pos1[0] >= len(self.card_buttons) or pos1[1] >= len(self.card_buttons[pos1[0]]) or
-                pos2[0] >= len(self.card_buttons) or pos2[1] >= len(self.card_buttons[pos2[0]])):
-                self.flipped_cards = []
-                self.checking_match = False
-                return
-            
-            btn1 = self.card_buttons[pos1[0]][pos1[1]]
-            btn2 = self.card_buttons[pos2[0]][pos2[1]]
-            
-            # Check if buttons still exist
-            if not btn1.winfo_exists() or not btn2.winfo_exists():
-                self.flipped_cards = []
-                self.checking_match = False
-                return
-            
-            if self.cards[idx1] == self.cards[idx2]:
-                # Match found
-                btn1.configure(fg_color="#00ff88", hover_color="#00ff88")
-                btn2.configure(fg_color="#00ff88", hover_color="#00ff88")
-                self.matched_pairs += 1
-                
-                # Check for game completion
-                total_pairs = (self.grid_size * self.grid_size) // 2
-                if self.matched_pairs == total_pairs:
-                    self.game_complete()
-            else:
-                # No match, flip back
-                btn1.configure(text="?", fg_color="#2b2b52", text_color="#ffffff")
-                btn2.configure(text="?", fg_color="#2b2b52", text_color="#ffffff")
-                
-        except (IndexError, AttributeError, tkinter.TclError):
-            # Handle any errors gracefully
-            pass
-        finally:
-            self.flipped_cards = []
-            self.checking_match = False
-            self.update_stats()
+        self.checking_match = False
+        if not self.game_active or not self.board:
+            return
+        result = self.board.resolve()
+        if result is None:
+            return
+        matched, first, second = result
+        # Matched cards turn green, others flip back
+        self.show_card(first)
+        self.show_card(second)
+        
+        self.update_stats()
+        if self.board.is_complete():
+            self.game_complete()
         
     def game_complete(self):
         self.game_active = False
@@ -347,53 +419,51 @@ class MemoryGame:
                     "Congratulations!",
                     f"🎉 You completed the memory game!\n\n"
                     f"Time: {minutes:02d}:{seconds:02d}\n"
-                    f"Moves: {self.moves}\n"
+                    f"Moves: {self.board.moves}\n"
                     f"Grid Size: {self.grid_size}x{self.grid_size}\n"
                     f"Theme: {self.current_theme}"
                 )
             except Exception:
                 # Fallback if messagebox fails
-                print(f"Game completed! Time: {minutes:02d}:{seconds:02d}, Moves: {self.moves}")
+                print(f"Game completed! Time: {minutes:02d}:{seconds:02d}, Moves: {self.board.moves}")
         
     def update_stats(self):
         try:
             if not self.game_active:
                 return
                 
-            total_pairs = (self.grid_size * self.grid_size) // 2
-            
+            board = self.board
             if hasattr(self, 'moves_label') and self.moves_label.winfo_exists():
-                self.moves_label.configure(text=f"Moves: {self.moves}")
+                self.moves_label.configure(text=f"Moves: {board.moves}")
             if hasattr(self, 'pairs_label') and self.pairs_label.winfo_exists():
-                self.pairs_label.configure(text=f"Pairs: {self.matched_pairs}/{total_pairs}")
+                self.pairs_label.configure(text=f"Pairs: {board.matched_pairs}/{board.total_pairs}")
         except (AttributeError, tkinter.TclError):
             pass
         
     def update_timer(self):
+        # Returning False ends the clock subscription
         try:
             if self.game_active and self.start_time and hasattr(self, 'time_label') and self.time_label.winfo_exists():
                 elapsed = int(time.time() - self.start_time)
                 minutes = elapsed // 60
                 seconds = elapsed % 60
                 self.time_label.configure(text=f"Time: {minutes:02d}:{seconds:02d}")
-                # Store the timer job reference for cleanup
-                self.timer_job = self.parent.after(1000, self.update_timer)
+                return True
         except (AttributeError, tkinter.TclError):
             # Widget no longer exists, stop timer
             self.game_active = False
+        return False
             
     def cleanup(self):
         """Clean up timers and resources"""
         self.game_active = False
         if self.timer_job:
-            try:
-                self.parent.after_cancel(self.timer_job)
-            except:
-                pass
+            self.timers.after_cancel(self.timer_job)
             self.timer_job = None
             
     def return_to_menu(self):
         self.cleanup()
+        self.timers.close()
         if callable(self.return_callback):
             self.return_callback()
         elif self.game_manager and hasattr(self.game_manager, 'return_to_menu'):
@@ -419,4 +489,4 @@ def test_memory_game():
     root.mainloop()
 
 if __name__ == "__main__":
-    test_memory_game()
\ No newline at end of file
+    test_memory_game()
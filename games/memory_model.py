@@ -0,0 +1,135 @@
+"""
+Memory Model - games/memory_model.py
+Headless Memory Match board: card values plus one state byte per card
+"""
+
+import random
+from typing import List, Optional, Sequence, Tuple
+
+# Card states stored in MemoryBoard.state
+HIDDEN = 0
+FLIPPED = 1
+MATCHED = 2
+
+# Delay before a flipped pair is matched or turned back, in the game and in simulations
+MATCH_CHECK_MS = 1000
+
+# Hand-picked faces per theme; theme_faces() extends them for large boards
+MEMORY_THEMES = {
+    "Numbers": list(range(1, 19)),
+    "Letters": ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R'],
+    "Symbols": ['★', '♠', '♥', '♦', '♣', '♪', '☀', '☽', '⚡', '❄', '🔥', '💧', '🌟', '⭐', '✨', '💫', '🌙', '☄'],
+    "Emojis": ['🎮', '🎯', '🎨', '🎪', '🎭', '🎲', '🎸', '🎹', '🎵', '🎬', '🎤', '🎧', '🎺', '🎻', '🥁', '🎳', '🎠', '🎡'],
+}
+
+# Code point ranges used to generate extra faces, per theme
+EXTRA_FACE_RANGES = {
+    "Symbols": [(0x2600, 0x2700), (0x2700, 0x27C0)],
+    "Emojis": [(0x1F400, 0x1F4FD), (0x1F300, 0x1F321)],
+}
+
+
+def theme_faces(theme: str, count: int) -> List:
+    """
+    `count` distinct card faces for a theme: the hand-picked ones first, then
+    generated ones (numbers, AA/AB letter pairs, or characters from the
+    theme's Unicode blocks). Falls back to numbers when a theme runs out.
+    """
+    base = MEMORY_THEMES.get(theme, MEMORY_THEMES["Numbers"])
+    faces = list(dict.fromkeys(base))[:count]
+    seen = set(faces)
+
+    def extra():
+        if theme == "Letters":
+            letters = [chr(c) for c in range(ord('A'), ord('Z') + 1)]
+            yield from letters
+            for first in letters:
+                for second in letters:
+                    yield first + second
+        for start, end in EXTRA_FACE_RANGES.get(theme, []):
+            for code in range(start, end):
+                yield chr(code)
+
+    for face in extra():
+        if len(faces) >= count:
+            break
+        if face not in seen:
+            faces.append(face)
+            seen.add(face)
+    if len(faces) < count:
+        faces = list(range(1, count + 1))
+    return faces
+
+
+class MemoryBoard:
+    """
+    Rules of one Memory Match deal with no Tk dependency.
+
+    values[i] is the face of card i (cards are numbered row by row) and
+    state[i] is HIDDEN, FLIPPED or MATCHED. At most two cards are face up
+    at once; when a second one is flipped the pair is pending until
+    resolve() matches it or turns both back.
+    """
+
+    def __init__(self, rows: int, cols: Optional[int] = None,
+                 faces: Optional[Sequence] = None, rng=None, values: Optional[List] = None):
+        self.rows = rows
+        self.cols = cols or rows
+        self.size = self.rows * self.cols
+        if self.size % 2:
+            raise ValueError(f"A {self.rows}x{self.cols} board has an odd number of cards")
+        self.total_pairs = self.size // 2
+
+        if values is None:
+            faces = list(faces) if faces is not None else list(range(1, self.total_pairs + 1))
+            if len(faces) < self.total_pairs:
+                raise ValueError(f"Need {self.total_pairs} card faces, got {len(faces)}")
+            values = faces[:self.total_pairs] * 2
+            (rng or random).shuffle(values)
+        elif len(values) != self.size:
+            raise ValueError(f"Expected {self.size} card values, got {len(values)}")
+
+        self.values: List = values
+        self.state = bytearray(self.size)
+        self.flipped: List[int] = []  # face-up, unresolved cards in flip order
+        self.moves = 0
+        self.matched_pairs = 0
+
+    def can_flip(self, index: int) -> bool:
+        return 0 <= index < self.size and len(self.flipped) < 2 and self.state[index] == HIDDEN
+
+    def flip(self, index: int) -> bool:
+        """Turn a hidden card face up; a second flip makes a pending pair and counts a move"""
+        if not self.can_flip(index):
+            return False
+        self.state[index] = FLIPPED
+        self.flipped.append(index)
+        if len(self.flipped) == 2:
+            self.moves += 1
+        return True
+
+    @property
+    def pair_pending(self) -> bool:
+        return len(self.flipped) == 2
+
+    def resolve(self) -> Optional[Tuple[bool, int, int]]:
+        """Settle the pending pair: (matched, first, second), or None if there is none"""
+        if not self.pair_pending:
+            return None
+        first, second = self.flipped
+        matched = self.values[first] == self.values[second]
+        new_state = MATCHED if matched else HIDDEN
+        self.state[first] = self.state[second] = new_state
+        if matched:
+            self.matched_pairs += 1
+        self.flipped = []
+        return matched, first, second
+
+    def is_complete(self) -> bool:
+        return self.matched_pairs == self.total_pairs
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.cols + col
+
+    def position(self, index: int) -> Tuple[int, int]:
+        return divmod(index, self.cols)
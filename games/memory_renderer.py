@@ -0,0 +1,139 @@
+"""
+Memory Renderer - games/memory_renderer.py
+Single-Canvas card grid for large Memory boards (8x8 up to 20x20)
+"""
+
+from typing import List, Optional, Set
+
+from games.memory_model import HIDDEN, MATCHED, MemoryBoard
+
+# Same colors as the CTkButton cards used for small grids
+CARD_COLORS = {
+    "background": "#0f0f23",
+    "hidden": "#2b2b52",
+    "flipped": "#ffd700",
+    "matched": "#00ff88",
+    "hidden_text": "#ffffff",
+    "face_text": "#000000",
+}
+
+
+class MemoryCanvasRenderer:
+    """
+    Draws one rectangle and one text item per card on a single Canvas.
+
+    Clicks are mapped to a card index from their coordinates (index_at), so
+    no per-card widgets or bindings exist. Items are created once per grid
+    size; set_board() with a same-sized deal only turns back the cards the
+    previous game left face up, and update_card() touches two items.
+    """
+
+    def __init__(self, canvas, board: MemoryBoard, width: int, height: int,
+                 colors: Optional[dict] = None, gap: int = 2):
+        self.canvas = canvas
+        self.colors = colors or CARD_COLORS
+        self.gap = gap
+        self.width = width
+        self.height = height
+        self.board = board
+        self.rows = 0
+        self.cols = 0
+        self.pitch = 0
+        self.origin = (0, 0)
+        self.rect_items: List[int] = []
+        self.text_items: List[int] = []
+        self.shown: Set[int] = set()  # cards currently drawn face up or matched
+        self._build()
+
+    # ------------------------------------------------------------------ layout
+
+    def _layout(self):
+        self.pitch = max(4, min(self.width // self.cols, self.height // self.rows))
+        self.origin = (
+            (self.width - self.pitch * self.cols) // 2,
+            (self.height - self.pitch * self.rows) // 2,
+        )
+
+    def _card_box(self, index: int):
+        row, col = divmod(index, self.cols)
+        ox, oy = self.origin
+        x1 = ox + col * self.pitch
+        y1 = oy + row * self.pitch
+        size = self.pitch - self.gap
+        return x1, y1, x1 + size, y1 + size
+
+    def _font(self):
+        return ("Arial", max(6, int(self.pitch * 0.4)), "bold")
+
+    def _build(self):
+        """Create the items for the current board's size"""
+        canvas, board, c = self.canvas, self.board, self.colors
+        canvas.delete("card")
+        self.rows, self.cols = board.rows, board.cols
+        self._layout()
+        font = self._font()
+        self.rect_items = []
+        self.text_items = []
+        for index in range(board.size):
+            x1, y1, x2, y2 = self._card_box(index)
+            self.rect_items.append(canvas.create_rectangle(
+                x1, y1, x2, y2, fill=c["hidden"], outline="", tags=("card", "card_rect")
+            ))
+            self.text_items.append(canvas.create_text(
+                (x1 + x2) / 2, (y1 + y2) / 2, text="?", fill=c["hidden_text"],
+                font=font, tags=("card", "card_text")
+            ))
+        self.shown = set()
+        for index in range(board.size):
+            if board.state[index] != HIDDEN:
+                self.update_card(index)
+
+    def resize(self, width: int, height: int):
+        """Refit the grid to a new canvas size, moving the existing items"""
+        if (width, height) == (self.width, self.height) or width < 2 or height < 2:
+            return
+        self.width, self.height = width, height
+        self._layout()
+        canvas = self.canvas
+        for index, (rect, text) in enumerate(zip(self.rect_items, self.text_items)):
+            x1, y1, x2, y2 = self._card_box(index)
+            canvas.coords(rect, x1, y1, x2, y2)
+            canvas.coords(text, (x1 + x2) / 2, (y1 + y2) / 2)
+        canvas.itemconfig("card_text", font=self._font())
+
+    # ------------------------------------------------------------------ state
+
+    def set_board(self, board: MemoryBoard):
+        """Show a new deal, reusing the items when the grid size is unchanged"""
+        previous = self.board
+        self.board = board
+        if (board.rows, board.cols) != (previous.rows, previous.cols):
+            self._build()
+            return
+        for index in list(self.shown):
+            self.update_card(index)
+
+    def update_card(self, index: int):
+        """Redraw one card from board.state"""
+        state = self.board.state[index]
+        c = self.colors
+        if state == HIDDEN:
+            fill, text, text_color = c["hidden"], "?", c["hidden_text"]
+            self.shown.discard(index)
+        else:
+            fill = c["matched"] if state == MATCHED else c["flipped"]
+            text, text_color = str(self.board.values[index]), c["face_text"]
+            self.shown.add(index)
+        self.canvas.itemconfig(self.rect_items[index], fill=fill)
+        self.canvas.itemconfig(self.text_items[index], text=text, fill=text_color)
+
+    def index_at(self, x: float, y: float) -> Optional[int]:
+        """Card under canvas point (x, y), or None for the gaps and margins"""
+        ox, oy = self.origin
+        col, dx = divmod(int(x) - ox, self.pitch)
+        row, dy = divmod(int(y) - oy, self.pitch)
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return None
+        if dx >= self.pitch - self.gap or dy >= self.pitch - self.gap:
+            return None
+        return row * self.cols + col
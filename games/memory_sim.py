@@ -0,0 +1,380 @@
+"""
+Memory Simulator - games/memory_sim.py
+Headless Memory Match games played by bot players with different memories
+
+Usage:
+    python -m games.memory_sim --players perfect lru:6 noisy:0.8 --games 2000
+    python -m games.memory_sim --sizes 4x4 6x6 8x8 --themes Numbers Emojis --output sim.json
+
+Player specs are a registry name with an optional parameter after a colon:
+    perfect        remembers every card it has seen
+    lru[:N]        remembers the N most recently seen cards (default 8)
+    noisy[:P]      recalls each remembered card with probability P (default 0.85),
+                   scaled by THEME_RECALL; a failed recall forgets the card
+
+Game time is modelled as MATCH_CHECK_MS per move (the game's pause before a
+pair is resolved) plus a think-and-click time per flip.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from games.memory_model import HIDDEN, MATCH_CHECK_MS, MEMORY_THEMES, MemoryBoard, theme_faces
+
+# Mean seconds to pick and click one card, and its standard deviation
+FLIP_SECONDS = 0.8
+FLIP_JITTER = 0.25
+
+# Relative recall per theme for the noisy player; a guess until calibrated
+THEME_RECALL = {
+    "Numbers": 1.0,
+    "Letters": 1.0,
+    "Symbols": 0.9,
+    "Emojis": 0.95,
+}
+
+# Target from the memory_expert achievement
+EXPERT_SECONDS = 60
+
+
+class _IndexPool:
+    """Set of card indices with O(1) add, remove and random choice"""
+
+    def __init__(self, items=()):
+        self.items: List[int] = list(items)
+        self.slots: Dict[int, int] = {item: i for i, item in enumerate(self.items)}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.slots
+
+    def add(self, item: int):
+        if item not in self.slots:
+            self.slots[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item: int):
+        slot = self.slots.pop(item, None)
+        if slot is None:
+            return
+        last = self.items.pop()
+        if slot < len(self.items):
+            self.items[slot] = last
+            self.slots[last] = slot
+
+    def choice(self, rng) -> int:
+        return self.items[int(rng.random() * len(self.items))]
+
+
+class MemoryPlayer:
+    """
+    Base player: perfect memory. Subclasses change what is kept (remember)
+    and whether a memory can be trusted when it is needed (recall).
+
+    Each move flips a remembered pair if one is known; otherwise an unknown
+    card, then its remembered partner or another unknown card.
+    """
+
+    name = "perfect"
+
+    def __init__(self, rng=None, param: Optional[str] = None):
+        self.rng = rng if rng is not None else random.Random()
+        self.theme = "Numbers"
+
+    def reset(self, board: MemoryBoard, theme: str = "Numbers"):
+        self.board = board
+        self.theme = theme
+        self.unknown = _IndexPool(i for i in range(board.size) if board.state[i] == HIDDEN)
+        self.memory: Dict[int, Any] = {}  # index -> face, hidden cards only
+        self.locations: Dict[Any, List[int]] = {}  # face -> remembered indices
+        self.pairs = set()  # faces with both cards remembered
+
+    # ------------------------------------------------------------------ memory
+
+    def remember(self, index: int, value):
+        if index in self.memory:
+            return
+        self.memory[index] = value
+        self.unknown.discard(index)
+        places = self.locations.setdefault(value, [])
+        places.append(index)
+        if len(places) == 2:
+            self.pairs.add(value)
+
+    def forget(self, index: int, matched: bool = False):
+        value = self.memory.pop(index, None)
+        if value is None:
+            return
+        places = self.locations[value]
+        places.remove(index)
+        self.pairs.discard(value)
+        if not places:
+            del self.locations[value]
+        if not matched:
+            self.unknown.add(index)
+
+    def recall(self, index: int) -> bool:
+        return True
+
+    # ------------------------------------------------------------------ moves
+
+    def observe(self, index: int, value):
+        self.remember(index, value)
+
+    def resolved(self, matched: bool, first: int, second: int):
+        if matched:
+            self.forget(first, matched=True)
+            self.forget(second, matched=True)
+            self.unknown.discard(first)
+            self.unknown.discard(second)
+
+    def choose_first(self) -> int:
+        while self.pairs:
+            value = next(iter(self.pairs))
+            first, second = self.locations[value]
+            if self.recall(first) and self.recall(second):
+                return first
+            # recall() forgot one of them; look for another pair
+        if self.unknown:
+            return self.unknown.choice(self.rng)
+        return next(iter(self.memory))
+
+    def choose_second(self, first: int) -> int:
+        for index in list(self.locations.get(self.board.values[first], ())):
+            if index != first and self.recall(index):
+                return index
+        if self.unknown:
+            return self.unknown.choice(self.rng)
+        # Everything left is remembered (only reachable after forgetting)
+        for index in self.memory:
+            if index != first:
+                return index
+        raise RuntimeError("No card left to flip")
+
+
+class LruPlayer(MemoryPlayer):
+    """
+    Keeps only the `capacity` most recently seen cards. The capacity is at
+    least 1: the face-up first card of a move is always known.
+    """
+
+    name = "lru"
+
+    def __init__(self, rng=None, param: Optional[str] = None):
+        super().__init__(rng)
+        self.capacity = max(1, int(param)) if param else 8
+
+    def reset(self, board, theme="Numbers"):
+        super().reset(board, theme)
+        self.memory = OrderedDict()
+
+    def remember(self, index, value):
+        if index in self.memory:
+            self.memory.move_to_end(index)
+            return
+        while len(self.memory) >= self.capacity:
+            self.forget(next(iter(self.memory)))
+        super().remember(index, value)
+
+
+class NoisyPlayer(MemoryPlayer):
+    """Each remembered card is recalled with probability `recall_rate` when needed"""
+
+    name = "noisy"
+
+    def __init__(self, rng=None, param: Optional[str] = None):
+        super().__init__(rng)
+        self.recall_rate = float(param) if param else 0.85
+
+    def recall(self, index):
+        if self.rng.random() < self.recall_rate * THEME_RECALL.get(self.theme, 1.0):
+            return True
+        self.forget(index)
+        return False
+
+
+MEMORY_PLAYERS = {
+    MemoryPlayer.name: MemoryPlayer,
+    LruPlayer.name: LruPlayer,
+    NoisyPlayer.name: NoisyPlayer,
+}
+
+
+def register_player(name: str, player_class):
+    """Make a player class available to the batch runner under name"""
+    MEMORY_PLAYERS[name] = player_class
+
+
+def load_player(spec: str, rng=None) -> MemoryPlayer:
+    """Create a player from "name" or "name:param", e.g. "lru:6" """
+    name, _, param = spec.partition(":")
+    if name not in MEMORY_PLAYERS:
+        raise ValueError(f"Unknown memory player '{name}', available: {', '.join(sorted(MEMORY_PLAYERS))}")
+    return MEMORY_PLAYERS[name](rng=rng, param=param or None)
+
+
+def parse_size(size: str) -> int:
+    """'6x6' -> 6"""
+    rows, _, cols = size.partition("x")
+    if not rows.isdigit() or (cols and cols != rows):
+        raise ValueError(f"Expected a square grid like 6x6, got '{size}'")
+    return int(rows)
+
+
+def play_game(board: MemoryBoard, player: MemoryPlayer, theme: str = "Numbers",
+              rng=None, flip_seconds: float = FLIP_SECONDS) -> Dict[str, Any]:
+    """Play one deal to the end; returns moves, modelled seconds and misses"""
+    rng = rng or player.rng
+    player.reset(board, theme)
+    seconds = 0.0
+    misses = 0
+    max_moves = board.size * board.size  # guards against a broken player
+    check_seconds = MATCH_CHECK_MS / 1000
+    while not board.is_complete() and board.moves < max_moves:
+        first = player.choose_first()
+        board.flip(first)
+        player.observe(first, board.values[first])
+        second = player.choose_second(first)
+        if not board.flip(second):
+            raise RuntimeError(f"{player.name} flipped card {second}, which is not hidden")
+        player.observe(second, board.values[second])
+        matched, first, second = board.resolve()
+        player.resolved(matched, first, second)
+        if not matched:
+            misses += 1
+        # Two flips: the sum of two per-flip times is one draw with sqrt(2) the spread
+        seconds += check_seconds + max(0.4, rng.gauss(2 * flip_seconds, FLIP_JITTER * 1.414))
+    return {
+        "moves": board.moves,
+        "seconds": seconds,
+        "misses": misses,
+        "completed": board.is_complete(),
+    }
+
+
+def run_job(job: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """One player on `games` deals of one size and theme; top-level so it pickles"""
+    size = job["size"]
+    faces = theme_faces(job["theme"], size * size // 2)
+    rng = random.Random(job["seed"])
+    player = load_player(job["player"], rng=random.Random(job["seed"] + 1))
+    records = []
+    for _ in range(job["games"]):
+        board = MemoryBoard(size, faces=faces, rng=rng)
+        result = play_game(board, player, job["theme"], rng, job["flip_seconds"])
+        result.update(player=job["player"], grid=f"{size}x{size}", theme=job["theme"])
+        records.append(result)
+    return records
+
+
+def run_batch(players: List[str], sizes: List[int], themes: List[str], games: int,
+              seed: int = 0, workers: Optional[int] = 1,
+              flip_seconds: float = FLIP_SECONDS) -> List[Dict[str, Any]]:
+    """
+    Play `games` games for every player x size x theme. Deals depend only on
+    the seed, size and theme, so every player sees the same deals.
+    """
+    jobs = [
+        {"player": player, "size": size, "theme": theme, "games": games,
+         "seed": seed + size * 1000 + t, "flip_seconds": flip_seconds}
+        for player in players
+        for size in sizes
+        for t, theme in enumerate(themes)
+    ]
+    if workers == 1:
+        results = [run_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+            results = list(executor.map(run_job, jobs))
+    return [record for records in results for record in records]
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    values = sorted(values)
+    deciles = statistics.quantiles(values, n=10) if len(values) > 1 else [values[0]] * 9
+    return {
+        "mean": statistics.fmean(values),
+        "median": statistics.median(values),
+        "p10": deciles[0],
+        "p90": deciles[-1],
+        "min": values[0],
+        "max": values[-1],
+    }
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Move and time distributions per "player grid theme" group"""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        key = f"{record['player']} {record['grid']} {record['theme']}"
+        groups.setdefault(key, []).append(record)
+
+    summary = {}
+    for key, games in groups.items():
+        summary[key] = {
+            "games": len(games),
+            "moves": _distribution([r["moves"] for r in games]),
+            "seconds": _distribution([r["seconds"] for r in games]),
+            "under_expert": sum(r["seconds"] < EXPERT_SECONDS for r in games) / len(games),
+            "incomplete": sum(not r["completed"] for r in games),
+        }
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate Memory Match games with bot players")
+    parser.add_argument("--players", nargs="+", default=["perfect", "lru", "noisy"],
+                        help="player specs, e.g. perfect lru:6 noisy:0.8")
+    parser.add_argument("--sizes", nargs="+", default=["4x4", "6x6"])
+    parser.add_argument("--themes", nargs="+", default=["Numbers"], choices=sorted(MEMORY_THEMES))
+    parser.add_argument("--games", type=int, default=1000, help="games per player, size and theme")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1, help="0 for all cores")
+    parser.add_argument("--flip-seconds", type=float, default=FLIP_SECONDS,
+                        help="mean think-and-click time per card")
+    parser.add_argument("--output", help="write summary and records as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        for player in args.players:
+            load_player(player)
+        sizes = [parse_size(size) for size in args.sizes]
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    records = run_batch(args.players, sizes, args.themes, args.games, args.seed,
+                        args.workers or None, args.flip_seconds)
+    elapsed = time.perf_counter() - start
+    summary = summarize(records)
+
+    print(f"{'player grid theme':<28}{'moves':>7}{'p10':>6}{'p90':>6}{'secs':>8}{'p10':>7}{'p90':>7}"
+          f"{'<' + str(EXPERT_SECONDS) + 's':>7}")
+    for key, stats in summary.items():
+        moves, seconds = stats["moves"], stats["seconds"]
+        print(
+            f"{key:<28}{moves['mean']:>7.1f}{moves['p10']:>6.0f}{moves['p90']:>6.0f}"
+            f"{seconds['mean']:>8.1f}{seconds['p10']:>7.1f}{seconds['p90']:>7.1f}"
+            f"{stats['under_expert']:>7.0%}"
+        )
+    print(f"{len(records)} games in {elapsed:.2f}s ({len(records) / elapsed:,.0f} games/sec)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"summary": summary, "records": records}, f, indent=2)
+        print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""
+Memory Solver - games/memory_solver.py
+Deal difficulty for Memory Match: exact moves for an ideal-memory player,
+a vectorized scorer for many shuffles, and balanced deal selection
+
+The ideal player never forgets and explores unknown cards in reading order
+(top-left first), as people scanning a grid tend to. Each move it flips the
+next unknown card, then that card's partner if it has been seen, otherwise
+the next unknown card; a pair it happens to learn is taken on its next move.
+With the order fixed, the move count depends only on the deal.
+
+Over random deals the mean equals expected_moves(pairs), the same player's
+expectation when it explores in random order. balanced_deal() picks a deal
+whose reading-order move count is that mean, so no deal is unusually easy.
+
+numpy is optional and only needed for the bulk scorer (score_shuffles,
+estimate_distribution); solve_deal() and balanced_deal() are pure Python.
+"""
+
+import random
+import time
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Shuffles scored per New Game when picking a balanced deal
+BALANCED_CANDIDATES = 64
+BALANCED_BUDGET_MS = 15
+
+
+def solve_deal(values: Sequence) -> int:
+    """Moves the reading-order ideal player needs to clear this deal"""
+    seen = set()
+    moves = 0
+    p = 0
+    size = len(values)
+    while p < size:
+        first = values[p]
+        moves += 1
+        if first in seen:
+            # Partner seen earlier: match it right away
+            p += 1
+            continue
+        second = values[p + 1]
+        if second != first and second in seen:
+            moves += 1  # a miss, then the newly learnt pair next move
+        seen.add(first)
+        seen.add(second)
+        p += 2
+    return moves
+
+
+# _EXPECTED[unknown][singles]: expected moves left with `unknown` unseen
+# cards, `singles` of which are partners of cards already seen (and no known
+# pair waiting). Rows are filled bottom-up as larger boards ask for them;
+# entries with unknown - singles odd cannot occur and stay 0.
+_EXPECTED: List[List[float]] = [[0.0]]
+
+
+def _extend_expected(unknown_max: int):
+    table = _EXPECTED
+    for unknown in range(len(table), unknown_max + 1):
+        row = [0.0] * (unknown + 1)
+        rest = unknown - 1
+        below1 = table[unknown - 1]
+        below2 = table[unknown - 2] if unknown >= 2 else None
+        for singles in range(unknown % 2, unknown + 1, 2):
+            total = 0.0
+            if singles:
+                # First flip hits the partner of a seen card: match it
+                total += singles / unknown * (1 + below1[singles - 1])
+            fresh = unknown - singles
+            if fresh:
+                same = below2[singles]
+                step = (1 + same) / rest
+                if singles:
+                    step += singles * (2 + same) / rest
+                if rest - 1 - singles > 0:
+                    step += (rest - 1 - singles) * (1 + below2[singles + 2]) / rest
+                total += fresh / unknown * step
+            row[singles] = total
+        table.append(row)
+
+
+def expected_moves(pairs: int) -> float:
+    """
+    Mean moves of the ideal-memory player over random deals with `pairs`
+    pairs. The table is extended on first use of a larger board and kept,
+    so only the first deal of a size pays for it (about 35 ms for 20x20).
+    """
+    if len(_EXPECTED) <= 2 * pairs:
+        _extend_expected(2 * pairs)
+    return _EXPECTED[2 * pairs][0]
+
+
+def score_shuffles(deals) -> "np.ndarray":
+    """
+    solve_deal() for every row of an (N, cards) integer array of pair codes,
+    stepping all deals together; loops at most `cards` times.
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("score_shuffles requires numpy (pip install numpy)")
+    deals = np.asarray(deals)
+    count, size = deals.shape
+    # Two padding columns per row so cursor + 1 stays inside the row
+    width = size + 2
+
+    # is_second[b, i]: the partner of card i comes earlier in reading order
+    order = np.argsort(deals, axis=1, kind="stable")
+    is_second = np.zeros((count, width), dtype=bool)
+    is_second[np.arange(count)[:, None], order[:, 1::2]] = True
+    codes = np.full((count, width), -1, dtype=np.int32)
+    codes[:, :size] = deals
+    is_second = is_second.ravel()
+    codes = codes.ravel()
+
+    # One flat cursor per deal
+    cursor = np.arange(count, dtype=np.intp) * width
+    end = cursor + size
+    moves = np.zeros(count, dtype=np.int32)
+    while True:
+        live = cursor < end
+        if not live.any():
+            break
+        # A card that opens a new pair is followed by a flip of the next card
+        two = ~is_second[cursor]
+        learnt = two & is_second[cursor + 1] & (codes[cursor + 1] != codes[cursor])
+        moves += live
+        moves += learnt & live
+        cursor += live * (1 + two)
+    return moves
+
+
+def random_deals(pairs: int, count: int, rng=None) -> "np.ndarray":
+    """(count, 2 * pairs) array of shuffled pair codes 0..pairs-1"""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("random_deals requires numpy (pip install numpy)")
+    generator = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+    codes = np.repeat(np.arange(pairs, dtype=np.int16), 2)
+    return generator.permuted(np.broadcast_to(codes, (count, codes.size)), axis=1)
+
+
+def estimate_distribution(pairs: int, shuffles: int = 1_000_000, seed: Optional[int] = None,
+                          chunk: int = 65536) -> Dict:
+    """Move-count histogram of `shuffles` random deals, scored in chunks"""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("estimate_distribution requires numpy (pip install numpy)")
+    generator = np.random.default_rng(seed)
+    counts = None
+    done = 0
+    start = time.perf_counter()
+    while done < shuffles:
+        n = min(chunk, shuffles - done)
+        moves = score_shuffles(random_deals(pairs, n, generator))
+        hist = np.bincount(moves, minlength=2 * pairs + 1)
+        if counts is None:
+            counts = hist
+        else:
+            if hist.size > counts.size:
+                counts = np.pad(counts, (0, hist.size - counts.size))
+            counts[:hist.size] += hist
+        done += n
+    elapsed = time.perf_counter() - start
+
+    cumulative = np.cumsum(counts) / shuffles
+    values = np.arange(counts.size)
+    return {
+        "pairs": pairs,
+        "shuffles": shuffles,
+        "mean": float((counts * values).sum() / shuffles),
+        "expected": expected_moves(pairs),
+        "p10": int(np.searchsorted(cumulative, 0.1)),
+        "median": int(np.searchsorted(cumulative, 0.5)),
+        "p90": int(np.searchsorted(cumulative, 0.9)),
+        "min": int(values[counts > 0][0]),
+        "max": int(values[counts > 0][-1]),
+        "histogram": {int(m): int(c) for m, c in zip(values, counts) if c},
+        "shuffles_per_second": shuffles / elapsed,
+    }
+
+
+def balanced_deal(faces: Sequence, rng=None, candidates: int = BALANCED_CANDIDATES,
+                  budget_ms: float = BALANCED_BUDGET_MS) -> List:
+    """
+    Card values (len(faces) pairs, reading order) for a deal whose ideal
+    move count is as close as possible to expected_moves(). Tries up to
+    `candidates` shuffles and stops early on an exact hit or when the time
+    budget runs out; a hit usually comes within a few tries, so this stays
+    pure Python rather than scoring a numpy batch.
+    """
+    # The budget covers the target too, in case its table is not built yet
+    deadline = time.perf_counter() + budget_ms / 1000
+    rng = rng or random
+    pairs = len(faces)
+    target = expected_moves(pairs)
+
+    best, best_error = None, None
+    codes = list(range(pairs)) * 2
+    for _ in range(candidates):
+        rng.shuffle(codes)
+        error = abs(solve_deal(codes) - target)
+        if best is None or error < best_error:
+            best, best_error = list(codes), error
+        if best_error < 0.5 or time.perf_counter() > deadline:
+            break
+    return [faces[code] for code in best]
+
+
+def benchmark(sizes=(4, 6, 8, 12, 20), shuffles: int = 200_000, seed: int = 0) -> List[Dict]:
+    """Distribution, scoring throughput and balanced_deal() time per grid size"""
+    results = []
+    rng = random.Random(seed)
+    for size in sizes:
+        pairs = size * size // 2
+        row = {"grid": f"{size}x{size}", "expected": expected_moves(pairs)}
+        if NUMPY_AVAILABLE:
+            stats = estimate_distribution(pairs, shuffles, seed)
+            row.update({k: stats[k] for k in ("mean", "p10", "median", "p90", "shuffles_per_second")})
+        faces = list(range(pairs))
+        timings = []
+        for _ in range(20):
+            start = time.perf_counter()
+            deal = balanced_deal(faces, rng)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        row["balanced_ms_median"] = timings[len(timings) // 2]
+        row["balanced_ms_max"] = timings[-1]
+        row["balanced_moves"] = solve_deal(deal)
+        results.append(row)
+    return results
+
+
+if __name__ == "__main__":
+    for row in benchmark():
+        spread = ""
+        if "mean" in row:
+            spread = (f"mean {row['mean']:6.1f}  p10 {row['p10']:4}  p90 {row['p90']:4}  "
+                      f"{row['shuffles_per_second']:>10,.0f} shuffles/s  ")
+        print(
+            f"{row['grid']:>6}: expected {row['expected']:6.1f}  {spread}"
+            f"balanced {row['balanced_moves']:4} moves in {row['balanced_ms_median']:.2f} ms "
+            f"(max {row['balanced_ms_max']:.2f})"
+        )
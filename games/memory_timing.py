@@ -0,0 +1,150 @@
+"""
+Memory Timing - games/memory_timing.py
+New Game and canvas-grid timings for MemoryGame, on Tk or on stub widgets
+
+Usage:
+    python -m games.memory_timing --time-resets [--headless]
+    python -m games.memory_timing --time-canvas [--headless]
+
+--headless patches games.memory_game's ctk/tkinter names with the stubs from
+utils/headless_tk.py for the duration of the run, so no display is needed.
+"""
+
+import contextlib
+import sys
+import time
+
+import games.memory_game as memory_game
+from utils.headless_tk import VirtualTimeRoot, stub_widgets, widget_work
+
+
+def _root(headless, geometry):
+    if headless:
+        return VirtualTimeRoot()
+    ctk = memory_game.ctk
+    ctk.set_appearance_mode("dark")
+    root = ctk.CTk()
+    root.geometry(geometry)
+    return root
+
+
+def _backend(headless):
+    return stub_widgets(memory_game) if headless else contextlib.nullcontext()
+
+
+def time_new_game_resets(rounds=20, headless=False):
+    """
+    Milliseconds per New Game for 4x4 and 6x6, with card widgets destroyed
+    and recreated (pool_cards=False) versus pooled. Each round flips a pair
+    first so the pooled path has cards to turn back. headless=True also
+    reports widgets created and widget calls per New Game.
+    """
+    results = {}
+    with _backend(headless):
+        root = _root(headless, "800x700")
+        game = memory_game.MemoryGame(root)
+        root.update()
+
+        for pooled in (False, True):
+            game.pool_cards = pooled
+            for size in ("4x4", "6x6"):
+                game.change_difficulty(size)
+                game.start_new_game()
+                root.update()
+                samples = []
+                created, calls = widget_work()
+                for _ in range(rounds):
+                    game.flip_card(0)
+                    game.flip_card(1)
+                    game.checking_match = False
+                    start = time.perf_counter()
+                    game.start_new_game()
+                    root.update_idletasks()
+                    samples.append((time.perf_counter() - start) * 1000)
+                samples.sort()
+                row = {"ms": samples[len(samples) // 2]}
+                if headless:
+                    # The flips' own calls are included; they are the same in both modes
+                    row["widgets_created"] = (widget_work()[0] - created) / rounds
+                    row["widget_calls"] = (widget_work()[1] - calls) / rounds
+                results[(size, "pooled" if pooled else "recreate")] = row
+
+        game.cleanup()
+        root.destroy()
+    return results
+
+
+def time_canvas_grids(sizes=("8x8", "12x12", "16x16", "20x20"), rounds=10, headless=False):
+    """
+    Milliseconds to set up each canvas grid size (first game, items created)
+    and per New Game after that (items reused), plus the median flip time.
+    headless=True also reports the Canvas calls setup made. Headless times
+    are stub-only: the Python bookkeeping around each Canvas call, with no
+    Canvas items actually created or drawn, so they are a floor, not a Tk
+    measurement.
+    """
+    results = {}
+    with _backend(headless):
+        root = _root(headless, "900x900")
+        game = memory_game.MemoryGame(root)
+        root.update()
+
+        for size in sizes:
+            game.change_difficulty(size)  # starts a game itself when one is active
+            game.card_renderer = None  # so the timed game creates the items, not reuses them
+            calls = widget_work()[1]
+            start = time.perf_counter()
+            game.start_new_game()
+            root.update_idletasks()
+            setup = (time.perf_counter() - start) * 1000
+            setup_calls = widget_work()[1] - calls
+
+            resets = []
+            flips = []
+            for _ in range(rounds):
+                game.flip_card(0)
+                game.flip_card(1)
+                game.checking_match = False
+                start = time.perf_counter()
+                game.start_new_game()
+                root.update_idletasks()
+                resets.append((time.perf_counter() - start) * 1000)
+
+                start = time.perf_counter()
+                game.flip_card(game.board.size - 1)
+                root.update_idletasks()
+                flips.append((time.perf_counter() - start) * 1000)
+            resets.sort()
+            flips.sort()
+            results[size] = {
+                "setup_ms": setup,
+                "new_game_ms": resets[len(resets) // 2],
+                "flip_ms": flips[len(flips) // 2],
+            }
+            if headless:
+                results[size]["canvas_calls"] = setup_calls
+
+        game.cleanup()
+        root.destroy()
+    return results
+
+
+if __name__ == "__main__":
+    headless = "--headless" in sys.argv
+    if "--time-resets" in sys.argv:
+        for (size, mode), row in time_new_game_resets(headless=headless).items():
+            work = ""
+            if headless:
+                work = f", {row['widgets_created']:.0f} widgets created, {row['widget_calls']:.0f} widget calls"
+            print(f"{size} {mode:>8}: {row['ms']:7.2f} ms per New Game{work}")
+    elif "--time-canvas" in sys.argv:
+        if headless:
+            print("stub widgets: Python bookkeeping only, no Canvas items created or drawn")
+        for size, row in time_canvas_grids(headless=headless).items():
+            work = f", {row['canvas_calls']} canvas calls at setup (stub-only)" if headless else ""
+            print(
+                f"{size:>6}: setup {row['setup_ms']:7.2f} ms, "
+                f"new game {row['new_game_ms']:6.2f} ms, flip {row['flip_ms']:5.2f} ms{work}"
+            )
+    else:
+        print(__doc__)
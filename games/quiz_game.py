@@ -1,13 +1,22 @@
 """
-Enhanced Quiz Game (KBA Style) - FIXED TIMER VERSION
-The key fix: Use threading.Timer instead of tkinter.after() for proper cancellation
+Enhanced Quiz Game (KBA Style)
+The countdown is a monotonic deadline checked from the Tk loop through the
+shared FrameClock: no timer threads, and the time shown is deadline - now
 """
 
 import customtkinter as ctk
+import math
 import random
+import sqlite3
 import time
-import threading
-from typing import Callable, List, Dict, Any
+from typing import Callable, List, Dict, Any, Union
+
+from utils.frame_clock import FrameClock
+from utils.question_bank import QUIZ_POOL_SIZE, QuestionBank, answer_indices, as_quiz_lists, ensure_bank
+
+# Seconds per question, and what the extra-time lifeline adds
+QUESTION_SECONDS = 30
+EXTRA_TIME_SECONDS = 15
 
 
 class QuizGame:
@@ -16,28 +25,35 @@ class QuizGame:
         parent_frame: ctk.CTkFrame,
         questions: List[str],
         options: List[List[str]],
-        correct_answers: List[str],
+        correct_answers: List[Union[str, int]],
         return_callback: Callable = None,
+        clock: FrameClock = None,
+        time_source: Callable[[], float] = time.monotonic,
     ):
         self.parent_frame = parent_frame
         self.questions = questions
         self.options = options
         self.correct_answers = correct_answers
+        # Correct option per question, checked once here (ValueError on a
+        # mismatch) so answering is an integer compare
+        self.correct_indices = answer_indices(options, correct_answers)
         self.return_callback = return_callback
 
         # Game state
         self.current_question_index = 0
         self.score = 0
         self.total_questions = 10
-        self.time_remaining = 30
+        self.time_remaining = QUESTION_SECONDS  # whole seconds shown, from the deadline
         self.timer_running = False
         self.game_over = False
         self.selected_questions = []
         
-        # CRITICAL FIX: Use threading.Timer instead of tkinter.after()
+        # Countdown: a deadline on time_source, checked on the shared clock
         self.is_cleaned_up = False
-        self.timer_object = None  # Will store the threading.Timer object
-        self.timer_lock = threading.Lock()  # Thread safety
+        self.time_source = time_source
+        self.deadline = None
+        self.timers = (clock or FrameClock(parent_frame)).client("quiz")
+        self.timer_job = None  # pending check_timer() on the clock
 
         # Lifelines
         self.lifelines = {"fifty_fifty": True, "skip": True, "extra_time": True}
@@ -330,69 +346,43 @@ class QuizGame:
             )
 
         # Reset timer
-        self.time_remaining = 30
+        self.time_remaining = QUESTION_SECONDS
+        self.deadline = None
         self.next_btn.configure(state="disabled")
 
         # Update progress
         progress = (self.current_question_index) / self.total_questions
         self.progress_bar.set(progress)
 
-    # CRITICAL FIX: New timer implementation using threading.Timer
     def start_timer(self):
-        """Start the countdown timer using threading.Timer for proper cleanup"""
+        """Start the countdown for the current question"""
         if not self.game_over and not self.is_cleaned_up:
             self.timer_running = True
-            self.schedule_timer_update()
+            self.deadline = self.time_source() + self.time_remaining
+            self.check_timer()
+
+    def check_timer(self):
+        """Refresh the countdown from the deadline; times out once it passes"""
+        self.timers.after_cancel(self.timer_job)
+        self.timer_job = None
+        if not self.timer_running or self.game_over or self.is_cleaned_up:
+            return
 
-    def schedule_timer_update(self):
-        """Schedule the next timer update using threading.Timer"""
-        with self.timer_lock:
-            if not self.timer_running or self.game_over or self.is_cleaned_up:
-                return
-            
-            # Cancel any existing timer
-            if self.timer_object and self.timer_object.is_alive():
-                self.timer_object.cancel()
-            
-            # Create new timer for 1 second from now
-            self.timer_object = threading.Timer(1.0, self.timer_tick)
-            self.timer_object.daemon = True  # Dies when main thread dies
-            self.timer_object.start()
-
-    def timer_tick(self):
-        """Timer tick handler - runs in separate thread"""
-        with self.timer_lock:
-            if not self.timer_running or self.game_over or self.is_cleaned_up:
-                return
-        
-        try:
-            # Check if parent frame still exists
-            if not self.parent_frame.winfo_exists():
-                self.stop_timer()
-                return
-        except:
-            self.stop_timer()
+        remaining = self.deadline - self.time_source()
+        if remaining <= 0:
+            self.time_remaining = 0
+            self.update_timer_display()
+            self.timeout()
             return
 
-        if self.time_remaining > 0:
-            # Use after_idle to safely update UI from timer thread
-            try:
-                self.parent_frame.after_idle(self.update_timer_display)
-                self.time_remaining -= 1
-                
-                # Schedule next tick
-                self.schedule_timer_update()
-            except:
-                self.stop_timer()
-        else:
-            # Time's up - handle timeout on main thread
-            try:
-                self.parent_frame.after_idle(self.timeout)
-            except:
-                self.stop_timer()
+        self.time_remaining = math.ceil(remaining)
+        self.update_timer_display()
+        # Wake up when the displayed second changes
+        until_next = remaining - (self.time_remaining - 1)
+        self.timer_job = self.timers.after(until_next * 1000 + 1, self.check_timer)
 
     def update_timer_display(self):
-        """Update timer display on main thread"""
+        """Update timer display"""
         if self.is_cleaned_up or not self.timer_running:
             return
             
@@ -407,16 +397,14 @@ class QuizGame:
                     self.timer_label.configure(text_color=self.colors["button_hover"])
                 else:
                     self.timer_label.configure(text_color=self.colors["text_secondary"])
-        except:
+        except Exception:
             self.stop_timer()
 
     def stop_timer(self):
-        """Stop the timer completely"""
-        with self.timer_lock:
-            self.timer_running = False
-            if self.timer_object and self.timer_object.is_alive():
-                self.timer_object.cancel()
-                self.timer_object = None
+        """Stop the countdown and drop its pending check"""
+        self.timer_running = False
+        self.timers.after_cancel(self.timer_job)
+        self.timer_job = None
 
     def select_answer(self, option_index: int):
         """Handle answer selection"""
@@ -425,18 +413,15 @@ class QuizGame:
 
         self.stop_timer()  # Use the proper stop method
 
-        # Get correct answer
         q_index = self.selected_questions[self.current_question_index]
-        correct_answer = str(self.correct_answers[q_index]).strip()
-        selected_option = str(self.options[q_index][option_index]).strip()
-        is_correct = selected_option == correct_answer
+        correct_index = self.correct_indices[q_index]
+        is_correct = option_index == correct_index
 
         # Update button colors
         for i, btn in enumerate(self.option_buttons):
             if btn.winfo_exists():
                 btn.configure(state="disabled")
-                option_text = str(self.options[q_index][i]).strip()
-                if option_text == correct_answer:
+                if i == correct_index:
                     btn.configure(fg_color=self.colors["success"])
                 elif i == option_index and not is_correct:
                     btn.configure(fg_color=self.colors["danger"])
@@ -472,12 +457,12 @@ class QuizGame:
 
         # Disable all buttons and show correct answer
         q_index = self.selected_questions[self.current_question_index]
-        correct_answer = self.correct_answers[q_index]
+        correct_index = self.correct_indices[q_index]
 
         for i, btn in enumerate(self.option_buttons):
             if btn.winfo_exists():
                 btn.configure(state="disabled")
-                if self.options[q_index][i] == correct_answer:
+                if i == correct_index:
                     btn.configure(fg_color=self.colors["success"])
 
         if self.next_btn and self.next_btn.winfo_exists():
@@ -492,18 +477,11 @@ class QuizGame:
         if self.fifty_fifty_btn.winfo_exists():
             self.fifty_fifty_btn.configure(state="disabled", fg_color="gray")
 
-        # Get correct answer and hide two wrong options
+        # Hide two wrong options
         q_index = self.selected_questions[self.current_question_index]
-        correct_answer = str(self.correct_answers[q_index]).strip()
-        options = [str(opt).strip() for opt in self.options[q_index]]
-
-        if correct_answer not in options:
-            print(f"[ERROR] Correct answer '{correct_answer}' not found in options: {options}")
-            return
-
-        correct_index = options.index(correct_answer)
-        wrong_indices = [i for i in range(len(options)) if i != correct_index]
-        to_hide = random.sample(wrong_indices, 2)
+        correct_index = self.correct_indices[q_index]
+        wrong_indices = [i for i in range(len(self.options[q_index])) if i != correct_index]
+        to_hide = random.sample(wrong_indices, min(2, len(wrong_indices)))
 
         for i in to_hide:
             if self.option_buttons[i].winfo_exists():
@@ -528,7 +506,11 @@ class QuizGame:
         self.lifelines["extra_time"] = False
         if self.extra_time_btn.winfo_exists():
             self.extra_time_btn.configure(state="disabled", fg_color="gray")
-        self.time_remaining += 15
+        if self.timer_running:
+            self.deadline += EXTRA_TIME_SECONDS
+            self.check_timer()
+        else:
+            self.time_remaining += EXTRA_TIME_SECONDS
 
     def end_game(self):
         """End the game and show results"""
@@ -659,8 +641,9 @@ class QuizGame:
         # Set cleanup flag first to prevent any further operations
         self.is_cleaned_up = True
         
-        # CRITICAL: Stop timer with proper cancellation
+        # Stop the countdown and drop this game's client from the shared clock
         self.stop_timer()
+        self.timers.close()
         
         # Stop all game operations
         self.game_over = True
@@ -703,13 +686,21 @@ def start_quiz_game(parent_frame: ctk.CTkFrame, return_callback: Callable = None
     This function should be called from the main app
     """
     try:
-        from data.Questions import questions
-        from data.Options import options
-        from data.CorrectAnswer import correct_answers
-    except ImportError:
-        # Fallback data if files don't exist
-        questions = ["What is 2+2?", "What is the capital of France?"]
-        options = [["3", "4", "5", "6"], ["London", "Paris", "Berlin", "Madrid"]]
-        correct_answers = ["4", "Paris"]
-
-    return QuizGame(parent_frame, questions, options, correct_answers, return_callback)
\ No newline at end of file
+        # Only the sampled questions are read from the compiled bank
+        with QuestionBank(ensure_bank()) as bank:
+            questions, options, correct_answers = as_quiz_lists(bank.sample(QUIZ_POOL_SIZE))
+        if not questions:
+            raise ValueError("question bank is empty")
+    except (ImportError, ValueError, OSError, sqlite3.Error) as e:
+        print(f"[QuizGame] Could not read question bank: {e}")
+        try:
+            from data.Questions import questions
+            from data.Options import options
+            from data.CorrectAnswer import correct_answers
+        except ImportError:
+            # Fallback data if files don't exist
+            questions = ["What is 2+2?", "What is the capital of France?"]
+            options = [["3", "4", "5", "6"], ["London", "Paris", "Berlin", "Madrid"]]
+            correct_answers = ["4", "Paris"]
+
+    return QuizGame(parent_frame, questions, options, correct_answers, return_callback)
@@ -0,0 +1,92 @@
+"""
+Quiz Stress - games/quiz_stress.py
+Plays many quizzes back to back on one shared FrameClock, headless, and
+reports whatever timers, clock clients and threads they leave behind
+
+Usage:
+    python -m games.quiz_stress [runs]
+
+games.quiz_game's ctk names are patched with the stubs from
+utils/headless_tk.py, and the FrameClock and the quizzes share the stub
+root's virtual clock, so the countdowns run out through the clock itself.
+"""
+
+import contextlib
+import io
+import sys
+import threading
+import time
+from typing import Any, Dict
+
+import games.quiz_game as quiz_game
+from utils.frame_clock import FrameClock
+from utils.headless_tk import VirtualTimeRoot, stub_widgets
+
+
+def stress_quiz_timers(runs: int = 1000) -> Dict[str, Any]:
+    """
+    Play `runs` quizzes on one clock. Question i % 3 == 0 runs out its
+    countdown in virtual time, 1 is answered after a second, and 2 uses a
+    lifeline first; every fourth quiz is left mid-question through
+    return_to_menu(), so teardown with a live countdown is covered too.
+    """
+    questions = [f"Stress question {i}?" for i in range(20)]
+    options = [["A", "B", "C", "D"] for _ in questions]
+    correct_answers = ["A" for _ in questions]
+
+    with stub_widgets(quiz_game):
+        root = VirtualTimeRoot()
+        frame_clock = FrameClock(root, clock=root.clock)
+        threads_start = threading.active_count()
+        threads_peak = threads_start
+        timeouts = 0
+        clients_peak = 0
+        start = time.perf_counter()
+
+        for run in range(runs):
+            game = quiz_game.QuizGame(root, questions, options, correct_answers,
+                                      clock=frame_clock, time_source=root.clock)
+            clients_peak = max(clients_peak, len(frame_clock.clients))
+            while not game.game_over:
+                if run % 4 == 3 and game.current_question_index == 2:
+                    root.advance(5)
+                    break  # quit mid-countdown
+                step = game.current_question_index % 3
+                if step == 0:
+                    root.advance(quiz_game.QUESTION_SECONDS + 1)
+                    timeouts += game.time_remaining == 0 and not game.timer_running
+                else:
+                    root.advance(1)
+                    if step == 2:
+                        game.add_extra_time()
+                    game.select_answer(1)
+                game.next_question()
+                threads_peak = max(threads_peak, threading.active_count())
+            with contextlib.redirect_stdout(io.StringIO()):
+                game.return_to_menu()  # quiet the per-game cleanup log
+            root.advance(1)
+        elapsed = time.perf_counter() - start
+
+        stats = frame_clock.stats()
+        result = {
+            "runs": runs,
+            "seconds": elapsed,
+            "timeouts": timeouts,
+            "threads_start": threads_start,
+            "threads_peak": threads_peak,
+            "threads_end": threading.active_count(),
+            "clock_clients_peak": clients_peak,
+            "clock_clients_left": len(frame_clock.clients),
+            "clock_timers_left": stats["timers"],
+            "clock_callbacks": stats["callbacks"],
+            "after_pending_left": root.pending,
+        }
+        frame_clock.stop()
+        root.destroy()
+    return result
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    for key, value in stress_quiz_timers(runs).items():
+        print(f"{key:>18}: {value}")
@@ -0,0 +1,349 @@
+"""
+Snake Autopilot - games/snake_autopilot.py
+Pathfinding planner that steers a SnakeEngine toward the food
+
+The planner keeps a BFS distance field from the food over cells not under
+the body. It is rebuilt only when the food moves; on ordinary ticks it is
+patched for the two cells that changed (new head blocked, old tail freed).
+Moves follow the field downhill, and a bounded flood fill rejects moves
+into pockets too small to hold the snake.
+
+Boards above LARGE_BOARD_CELLS (e.g. the 500x500 Big Arena) skip the full
+field, whose rebuild would stall the Tk loop for a frame per food. There the
+BFS from the food is spread across ticks, at most SEARCH_STEP_CELLS cells per
+tick, and the snake heads straight for the food until its next cell has been
+reached; from then on it follows the search downhill.
+"""
+
+import heapq
+import time
+from array import array
+from collections import deque
+from typing import Dict, List, Optional
+
+from games.snake_bots import SnakeBot, register_bot, reachable_area, safe_moves
+from games.snake_engine import DIRECTIONS, SnakeEngine
+
+INF = float("inf")
+
+# Boards larger than this use the per-tick bounded search instead of a full field;
+# past about 40x40 a field rebuild can overrun a 16 ms frame
+LARGE_BOARD_CELLS = 1_600
+# Cells the bounded search settles per tick, at most
+SEARCH_STEP_CELLS = 2000
+
+
+class SnakePlanner:
+    """Incrementally maintained distance-to-food field plus move selection"""
+
+    def __init__(self, engine: SnakeEngine):
+        self.engine = engine
+        self.width = engine.grid_width
+        self.height = engine.grid_height
+        self.dist: List[float] = []
+        self.food = None
+        self.ticks = -1
+        self.length = 0
+        self.tail = None
+        self.large = self.width * self.height > LARGE_BOARD_CELLS
+        # Neighbour cells of every cell, built once so BFS steps are list lookups
+        # (small boards only: the table itself is O(board) to build)
+        self.adjacent = None if self.large else [
+            tuple(self._neighbors(c)) for c in range(self.width * self.height)
+        ]
+        # Large boards: distance per cell settled so far by the search from
+        # the food, -1 where it has not got to yet
+        self.reach = array("i")
+        self.queue: deque = deque()
+
+        # Counters for benchmarking / debugging
+        self.full_rebuilds = 0
+        self.incremental_updates = 0
+        self.searched_cells = 0
+
+    # ------------------------------------------------------------------ field
+
+    def _neighbors(self, cell: int):
+        x, y = cell % self.width, cell // self.width
+        if x > 0:
+            yield cell - 1
+        if x < self.width - 1:
+            yield cell + 1
+        if y > 0:
+            yield cell - self.width
+        if y < self.height - 1:
+            yield cell + self.width
+
+    def rebuild(self):
+        """BFS from the food over every free cell"""
+        engine = self.engine
+        self.dist = [INF] * (self.width * self.height)
+        self.food = engine.food
+        self.ticks = engine.ticks
+        self.length = len(engine.snake)
+        self.tail = engine.cell_index(engine.snake[-1])
+        self.full_rebuilds += 1
+        if engine.food is None:
+            return
+
+        occupied, adjacent = engine.occupied, self.adjacent
+        dist = self.dist
+        start = engine.cell_index(engine.food)
+        dist[start] = 0
+        frontier = [start]
+        level = 0
+        while frontier:
+            level += 1
+            next_frontier = []
+            for cell in frontier:
+                for n in adjacent[cell]:
+                    if dist[n] == INF and not occupied[n]:
+                        dist[n] = level
+                        next_frontier.append(n)
+            frontier = next_frontier
+
+    def _block(self, cell: int):
+        """Cell became body: raise distances of cells that relied on it"""
+        dist, occupied = self.dist, self.engine.occupied
+        old = dist[cell]
+        dist[cell] = INF
+        if old == INF:
+            return
+
+        # Level-order sweep: a cell is affected if no unaffected neighbour
+        # one step closer to the food still supports its distance
+        affected = set()
+        frontier = deque(n for n in self.adjacent[cell] if dist[n] == old + 1)
+        while frontier:
+            v = frontier.popleft()
+            if v in affected or dist[v] == INF:
+                continue
+            d = dist[v]
+            if any(dist[u] == d - 1 and u not in affected and not occupied[u]
+                   for u in self.adjacent[v]):
+                continue
+            affected.add(v)
+            frontier.extend(w for w in self.adjacent[v] if dist[w] == d + 1)
+
+        if not affected:
+            return
+        for v in affected:
+            dist[v] = INF
+
+        # Re-settle the affected region from its unaffected boundary
+        heap = []
+        for v in affected:
+            best = min((dist[u] for u in self.adjacent[v] if not occupied[u]), default=INF) + 1
+            if best < INF:
+                heap.append((best, v))
+        heapq.heapify(heap)
+        while heap:
+            d, v = heapq.heappop(heap)
+            if d >= dist[v]:
+                continue
+            dist[v] = d
+            for w in self.adjacent[v]:
+                if w in affected and d + 1 < dist[w]:
+                    heapq.heappush(heap, (d + 1, w))
+
+    def _unblock(self, cell: int):
+        """Cell was freed: it can only shorten paths, so relax outward from it"""
+        dist, occupied = self.dist, self.engine.occupied
+        best = min((dist[u] for u in self.adjacent[cell] if not occupied[u]), default=INF)
+        if best == INF:
+            return
+        dist[cell] = best + 1
+        queue = deque([cell])
+        while queue:
+            v = queue.popleft()
+            d = dist[v] + 1
+            for w in self.adjacent[v]:
+                if d < dist[w] and not occupied[w]:
+                    dist[w] = d
+                    queue.append(w)
+
+    def sync(self):
+        """Bring the field up to date with the engine"""
+        engine = self.engine
+        if engine.ticks == self.ticks and engine.food == self.food:
+            return
+        if (engine.food != self.food or engine.ticks != self.ticks + 1
+                or len(engine.snake) != self.length):
+            self.rebuild()
+            return
+
+        self._block(engine.cell_index(engine.snake[0]))
+        self._unblock(self.tail)
+        self.tail = engine.cell_index(engine.snake[-1])
+        self.ticks = engine.ticks
+        self.incremental_updates += 1
+
+    # ------------------------------------------------------------------ moves
+
+    def _start_search(self):
+        engine = self.engine
+        self.food = engine.food
+        # Filled in C, so a new search costs well under a millisecond even at 500x500
+        self.reach = array("i", [-1]) * (self.width * self.height)
+        self.queue = deque()
+        self.full_rebuilds += 1
+        if engine.food is not None:
+            start = engine.cell_index(engine.food)
+            self.reach[start] = 0
+            self.queue.append(start)
+
+    def _search(self, goals, budget: int):
+        """Continue the BFS from the food for up to budget cells, stopping once a goal is reached"""
+        reach, queue, occupied = self.reach, self.queue, self.engine.occupied
+        width, last = self.width, self.width * self.height
+        while queue and budget > 0:
+            cell = queue.popleft()
+            budget -= 1
+            self.searched_cells += 1
+            d = reach[cell] + 1
+            x = cell % width
+            found = False
+            for n in (cell - 1 if x > 0 else -1, cell + 1 if x < width - 1 else -1,
+                      cell - width, cell + width):
+                if 0 <= n < last and reach[n] < 0 and not occupied[n]:
+                    reach[n] = d
+                    queue.append(n)
+                    if n in goals:
+                        found = True
+            if found:
+                return
+
+    def _choose_large(self) -> Optional[str]:
+        engine = self.engine
+        # A reset rewinds ticks; the old search saw the old body
+        if engine.food != self.food or engine.ticks < self.ticks:
+            self._start_search()
+        self.ticks = engine.ticks
+        moves = safe_moves(engine)
+        if not moves:
+            return None
+
+        hx, hy = engine.snake[0]
+        length = len(engine.snake)
+        width = self.width
+        targets = {m: (hy + DIRECTIONS[m][1]) * width + hx + DIRECTIONS[m][0] for m in moves}
+        reach = self.reach
+        if all(reach[cell] < 0 for cell in targets.values()):
+            self._search(set(targets.values()), SEARCH_STEP_CELLS)
+
+        # Settled cells by search distance, the rest straight toward the food
+        fx, fy = engine.food if engine.food is not None else (hx, hy)
+
+        def rank(m):
+            cell = targets[m]
+            return reach[cell] if reach[cell] >= 0 else INF, abs(cell % width - fx) + abs(cell // width - fy)
+
+        for move in sorted(moves, key=rank):
+            cell = targets[move]
+            if reachable_area(engine, (cell % width, cell // width), length) >= length:
+                return move
+        return max(
+            moves,
+            key=lambda m: reachable_area(
+                engine, (targets[m] % width, targets[m] // width), length * 2
+            ),
+        )
+
+    def choose(self) -> Optional[str]:
+        """Next direction, or None when every move is fatal"""
+        if self.large:
+            return self._choose_large()
+        self.sync()
+        engine = self.engine
+        moves = safe_moves(engine)
+        if not moves:
+            return None
+
+        hx, hy = engine.snake[0]
+        length = len(engine.snake)
+        targets = {m: (hy + DIRECTIONS[m][1]) * self.width + hx + DIRECTIONS[m][0] for m in moves}
+
+        # Downhill toward the food, skipping moves into pockets smaller than the body
+        for move in sorted(moves, key=lambda m: self.dist[targets[m]]):
+            if self.dist[targets[move]] == INF:
+                break
+            cell = targets[move]
+            if reachable_area(engine, (cell % self.width, cell // self.width), length) >= length:
+                return move
+
+        # No safe path: keep as much room as possible
+        return max(
+            moves,
+            key=lambda m: reachable_area(
+                engine, (targets[m] % self.width, targets[m] // self.width), length * 2
+            ),
+        )
+
+
+class AutopilotBot(SnakeBot):
+    """Tournament wrapper around SnakePlanner"""
+
+    name = "autopilot"
+
+    def reset(self, engine):
+        self.planner = SnakePlanner(engine)
+
+    def choose(self, engine):
+        if getattr(self, "planner", None) is None or self.planner.engine is not engine:
+            self.planner = SnakePlanner(engine)
+        return self.planner.choose()
+
+
+register_bot(AutopilotBot.name, AutopilotBot)
+
+
+def benchmark_planner(sizes=((25, 20), (40, 40), (100, 100), (200, 200), (500, 500)), ticks: int = 5000,
+                      seed: int = 0, frame_ms: float = 16.0) -> List[Dict[str, float]]:
+    """
+    Microseconds the planner spends per tick while it plays, per board size,
+    plus its setup time and how many ticks took longer than a frame_ms frame.
+    Games restart on death so every size runs the full tick count. "path" is
+    "field" for the incremental field and "bounded" for the bounded search
+    used above LARGE_BOARD_CELLS (40x40 is the largest field-path default).
+    """
+    results = []
+    for width, height in sizes:
+        engine = SnakeEngine(width, height, seed=seed)
+        start = time.perf_counter()
+        planner = SnakePlanner(engine)
+        setup_ms = (time.perf_counter() - start) * 1000
+        samples = []
+        deaths = 0
+        for _ in range(ticks):
+            start = time.perf_counter()
+            move = planner.choose()
+            samples.append((time.perf_counter() - start) * 1e6)
+            if not engine.step(move)["alive"]:
+                deaths += 1
+                engine.reset(seed + deaths)
+        samples.sort()
+        results.append({
+            "grid": f"{width}x{height}",
+            "path": "bounded" if planner.large else "field",
+            "mean_us": sum(samples) / len(samples),
+            "p50_us": samples[len(samples) // 2],
+            "p99_us": samples[int(len(samples) * 0.99)],
+            "max_us": samples[-1],
+            "over_frame": sum(1 for sample in samples if sample > frame_ms * 1000),
+            "setup_ms": setup_ms,
+            "full_rebuilds": planner.full_rebuilds,
+            "incremental_updates": planner.incremental_updates,
+            "deaths": deaths,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'grid':>8} {'path':>8} {'mean':>9} {'p50':>9} {'p99':>9} {'max':>10} {'>16ms':>6} {'setup':>9}"
+          f"  rebuilds/incremental")
+    for row in benchmark_planner():
+        print(
+            f"{row['grid']:>8} {row['path']:>8} {row['mean_us']:>8.1f}u {row['p50_us']:>8.1f}u "
+            f"{row['p99_us']:>8.1f}u {row['max_us']:>9.1f}u {row['over_frame']:>6} "
+            f"{row['setup_ms']:>7.2f}ms  {row['full_rebuilds']}/{row['incremental_updates']}"
+        )
@@ -0,0 +1,435 @@
+"""
+Snake Batch Environment - games/snake_batch.py
+Runs N snake games in lockstep on NumPy arrays, following SnakeEngine rules
+
+Requires numpy. Each game keeps its state in one row of the shared arrays:
+
+    board           int16 (N, H*W)   1 where a body segment sits, else 0
+    body            int32 (N, H*W)   ring buffer of body cells, head at head_ptr
+    head_ptr/length int32 (N,)
+    food            int32 (N,)       cell index, -1 when the board is full
+    pu_cell/pu_type/pu_timer (N, MAX_POWER_UPS), pu_cell -1 for an empty slot
+    speed_boost/double_score int16 (N,) remaining effect ticks
+
+Cells are indexed y * W + x, the same as SnakeEngine.occupied.
+"""
+
+import random
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from games.snake_engine import (
+    DIRECTIONS,
+    DOUBLE_SCORE_TICKS,
+    MAX_POWER_UPS,
+    MIN_SPEED,
+    OPPOSITE_DIRECTIONS,
+    POWER_UP_CHANCE,
+    POWER_UP_LIFETIME,
+    POWER_UP_TYPES,
+    SPEED_BOOST_TICKS,
+    START_SPEED,
+    SnakeEngine,
+)
+
+# Action codes used by step(); -1 keeps the current heading
+ACTIONS = ["Up", "Down", "Left", "Right"]
+ACTION_CODES = {name: code for code, name in enumerate(ACTIONS)}
+
+EFFECT_CODES = {"speed": 0, "double_score": 1, "extra_food": 2}
+
+
+class SnakeBatchEnv:
+    """N independent snake games advanced together by step(actions)"""
+
+    def __init__(
+        self,
+        num_envs: int,
+        grid_width: int = 25,
+        grid_height: int = 20,
+        seed: Optional[int] = None,
+        power_up_types: Optional[Dict] = None,
+        record_spawns: bool = False,
+    ):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("SnakeBatchEnv requires numpy (pip install numpy)")
+
+        self.num_envs = num_envs
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.num_cells = grid_width * grid_height
+        self.rng = np.random.default_rng(seed)
+
+        types = power_up_types or POWER_UP_TYPES
+        self.power_up_names = list(types.keys())
+        self.pu_points = np.array([types[n]["points"] for n in self.power_up_names], dtype=np.int32)
+        self.pu_effects = np.array(
+            [EFFECT_CODES[types[n]["effect"]] for n in self.power_up_names], dtype=np.int8
+        )
+
+        self.dx = np.array([DIRECTIONS[a][0] for a in ACTIONS], dtype=np.int32)
+        self.dy = np.array([DIRECTIONS[a][1] for a in ACTIONS], dtype=np.int32)
+        self.opposite = np.array(
+            [ACTION_CODES[OPPOSITE_DIRECTIONS[a]] for a in ACTIONS], dtype=np.int8
+        )
+
+        n, cells = num_envs, self.num_cells
+        self.board = np.zeros((n, cells), dtype=np.int16)
+        self.body = np.zeros((n, cells), dtype=np.int32)
+        self.head_ptr = np.zeros(n, dtype=np.int32)
+        self.length = np.zeros(n, dtype=np.int32)
+        self.direction = np.zeros(n, dtype=np.int8)
+        self.food = np.full(n, -1, dtype=np.int32)
+        self.pu_cell = np.full((n, MAX_POWER_UPS), -1, dtype=np.int32)
+        self.pu_type = np.zeros((n, MAX_POWER_UPS), dtype=np.int8)
+        self.pu_timer = np.zeros((n, MAX_POWER_UPS), dtype=np.int16)
+        self.speed_boost = np.zeros(n, dtype=np.int16)
+        self.double_score = np.zeros(n, dtype=np.int16)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.level = np.zeros(n, dtype=np.int32)
+        self.speed = np.zeros(n, dtype=np.int32)
+        self.ticks = np.zeros(n, dtype=np.int32)
+        self.alive = np.zeros(n, dtype=bool)
+        self.step_count = 0
+
+        # (step_count, game, "food"|"power_up", cell, type index) for parity checks
+        self.record_spawns = record_spawns
+        self.spawn_log: List[tuple] = []
+
+        self.reset()
+
+    # ------------------------------------------------------------------ state
+
+    def reset(self, mask=None):
+        """Reset every game, or only those where mask is True"""
+        games = np.arange(self.num_envs) if mask is None else np.flatnonzero(mask)
+        if games.size == 0:
+            return
+
+        cx, cy = self.grid_width // 2, self.grid_height // 2
+        start = np.array([cy * self.grid_width + cx - 2 + i for i in range(3)], dtype=np.int32)
+
+        self.board[games] = 0
+        self.board[games[:, None], start[None, :]] = 1
+        self.body[games, :3] = start  # tail first, head at slot 2
+        self.head_ptr[games] = 2
+        self.length[games] = 3
+        self.direction[games] = ACTION_CODES["Right"]
+        self.pu_cell[games] = -1
+        self.pu_timer[games] = 0
+        self.speed_boost[games] = 0
+        self.double_score[games] = 0
+        self.score[games] = 0
+        self.level[games] = 1
+        self.speed[games] = START_SPEED
+        self.ticks[games] = 0
+        self.alive[games] = True
+        self.food[games] = self._sample_free(games, self.board[games] == 0)
+        self._log_spawns("food", games, self.food[games])
+
+    def heads(self):
+        return self.body[np.arange(self.num_envs), self.head_ptr]
+
+    def tick_intervals(self):
+        """Per-game milliseconds until the next tick, as SnakeEngine.tick_interval()"""
+        boosted = np.maximum(MIN_SPEED, self.speed // 2)
+        return np.where(self.speed_boost > 0, boosted, self.speed)
+
+    def body_cells(self, game: int) -> List[int]:
+        """Body of one game as cell indices, head first"""
+        cap = self.num_cells
+        return [
+            int(self.body[game, (self.head_ptr[game] - i) % cap])
+            for i in range(self.length[game])
+        ]
+
+    # ------------------------------------------------------------------ helpers
+
+    def _sample_free(self, games, free):
+        """Uniform k-th free cell per row of the free mask, -1 when a row has none"""
+        if games.size == 0:
+            return np.empty(0, dtype=np.int32)
+        cumulative = np.cumsum(free, axis=1, dtype=np.int32)
+        counts = cumulative[:, -1]
+        k = (self.rng.random(games.size) * counts).astype(np.int32)
+        cells = np.argmax(cumulative > k[:, None], axis=1).astype(np.int32)
+        return np.where(counts > 0, cells, -1)
+
+    def _log_spawns(self, kind, games, cells, types=None):
+        if not self.record_spawns:
+            return
+        for i, game in enumerate(games):
+            if cells[i] >= 0:
+                ptype = None if types is None else int(types[i])
+                self.spawn_log.append((self.step_count, int(game), kind, int(cells[i]), ptype))
+
+    # ------------------------------------------------------------------ step
+
+    def step(self, actions) -> Dict[str, "np.ndarray"]:
+        """
+        Advance every live game by one tick.
+
+        actions: int array of shape (N,), codes from ACTIONS or -1 to go
+        straight. Dead games are left untouched until reset().
+        Returns per-game boolean arrays: alive, died, ate_food, power_up.
+        """
+        self.step_count += 1
+        n, width, cap = self.num_envs, self.grid_width, self.num_cells
+        rows = np.arange(n)
+        actions = np.asarray(actions, dtype=np.int8)
+        was_alive = self.alive.copy()
+
+        # Heading: ignore reversals and "keep going" (-1)
+        turn = was_alive & (actions >= 0) & (actions != self.opposite[self.direction])
+        self.direction = np.where(turn, actions, self.direction).astype(np.int8)
+
+        head = self.body[rows, self.head_ptr]
+        nx = head % width + self.dx[self.direction]
+        ny = head // width + self.dy[self.direction]
+        in_bounds = (nx >= 0) & (nx < width) & (ny >= 0) & (ny < self.grid_height)
+        new_head = np.where(in_bounds, ny * width + nx, 0)
+
+        # The tail has not moved yet, so it still counts as body
+        hit_body = self.board[rows, new_head] != 0
+        died = was_alive & (~in_bounds | hit_body)
+        self.alive &= ~died
+        moving = np.flatnonzero(self.alive)
+        new_head = new_head[moving]
+
+        self.ticks[moving] += 1
+        self.head_ptr[moving] = (self.head_ptr[moving] + 1) % cap
+        self.body[moving, self.head_ptr[moving]] = new_head
+        self.board[moving, new_head] = 1
+
+        multiplier = np.where(self.double_score[moving] > 0, 2, 1).astype(np.int32)
+
+        # Food
+        ate = new_head == self.food[moving]
+        eaters = moving[ate]
+        self.score[eaters] += 10 * multiplier[ate]
+        new_food = self._sample_free(eaters, self.board[eaters] == 0)
+        self.food[eaters] = new_food
+        self._log_spawns("food", eaters, new_food)
+        new_level = self.score[eaters] // 100 + 1
+        level_up = new_level > self.level[eaters]
+        leveled = eaters[level_up]
+        self.level[leveled] = new_level[level_up]
+        self.speed[leveled] = np.maximum(MIN_SPEED, self.speed[leveled] - 10)
+
+        # Power-up pickup; cells are unique per game so at most one slot matches
+        collected = np.zeros(n, dtype=bool)
+        for slot in range(MAX_POWER_UPS):
+            hit = self.pu_cell[moving, slot] == new_head
+            if not hit.any():
+                continue
+            games = moving[hit]
+            ptype = self.pu_type[games, slot]
+            mult = multiplier[hit]
+            effect = self.pu_effects[ptype]
+            self.score[games] += self.pu_points[ptype] * mult + np.where(effect == 2, 20 * mult, 0)
+            self.speed_boost[games] = np.where(effect == 0, SPEED_BOOST_TICKS, self.speed_boost[games])
+            self.double_score[games] = np.where(effect == 1, DOUBLE_SCORE_TICKS, self.double_score[games])
+            self.pu_cell[games, slot] = -1
+            collected[games] = True
+
+        # Tail follows unless the snake just grew
+        grown = moving[ate]
+        self.length[grown] += 1
+        shrinking = moving[~ate]
+        tail = self.body[shrinking, (self.head_ptr[shrinking] - self.length[shrinking]) % cap]
+        self.board[shrinking, tail] = 0
+
+        # Power-up lifetimes: drop expired, then count the rest down
+        active = self.pu_cell[moving] >= 0
+        expired = active & (self.pu_timer[moving] <= 0)
+        pu_cell = self.pu_cell[moving]
+        pu_cell[expired] = -1
+        self.pu_cell[moving] = pu_cell
+        pu_timer = self.pu_timer[moving]
+        pu_timer[active & ~expired] -= 1
+        self.pu_timer[moving] = pu_timer
+
+        # Effect durations
+        self.speed_boost[moving] -= (self.speed_boost[moving] > 0).astype(np.int16)
+        self.double_score[moving] -= (self.double_score[moving] > 0).astype(np.int16)
+
+        # Power-up spawn
+        pu_cell = self.pu_cell[moving]
+        count = (pu_cell >= 0).sum(axis=1)
+        spawn = (self.rng.random(moving.size) < POWER_UP_CHANCE) & (count < MAX_POWER_UPS)
+        spawners = moving[spawn]
+        if spawners.size:
+            free = self.board[spawners] == 0
+            sub = np.arange(spawners.size)
+            food = self.food[spawners]
+            free[sub[food >= 0], food[food >= 0]] = False
+            for slot in range(MAX_POWER_UPS):
+                cells = self.pu_cell[spawners, slot]
+                free[sub[cells >= 0], cells[cells >= 0]] = False
+            cells = self._sample_free(spawners, free)
+            types = self.rng.integers(0, len(self.power_up_names), spawners.size).astype(np.int8)
+            slot = np.argmax(self.pu_cell[spawners] < 0, axis=1)
+            placed = cells >= 0
+            games, slot = spawners[placed], slot[placed]
+            self.pu_cell[games, slot] = cells[placed]
+            self.pu_type[games, slot] = types[placed]
+            self.pu_timer[games, slot] = POWER_UP_LIFETIME
+            self._log_spawns("power_up", games, cells[placed], types[placed])
+
+        ate_food = np.zeros(n, dtype=bool)
+        ate_food[eaters] = True
+        return {
+            "alive": self.alive.copy(),
+            "died": died,
+            "ate_food": ate_food,
+            "power_up": collected,
+        }
+
+
+class _ScriptedEngine(SnakeEngine):
+    """SnakeEngine whose food and power-up spawns are fed in from a batch run"""
+
+    def __init__(self, grid_width, grid_height, power_up_names):
+        self.power_up_names = power_up_names
+        self.scripted = []  # spawns for the tick about to run
+        super().__init__(grid_width, grid_height, rng=random.Random(0))
+
+    def _take(self, kind):
+        for i, spawn in enumerate(self.scripted):
+            if spawn[2] == kind:
+                return self.scripted.pop(i)
+        return None
+
+    def generate_food(self):
+        spawn = self._take("food")
+        if spawn is None:
+            return None
+        return (spawn[3] % self.grid_width, spawn[3] // self.grid_width)
+
+    def generate_power_up(self):
+        spawn = self._take("power_up")
+        if spawn is not None:
+            self.add_power_up(
+                (spawn[3] % self.grid_width, spawn[3] // self.grid_width),
+                self.power_up_names[spawn[4]],
+            )
+
+
+def check_parity(num_envs: int = 64, ticks: int = 3000, grid_width: int = 12,
+                 grid_height: int = 10, seed: int = 0) -> int:
+    """
+    Step SnakeBatchEnv and one SnakeEngine per game in lockstep with the same
+    actions and spawns, and compare the full state after every tick. Actions
+    come from a cautious random policy so games last long enough to eat,
+    level up and collect power-ups. Raises AssertionError on the first
+    mismatch; returns the number of game-ticks compared.
+    """
+    env = SnakeBatchEnv(num_envs, grid_width, grid_height, seed=seed, record_spawns=True)
+    policy_rng = random.Random(seed)
+    spawns = defaultdict(list)
+
+    def drain_spawns():
+        for spawn in env.spawn_log:
+            spawns[(spawn[0], spawn[1])].append(spawn)
+        env.spawn_log.clear()
+
+    drain_spawns()
+    engines = []
+    for game in range(num_envs):
+        engine = _ScriptedEngine(grid_width, grid_height, env.power_up_names)
+        engine.scripted = spawns.pop((0, game), [])
+        engine.reset()
+        engines.append(engine)
+
+    def choose(engine):
+        options = []
+        hx, hy = engine.snake[0]
+        for name in ACTIONS:
+            if name == OPPOSITE_DIRECTIONS[engine.direction]:
+                continue
+            dx, dy = DIRECTIONS[name]
+            x, y = hx + dx, hy + dy
+            if 0 <= x < grid_width and 0 <= y < grid_height and not engine.is_occupied(x, y):
+                options.append(name)
+        if not options or policy_rng.random() < 0.02:
+            return policy_rng.choice(ACTIONS + [None])
+        if engine.food is not None and policy_rng.random() < 0.6:
+            fx, fy = engine.food
+            options.sort(key=lambda n: abs(hx + DIRECTIONS[n][0] - fx) + abs(hy + DIRECTIONS[n][1] - fy))
+            return options[0]
+        return policy_rng.choice(options)
+
+    compared = 0
+    for _ in range(ticks):
+        names = [choose(engine) for engine in engines]
+        codes = np.array([-1 if a is None else ACTION_CODES[a] for a in names], dtype=np.int8)
+        result = env.step(codes)
+        drain_spawns()
+
+        for game, engine in enumerate(engines):
+            engine.scripted = spawns.pop((env.step_count, game), [])
+            step = engine.step(names[game])
+            compared += 1
+            where = f"game {game} at step {env.step_count}"
+            assert step["alive"] == bool(result["alive"][game]), f"alive differs, {where}"
+            assert step["ate_food"] == bool(result["ate_food"][game]), f"ate_food differs, {where}"
+            assert (step["power_up"] is not None) == bool(result["power_up"][game]), f"power_up differs, {where}"
+            assert engine.score == env.score[game], f"score differs, {where}"
+            assert engine.level == env.level[game], f"level differs, {where}"
+            assert engine.speed == env.speed[game], f"speed differs, {where}"
+            assert engine.ticks == env.ticks[game], f"ticks differs, {where}"
+            assert engine.direction == ACTIONS[env.direction[game]], f"direction differs, {where}"
+            assert engine.active_effects["speed_boost"] == env.speed_boost[game], f"speed_boost differs, {where}"
+            assert engine.active_effects["double_score"] == env.double_score[game], f"double_score differs, {where}"
+            body = [engine.cell_index(pos) for pos in engine.snake]
+            assert body == env.body_cells(game), f"body differs, {where}"
+            assert bytes(engine.occupied) == env.board[game].astype(np.uint8).tobytes(), f"board differs, {where}"
+            food = -1 if engine.food is None else engine.cell_index(engine.food)
+            assert food == env.food[game], f"food differs, {where}"
+            scalar_pus = sorted(
+                (engine.cell_index(pu["pos"]), env.power_up_names.index(pu["type"]),
+                 engine.power_up_timer(pu))
+                for pu in engine.power_ups.values()
+            )
+            batch_pus = sorted(
+                (int(env.pu_cell[game, s]), int(env.pu_type[game, s]), int(env.pu_timer[game, s]))
+                for s in range(MAX_POWER_UPS) if env.pu_cell[game, s] >= 0
+            )
+            assert scalar_pus == batch_pus, f"power-ups differ, {where}"
+            assert env.tick_intervals()[game] == engine.tick_interval(), f"interval differs, {where}"
+        assert not spawns, "unconsumed spawns left over"
+
+        dead = ~env.alive
+        if dead.any():
+            env.reset(dead)
+            drain_spawns()
+            for game in np.flatnonzero(dead):
+                engines[game].scripted = spawns.pop((env.step_count, int(game)), [])
+                engines[game].reset()
+    return compared
+
+
+def benchmark_batch(num_envs: int = 4096, ticks: int = 500, grid_width: int = 25,
+                    grid_height: int = 20, seed: int = 0) -> float:
+    """Game-ticks per second for random play with automatic resets"""
+    import time
+
+    env = SnakeBatchEnv(num_envs, grid_width, grid_height, seed=seed)
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        env.step(rng.integers(-1, 4, num_envs))
+        env.reset(~env.alive)
+    return num_envs * ticks / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(f"parity: {check_parity():,} game-ticks matched SnakeEngine")
+    print(f"batch:  {benchmark_batch():,.0f} game-ticks/sec")
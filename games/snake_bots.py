@@ -0,0 +1,169 @@
+"""
+Snake Bots - games/snake_bots.py
+Pluggable bot policies that drive a headless SnakeEngine
+"""
+
+import importlib
+import random
+from collections import deque
+from typing import Dict, List, Optional
+
+from games.snake_engine import DIRECTIONS, OPPOSITE_DIRECTIONS, SnakeEngine
+
+
+def safe_moves(engine: SnakeEngine) -> List[str]:
+    """Directions that do not reverse or hit a wall/body on the next tick"""
+    moves = []
+    hx, hy = engine.snake[0]
+    for name, (dx, dy) in DIRECTIONS.items():
+        if name == OPPOSITE_DIRECTIONS[engine.direction]:
+            continue
+        x, y = hx + dx, hy + dy
+        if 0 <= x < engine.grid_width and 0 <= y < engine.grid_height and not engine.is_occupied(x, y):
+            moves.append(name)
+    return moves
+
+
+def reachable_area(engine: SnakeEngine, start, limit: Optional[int] = None) -> int:
+    """Count free cells reachable from start, stopping early once limit is reached"""
+    width, height = engine.grid_width, engine.grid_height
+    occupied = engine.occupied
+    start_index = start[1] * width + start[0]
+    seen = {start_index}
+    queue = deque([start_index])
+    while queue:
+        if limit is not None and len(seen) >= limit:
+            break
+        cell = queue.popleft()
+        x, y = cell % width, cell // width
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < width and 0 <= ny < height:
+                index = ny * width + nx
+                if index not in seen and not occupied[index]:
+                    seen.add(index)
+                    queue.append(index)
+    return len(seen)
+
+
+class SnakeBot:
+    """Base policy: choose(engine) returns a direction name or None to go straight"""
+
+    name = "base"
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+
+    def reset(self, engine: SnakeEngine):
+        """Called once before each game"""
+
+    def choose(self, engine: SnakeEngine) -> Optional[str]:
+        raise NotImplementedError
+
+
+class RandomBot(SnakeBot):
+    """Random safe move, so games last long enough to be interesting"""
+
+    name = "random"
+
+    def choose(self, engine):
+        moves = safe_moves(engine)
+        return self.rng.choice(moves) if moves else None
+
+
+class GreedyBot(SnakeBot):
+    """Safe move that minimises Manhattan distance to the food"""
+
+    name = "greedy"
+
+    def choose(self, engine):
+        moves = safe_moves(engine)
+        if not moves:
+            return None
+        if engine.food is None:
+            return moves[0]
+        hx, hy = engine.snake[0]
+        fx, fy = engine.food
+        return min(
+            moves,
+            key=lambda m: abs(hx + DIRECTIONS[m][0] - fx) + abs(hy + DIRECTIONS[m][1] - fy),
+        )
+
+
+class BfsBot(SnakeBot):
+    """
+    Shortest path to the food over free cells; when the food is unreachable
+    it takes the safe move with the most room.
+    """
+
+    name = "bfs"
+
+    def choose(self, engine):
+        moves = safe_moves(engine)
+        if not moves:
+            return None
+
+        first = self.first_step_to_food(engine)
+        if first is not None:
+            return first
+
+        hx, hy = engine.snake[0]
+        return max(
+            moves,
+            key=lambda m: reachable_area(engine, (hx + DIRECTIONS[m][0], hy + DIRECTIONS[m][1])),
+        )
+
+    def first_step_to_food(self, engine) -> Optional[str]:
+        if engine.food is None:
+            return None
+        width, height = engine.grid_width, engine.grid_height
+        occupied = engine.occupied
+        hx, hy = engine.snake[0]
+        target = engine.cell_index(engine.food)
+
+        # BFS storing the first move that reached each cell
+        first_move: Dict[int, str] = {}
+        queue = deque()
+        for name in safe_moves(engine):
+            dx, dy = DIRECTIONS[name]
+            index = (hy + dy) * width + hx + dx
+            first_move[index] = name
+            queue.append(index)
+        while queue:
+            cell = queue.popleft()
+            if cell == target:
+                return first_move[cell]
+            x, y = cell % width, cell // width
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < width and 0 <= ny < height:
+                    index = ny * width + nx
+                    if index not in first_move and not occupied[index]:
+                        first_move[index] = first_move[cell]
+                        queue.append(index)
+        return None
+
+
+# Bot registry for the tournament runner, extend with register_bot()
+BOT_POLICIES = {
+    RandomBot.name: RandomBot,
+    GreedyBot.name: GreedyBot,
+    BfsBot.name: BfsBot,
+}
+
+
+def register_bot(name: str, bot_class):
+    """Make a bot class available to the tournament runner under name"""
+    BOT_POLICIES[name] = bot_class
+
+
+def load_bot(spec: str, rng=None) -> SnakeBot:
+    """
+    Create a bot from a registry name ("greedy") or a plugin path
+    ("package.module:ClassName").
+    """
+    if spec in BOT_POLICIES:
+        return BOT_POLICIES[spec](rng=rng)
+    if ":" in spec:
+        module_name, class_name = spec.split(":", 1)
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)(rng=rng)
+    raise ValueError(f"Unknown bot policy '{spec}', available: {', '.join(sorted(BOT_POLICIES))}")
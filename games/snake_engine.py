@@ -0,0 +1,437 @@
+"""
+Snake Engine - games/snake_engine.py
+Headless snake rules with no Tk dependency, wrapped by SnakeGame for display
+"""
+
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+# Direction name -> (dx, dy)
+DIRECTIONS = {
+    "Up": (0, -1),
+    "Down": (0, 1),
+    "Left": (-1, 0),
+    "Right": (1, 0),
+}
+
+OPPOSITE_DIRECTIONS = {
+    "Up": "Down",
+    "Down": "Up",
+    "Left": "Right",
+    "Right": "Left",
+}
+
+# Default power-up table, copied per engine so it can be tuned per game
+POWER_UP_TYPES = {
+    "speed_boost": {"color": "#00ffff", "points": 20, "effect": "speed"},
+    "score_multiplier": {
+        "color": "#ff00ff",
+        "points": 30,
+        "effect": "double_score",
+    },
+    "extra_food": {"color": "#ffff00", "points": 15, "effect": "extra_food"},
+}
+
+START_SPEED = 150  # milliseconds between moves
+MIN_SPEED = 50
+POWER_UP_CHANCE = 0.15
+MAX_POWER_UPS = 2
+POWER_UP_LIFETIME = 200  # Disappears after 200 game ticks
+SPEED_BOOST_TICKS = 100
+DOUBLE_SCORE_TICKS = 150
+EFFECT_NAMES = ("speed_boost", "double_score")
+
+
+class FreeCellSet:
+    """
+    Indexed set of cell indices with O(1) add, remove and uniform sampling.
+
+    Cells live in a dense list; position maps a cell to its slot (or -1) so
+    removal can swap the last entry into the hole.
+    """
+
+    def __init__(self, size: int):
+        self.cells = list(range(size))
+        self.position = list(range(size))
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __contains__(self, cell: int) -> bool:
+        return self.position[cell] >= 0
+
+    def add(self, cell: int):
+        if self.position[cell] >= 0:
+            return
+        self.position[cell] = len(self.cells)
+        self.cells.append(cell)
+
+    def remove(self, cell: int):
+        slot = self.position[cell]
+        if slot < 0:
+            return
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[slot] = last
+            self.position[last] = slot
+        self.position[cell] = -1
+
+    def sample(self, rng, exclude: Iterable[int] = ()) -> Optional[int]:
+        """Pick a uniformly random member not in exclude, or None if there is none"""
+        end = len(self.cells)
+        for cell in exclude:
+            slot = self.position[cell]
+            if 0 <= slot < end:
+                # Park excluded cells past the sampling window
+                end -= 1
+                other = self.cells[end]
+                self.cells[slot], self.cells[end] = other, cell
+                self.position[other], self.position[cell] = slot, end
+        if end <= 0:
+            return None
+        return self.cells[rng.randrange(end)]
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel over integer ticks.
+
+    Level 0 has one slot per tick, each higher level one slot per full turn
+    of the level below. schedule() is O(1); advance() touches only the slot
+    due this tick, plus a cascade of one higher-level slot every `slots`
+    ticks, so cost does not grow with the number of pending timers.
+    Deadlines past the top level wait in an overflow list.
+
+    There is no cancel: callers check that a fired entry is still current.
+    """
+
+    def __init__(self, slots: int = 64, levels: int = 3):
+        self.slots = slots
+        self.levels = levels
+        self.now = 0
+        self.wheels = [[[] for _ in range(slots)] for _ in range(levels)]
+        self.overflow: List[Tuple[int, object]] = []
+
+    def schedule(self, deadline: int, item):
+        """Fire item on the advance() that reaches deadline (next one if already due)"""
+        self._place(max(deadline, self.now + 1), item)
+
+    def _place(self, deadline: int, item):
+        delta = deadline - self.now
+        span = 1
+        for wheel in self.wheels:
+            if delta < span * self.slots:
+                wheel[(deadline // span) % self.slots].append((deadline, item))
+                return
+            span *= self.slots
+        self.overflow.append((deadline, item))
+
+    def advance(self) -> List:
+        """Move one tick forward and return the items due now"""
+        self.now += 1
+        now = self.now
+        if now % self.slots == 0:
+            # Cascade from the top so re-scheduled entries land in the right level
+            span = self.slots ** self.levels
+            if now % span == 0 and self.overflow:
+                pending, self.overflow = self.overflow, []
+                for deadline, item in pending:
+                    self._place(deadline, item)
+            for level in range(self.levels - 1, 0, -1):
+                span = self.slots ** level
+                if now % span == 0:
+                    slot = self.wheels[level][(now // span) % self.slots]
+                    pending = slot[:]
+                    slot.clear()
+                    for deadline, item in pending:
+                        self._place(deadline, item)
+
+        slot = self.wheels[0][now % self.slots]
+        if not slot:
+            return []
+        due = [item for deadline, item in slot]
+        slot.clear()
+        return due
+
+
+class EffectTimers:
+    """
+    active_effects as a mapping of effect name -> ticks remaining.
+
+    Only the end tick is stored, so nothing is decremented per tick; the
+    remaining time is read off the engine's timer wheel clock. Setting a
+    duration schedules the end on the wheel, which drops the effect from
+    `running` when it runs out.
+    """
+
+    def __init__(self, wheel: TimerWheel, names: Iterable[str] = EFFECT_NAMES):
+        self.wheel = wheel
+        self.ends = {name: 0 for name in names}
+        self.running = set()
+
+    def __getitem__(self, name: str) -> int:
+        return max(0, self.ends[name] - self.wheel.now)
+
+    def __setitem__(self, name: str, ticks: int):
+        end = self.wheel.now + ticks
+        self.ends[name] = end
+        if ticks > 0:
+            self.running.add(name)
+            self.wheel.schedule(end, ("effect", name, end))
+        else:
+            self.running.discard(name)
+
+    def expire(self, name: str, end: int):
+        """Wheel callback; ignored if the effect was refreshed since"""
+        if self.ends.get(name) == end:
+            self.running.discard(name)
+
+    def __contains__(self, name) -> bool:
+        return name in self.ends
+
+    def __iter__(self):
+        return iter(self.ends)
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    def get(self, name: str, default=None):
+        return self[name] if name in self.ends else default
+
+    def items(self):
+        return [(name, self[name]) for name in self.ends]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class SnakeEngine:
+    """Pure-Python snake simulation stepped one logic tick at a time"""
+
+    def __init__(self, grid_width: int = 25, grid_height: int = 20,
+                 seed: Optional[int] = None, rng=None):
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        # An explicit rng (anything with random()/randrange()/choice()) overrides seeding
+        self.external_rng = rng
+        self.power_up_types = {name: dict(data) for name, data in POWER_UP_TYPES.items()}
+        self.max_power_ups = MAX_POWER_UPS
+        self.reset(seed)
+
+    def reset(self, seed: Optional[int] = None):
+        """
+        Put the engine back into the start-of-game state.
+
+        Each game gets its own random.Random seeded with seed (a fresh random
+        seed when None), so a game is fully reproduced by its seed and inputs.
+        """
+        if self.external_rng is not None:
+            self.seed = None
+            self.rng = self.external_rng
+        else:
+            self.seed = seed if seed is not None else random.randrange(2 ** 63)
+            self.rng = random.Random(self.seed)
+
+        cx, cy = self.grid_width // 2, self.grid_height // 2
+        self.place_snake([(cx, cy), (cx - 1, cy), (cx - 2, cy)], "Right")
+        # Power-up and effect expiry run off one timer wheel; its clock only
+        # advances in update_power_ups, so it trails ticks by one mid-step
+        self.timers = TimerWheel()
+        # Cell -> {"pos", "type", "expires"}, in spawn order
+        self.power_ups: Dict[Tuple[int, int], Dict] = {}
+        self.score = 0
+        self.level = 1
+        self.speed = START_SPEED
+        self.active_effects = EffectTimers(self.timers)
+        self.alive = True
+        self.ticks = 0
+        self.food = self.generate_food()
+
+    def place_snake(self, cells: Iterable[Tuple[int, int]], direction: str = "Right"):
+        """Replace the body (head first) and rebuild the occupancy grid to match"""
+        self.snake: Deque[Tuple[int, int]] = deque(cells)
+        self.direction = direction
+        # One byte per cell, 1 while a body segment sits on it
+        self.occupied = bytearray(self.grid_width * self.grid_height)
+        # Every cell not under the body, for O(1) food and power-up placement
+        self.free_cells = FreeCellSet(self.grid_width * self.grid_height)
+        for x, y in self.snake:
+            self.occupied[y * self.grid_width + x] = 1
+            self.free_cells.remove(y * self.grid_width + x)
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        return self.occupied[y * self.grid_width + x] == 1
+
+    def cell_index(self, pos: Tuple[int, int]) -> int:
+        return pos[1] * self.grid_width + pos[0]
+
+    def generate_food(self) -> Optional[Tuple[int, int]]:
+        """Pick a random free cell for food, or None once the snake fills the board"""
+        cell = self.free_cells.sample(self.rng)
+        if cell is None:
+            return None
+        return (cell % self.grid_width, cell // self.grid_width)
+
+    def generate_power_up(self):
+        """Generate random power-up on a cell free of snake, food and other power-ups"""
+        if self.rng.random() < POWER_UP_CHANCE and len(self.power_ups) < self.max_power_ups:
+            exclude = [self.cell_index(pos) for pos in self.power_ups]
+            if self.food is not None:
+                exclude.append(self.cell_index(self.food))
+            cell = self.free_cells.sample(self.rng, exclude)
+            if cell is None:
+                return
+            power_type = self.rng.choice(list(self.power_up_types.keys()))
+            self.add_power_up((cell % self.grid_width, cell // self.grid_width), power_type)
+
+    def add_power_up(self, pos: Tuple[int, int], power_type: str,
+                     lifetime: int = POWER_UP_LIFETIME) -> Dict:
+        """Place a power-up; it can be collected until `lifetime` more ticks have passed"""
+        power_up = {"pos": pos, "type": power_type, "expires": self.timers.now + lifetime}
+        self.power_ups[pos] = power_up
+        self.timers.schedule(power_up["expires"] + 1, ("power_up", pos, power_up))
+        return power_up
+
+    def power_up_timer(self, power_up: Dict) -> int:
+        """Ticks left before power_up expires"""
+        return power_up["expires"] - self.timers.now
+
+    def update_power_ups(self):
+        """Advance the timer wheel, dropping expired power-ups and effects"""
+        for kind, key, value in self.timers.advance():
+            if kind == "power_up":
+                if self.power_ups.get(key) is value:
+                    del self.power_ups[key]
+            else:
+                self.active_effects.expire(key, value)
+
+    def collect_power_up(self, power_up: Dict):
+        """Apply points and effect of a collected power-up"""
+        power_data = self.power_up_types[power_up["type"]]
+
+        score_multiplier = self.score_multiplier()
+        self.score += power_data["points"] * score_multiplier
+
+        effect = power_data["effect"]
+        if effect == "speed":
+            self.active_effects["speed_boost"] = SPEED_BOOST_TICKS
+        elif effect == "double_score":
+            self.active_effects["double_score"] = DOUBLE_SCORE_TICKS
+        elif effect == "extra_food":
+            self.score += 20 * score_multiplier
+
+    def score_multiplier(self) -> int:
+        return 2 if self.active_effects["double_score"] > 0 else 1
+
+    def set_direction(self, direction: Optional[str]) -> bool:
+        """Change heading unless it is unknown or a reversal; returns True if applied"""
+        if direction not in DIRECTIONS or direction == OPPOSITE_DIRECTIONS[self.direction]:
+            return False
+        self.direction = direction
+        return True
+
+    def tick_interval(self) -> int:
+        """Milliseconds until the next tick at the current speed and effects"""
+        if self.active_effects["speed_boost"] > 0:
+            return max(MIN_SPEED, self.speed // 2)
+        return self.speed
+
+    def step(self, action: Optional[str] = None) -> Dict:
+        """
+        Advance the game by one tick.
+
+        action is a direction name ("Up", "Down", "Left", "Right") or None to
+        keep going straight. Returns a dict describing what happened this tick.
+        """
+        result = {
+            "alive": self.alive,
+            "ate_food": False,
+            "power_up": None,
+            "level_up": False,
+        }
+        if not self.alive:
+            return result
+
+        self.set_direction(action)
+
+        dx, dy = DIRECTIONS[self.direction]
+        head_x, head_y = self.snake[0]
+        new_x, new_y = head_x + dx, head_y + dy
+        new_head = (new_x, new_y)
+
+        # Wall collision
+        if not (0 <= new_x < self.grid_width and 0 <= new_y < self.grid_height):
+            self.alive = False
+            result["alive"] = False
+            return result
+
+        # Self collision (the tail has not moved yet, so it still counts)
+        head_index = new_y * self.grid_width + new_x
+        if self.occupied[head_index]:
+            self.alive = False
+            result["alive"] = False
+            return result
+
+        # ticks counts completed moves, renderers use it to see how far the body shifted
+        self.ticks += 1
+        self.snake.appendleft(new_head)
+        self.occupied[head_index] = 1
+        self.free_cells.remove(head_index)
+
+        if new_head == self.food:
+            result["ate_food"] = True
+            self.score += 10 * self.score_multiplier()
+            self.food = self.generate_food()
+
+            # Level up every 100 points
+            new_level = (self.score // 100) + 1
+            if new_level > self.level:
+                self.level = new_level
+                self.speed = max(MIN_SPEED, self.speed - 10)
+                result["level_up"] = True
+
+        power_up = self.power_ups.pop(new_head, None)
+        if power_up is not None:
+            self.collect_power_up(power_up)
+            result["power_up"] = power_up["type"]
+
+        if not result["ate_food"]:
+            tail_x, tail_y = self.snake.pop()
+            tail_index = tail_y * self.grid_width + tail_x
+            self.occupied[tail_index] = 0
+            self.free_cells.add(tail_index)
+
+        self.update_power_ups()
+        self.generate_power_up()
+        return result
+
+
+def benchmark_tick_rate(lengths=(10, 100, 1000, 10000, 100000), ticks: int = 20000):
+    """
+    Measure engine ticks/sec against snake length.
+
+    The snake is laid out as a straight line on the top row of a two-row
+    board and runs right, so it never eats and the length stays fixed.
+    Returns a list of (length, ticks_per_second).
+    """
+    results = []
+    for length in lengths:
+        engine = SnakeEngine(length + ticks + 1, 2, seed=0)
+        engine.place_snake([(x, 0) for x in range(length - 1, -1, -1)], "Right")
+        engine.food = (0, 1)
+
+        start = time.perf_counter()
+        for _ in range(ticks):
+            engine.step()
+        elapsed = time.perf_counter() - start
+
+        results.append((length, ticks / elapsed))
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'length':>8} {'ticks/sec':>12}")
+    for length, rate in benchmark_tick_rate():
+        print(f"{length:>8} {rate:>12,.0f}")
@@ -0,0 +1,235 @@
+"""
+Snake Environment - games/snake_env.py
+Gym-style reset()/step() wrapper around SnakeEngine for learning agents
+
+Observations are a dict of buffers updated in place from the previous tick:
+
+    board     uint8 (H, W)  0 empty, 1 body, 2 head, 3 food, 4+i power-up type i
+    features  float list    heading one-hot (4), danger straight/left/right (3),
+                            food dx/dy relative to the heading (2), length / cells
+    timers    int list      speed_boost, double_score ticks left, then the
+                            soonest power-up expiry (0 when none)
+
+board is a numpy view of a bytearray when numpy is installed (a memoryview
+otherwise); it is the same object every step, so copy it to keep history.
+No gym dependency: step() returns (obs, reward, terminated, truncated, info)
+like gymnasium.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from games.snake_engine import DIRECTIONS, EFFECT_NAMES, OPPOSITE_DIRECTIONS, SnakeEngine
+
+ACTIONS = ["Up", "Down", "Left", "Right"]
+
+EMPTY, BODY, HEAD, FOOD, POWER_UP = 0, 1, 2, 3, 4
+
+# Heading -> (left, right) turn
+TURNS = {
+    "Up": ("Left", "Right"),
+    "Down": ("Right", "Left"),
+    "Left": ("Down", "Up"),
+    "Right": ("Up", "Down"),
+}
+
+
+class SnakeEnv:
+    """
+    One SnakeEngine game per env. Rewards are score gained / 10 (so a plain
+    food is +1) and death_penalty on a collision. Episodes are truncated after
+    max_steps, or after max_idle_steps without eating (default 2x board).
+    """
+
+    def __init__(self, grid_width: int = 25, grid_height: int = 20, seed: Optional[int] = None,
+                 max_steps: Optional[int] = None, max_idle_steps: Optional[int] = None,
+                 death_penalty: float = -1.0):
+        self.engine = SnakeEngine(grid_width, grid_height, seed=seed)
+        self.width = grid_width
+        self.height = grid_height
+        self.max_steps = max_steps
+        self.max_idle_steps = max_idle_steps or grid_width * grid_height * 2
+        self.death_penalty = death_penalty
+        self.power_up_codes = {
+            name: POWER_UP + i for i, name in enumerate(self.engine.power_up_types)
+        }
+
+        self.plane = bytearray(grid_width * grid_height)
+        if NUMPY_AVAILABLE:
+            board = np.frombuffer(self.plane, dtype=np.uint8).reshape(grid_height, grid_width)
+        else:
+            board = memoryview(self.plane).cast("B", (grid_height, grid_width))
+        self.features: List[float] = [0.0] * 10
+        self.timers: List[int] = [0] * (len(EFFECT_NAMES) + 1)
+        self.observation = {"board": board, "features": self.features, "timers": self.timers}
+
+        self.head = None
+        self.tail = None
+        self.marked: Dict[Tuple[int, int], int] = {}  # cells showing head/food/power-ups
+        self.idle = 0
+        self.steps = 0
+
+        # Counters for benchmarking
+        self.full_rebuilds = 0
+        self.incremental_updates = 0
+
+    # ------------------------------------------------------------------ API
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Dict, Dict]:
+        self.engine.reset(seed)
+        self.idle = 0
+        self.steps = 0
+        self._rebuild()
+        self._update_vectors()
+        return self.observation, self._info()
+
+    def step(self, action: Union[int, str, None]) -> Tuple[Dict, float, bool, bool, Dict]:
+        """action: index into ACTIONS, a direction name, or None / -1 to go straight"""
+        if isinstance(action, int) and not isinstance(action, bool):
+            action = ACTIONS[action] if action >= 0 else None
+
+        engine = self.engine
+        score = engine.score
+        result = engine.step(action)
+        self.steps += 1
+        self.idle = 0 if result["ate_food"] else self.idle + 1
+
+        if result["alive"]:
+            self._update_board()
+            self._update_vectors()
+            reward = (engine.score - score) / 10.0
+        else:
+            reward = self.death_penalty
+
+        terminated = not result["alive"] or engine.food is None
+        truncated = not terminated and (
+            (self.max_steps is not None and self.steps >= self.max_steps)
+            or self.idle >= self.max_idle_steps
+        )
+        info = self._info()
+        info.update(result)
+        return self.observation, reward, terminated, truncated, info
+
+    def action_mask(self) -> List[bool]:
+        """Per ACTIONS entry, False for the reversal the engine would ignore"""
+        opposite = OPPOSITE_DIRECTIONS[self.engine.direction]
+        return [name != opposite for name in ACTIONS]
+
+    def _info(self) -> Dict:
+        return {
+            "score": self.engine.score,
+            "level": self.engine.level,
+            "length": len(self.engine.snake),
+            "ticks": self.engine.ticks,
+            "seed": self.engine.seed,
+        }
+
+    # ------------------------------------------------------------------ board
+
+    def _marks(self) -> Dict[Tuple[int, int], int]:
+        engine = self.engine
+        marks = {pos: self.power_up_codes[pu["type"]] for pos, pu in engine.power_ups.items()}
+        if engine.food is not None:
+            marks[engine.food] = FOOD
+        marks[engine.snake[0]] = HEAD
+        return marks
+
+    def _rebuild(self):
+        """Fill the board plane from scratch (after reset)"""
+        engine = self.engine
+        self.plane[:] = engine.occupied  # body cells are 1 == BODY
+        self.marked = self._marks()
+        for (x, y), code in self.marked.items():
+            self.plane[y * self.width + x] = code
+        self.head, self.tail = engine.snake[0], engine.snake[-1]
+        self.full_rebuilds += 1
+
+    def _update_board(self):
+        """Patch only the cells that changed on the last tick"""
+        engine, plane, width = self.engine, self.plane, self.width
+        marks = self._marks()
+        for (x, y) in self.marked:
+            if (x, y) not in marks:
+                plane[y * width + x] = engine.occupied[y * width + x]
+        x, y = self.head
+        plane[y * width + x] = BODY
+        x, y = self.tail
+        if not engine.occupied[y * width + x]:
+            plane[y * width + x] = EMPTY
+        for (x, y), code in marks.items():
+            plane[y * width + x] = code
+        self.marked = marks
+        self.head, self.tail = engine.snake[0], engine.snake[-1]
+        self.incremental_updates += 1
+
+    # ------------------------------------------------------------------ vectors
+
+    def _blocked(self, direction: str) -> bool:
+        dx, dy = DIRECTIONS[direction]
+        x, y = self.engine.snake[0]
+        x, y = x + dx, y + dy
+        return not (0 <= x < self.width and 0 <= y < self.height) or self.engine.is_occupied(x, y)
+
+    def _update_vectors(self):
+        engine = self.engine
+        heading = engine.direction
+        features = self.features
+        for i, name in enumerate(ACTIONS):
+            features[i] = 1.0 if name == heading else 0.0
+        left, right = TURNS[heading]
+        features[4] = 1.0 if self._blocked(heading) else 0.0
+        features[5] = 1.0 if self._blocked(left) else 0.0
+        features[6] = 1.0 if self._blocked(right) else 0.0
+
+        # Food offset rotated into the snake's frame: +forward, +right
+        if engine.food is None:
+            features[7] = features[8] = 0.0
+        else:
+            hx, hy = engine.snake[0]
+            dx, dy = engine.food[0] - hx, engine.food[1] - hy
+            fx, fy = DIRECTIONS[heading]
+            rx, ry = DIRECTIONS[right]
+            features[7] = (dx * fx + dy * fy) / max(self.width, self.height)
+            features[8] = (dx * rx + dy * ry) / max(self.width, self.height)
+        features[9] = len(engine.snake) / (self.width * self.height)
+
+        timers = self.timers
+        for i, name in enumerate(EFFECT_NAMES):
+            timers[i] = engine.active_effects[name]
+        timers[-1] = min(
+            (engine.power_up_timer(pu) for pu in engine.power_ups.values()), default=0
+        )
+
+
+def benchmark_env(ticks: int = 50000, grid_width: int = 25, grid_height: int = 20,
+                  seed: int = 0) -> Dict[str, float]:
+    """Env steps per second for a cautious random policy, with resets on episode end"""
+    import random
+
+    env = SnakeEnv(grid_width, grid_height, seed=seed)
+    rng = random.Random(seed)
+    env.reset(seed)
+    episodes = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        danger = env.features[4:7]
+        left, right = TURNS[env.engine.direction]
+        options = [d for d, blocked in zip((None, left, right), danger) if not blocked]
+        _, _, terminated, truncated, _ = env.step(rng.choice(options) if options else None)
+        if terminated or truncated:
+            episodes += 1
+            env.reset(seed + episodes)
+    elapsed = time.perf_counter() - start
+    return {"steps_per_second": ticks / elapsed, "episodes": episodes}
+
+
+if __name__ == "__main__":
+    stats = benchmark_env()
+    print(f"{stats['steps_per_second']:,.0f} steps/sec over {stats['episodes']} episodes")
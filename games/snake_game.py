@@ -4,67 +4,91 @@ Classic snake game with proper return-to-menu functionality
 """
 
 import customtkinter as ctk
-import random
 from tkinter import Canvas
-from typing import Callable, List, Tuple
-import math
+from typing import Callable
+import os
+from datetime import datetime
+
+from games.snake_autopilot import SnakePlanner
+from games.snake_engine import SnakeEngine
+from games.snake_input import DirectionInputQueue
+from games.snake_profiler import SnakeProfiler
+from games.snake_renderer import CELL_SIZE, SNAKE_COLORS, SnakeCanvasRenderer
+from games.snake_replay import ReplayRecorder
+from utils.frame_clock import FrameClock
+from utils.game_loop import FixedTimestepLoop
+
+# Board size per mode; the canvas always shows VIEWPORT cells and scrolls on larger boards
+BOARD_MODES = {
+    "Classic": (25, 20),
+    "Big Arena": (500, 500),
+}
+VIEWPORT = (25, 20)
+
+KEY_DIRECTIONS = {
+    "up": "Up", "w": "Up",
+    "down": "Down", "s": "Down",
+    "left": "Left", "a": "Left",
+    "right": "Right", "d": "Right",
+}
 
 class SnakeGame:
-    def __init__(self, parent_frame: ctk.CTkFrame, return_callback: Callable = None):
+    def __init__(self, parent_frame: ctk.CTkFrame, return_callback: Callable = None,
+                 clock: FrameClock = None):
         self.parent_frame = parent_frame
-        self.move_callback_id = None
         self.return_callback = return_callback
+        # Timers run on the shared FrameClock (GameManager's, or a private one)
+        self.timers = (clock or FrameClock(parent_frame)).client("snake")
 
         # Game settings
-        self.cell_size = 20
-        self.grid_width = 25
-        self.grid_height = 20
-        self.canvas_width = self.grid_width * self.cell_size
-        self.canvas_height = self.grid_height * self.cell_size
-
-        # Game state
-        self.snake = [(12, 10), (11, 10), (10, 10)]  # Start in middle
-        self.direction = "Right"
+        self.cell_size = CELL_SIZE
+        self.board_mode = "Classic"
+        self.grid_width, self.grid_height = BOARD_MODES[self.board_mode]
+        self.canvas_width = VIEWPORT[0] * self.cell_size
+        self.canvas_height = VIEWPORT[1] * self.cell_size
+
+        # Game state - rules live in the headless engine, this class only displays it
+        self.engine = SnakeEngine(self.grid_width, self.grid_height)
         self.next_direction = "Right"
-        self.food = self.generate_food()
-        self.power_ups = []
-        self.score = 0
+        # Key presses wait here and are applied one per tick
+        self.inputs = DirectionInputQueue(max_size=3)
+        self.autopilot = False
+        # Built here and on mode switches, never inside a tick; it follows
+        # engine.reset() itself, so restarts keep it
+        self.planner = SnakePlanner(self.engine)
+        # Seed + per-tick directions of the current game, see games/snake_replay.py
+        self.recorder = ReplayRecorder(self.engine)
+        self.last_replay = None
         self.high_score = 0
         self.game_running = False
         self.game_paused = False
-        self.speed = 150  # milliseconds between moves
-        self.level = 1
-
-        # Power-up types
-        self.power_up_types = {
-            "speed_boost": {"color": "#00ffff", "points": 20, "effect": "speed"},
-            "score_multiplier": {
-                "color": "#ff00ff",
-                "points": 30,
-                "effect": "double_score",
-            },
-            "extra_food": {"color": "#ffff00", "points": 15, "effect": "extra_food"},
-        }
-
-        # Active effects
-        self.active_effects = {"speed_boost": 0, "double_score": 0}
+
+        # Frame timing ring buffer; F3 shows it on the canvas, dumped to CSV on game over
+        self.profiler = SnakeProfiler(
+            items_created=lambda: self.renderer.items_created if self.renderer else 0,
+            tick_interval=lambda: self.engine.tick_interval(),
+        )
+        self.profile_dir = os.path.join("data", "profiles")
+
+        # Logic ticks follow engine speed on perf_counter deadlines, drawing is capped at ~60 FPS;
+        # the loop schedules itself through the clock client as if it were a widget
+        self.loop = FixedTimestepLoop(
+            self.timers,
+            tick=self.profiler.wrap_tick(self.move_snake),
+            render=self.profiler.wrap_render(self.draw_game),
+            tick_interval=lambda: self.engine.tick_interval(),
+            render_interval=16,
+        )
 
         # Colors
-        self.colors = {
-            "bg_primary": "#0f0f23",
-            "bg_secondary": "#1a1a2e",
-            "snake_head": "#00ff88",
-            "snake_body": "#00cc66",
-            "food": "#ff6b6b",
-            "wall": "#333333",
-            "grid": "#2a2a2a",
-            "text": "#ffffff",
-            "accent": "#ffd700",
-        }
+        self.colors = dict(SNAKE_COLORS)
 
         # UI elements - FIXED: Better widget tracking
         self.main_frame = None
         self.canvas = None
+        self.renderer = None
+        self.autopilot_btn = None
+        self.mode_menu = None
         self.info_frame = None
 
         self.setup_game()
@@ -107,7 +131,7 @@ class SnakeGame:
 
         self.score_label = ctk.CTkLabel(
             stats_container,
-            text=f"Score: {self.score}",
+            text=f"Score: {self.engine.score}",
             font=("Arial", 18, "bold"),
             text_color=self.colors["text"],
         )
@@ -115,7 +139,7 @@ class SnakeGame:
 
         self.level_label = ctk.CTkLabel(
             stats_container,
-            text=f"Level: {self.level}",
+            text=f"Level: {self.engine.level}",
             font=("Arial", 18, "bold"),
             text_color=self.colors["accent"],
         )
@@ -140,6 +164,10 @@ class SnakeGame:
         )
         self.canvas.pack(pady=20)
         self.canvas.focus_set()  # Make sure canvas is ready for key input
+        self.renderer = SnakeCanvasRenderer(
+            self.canvas, self.engine, self.cell_size, self.colors, viewport=VIEWPORT
+        )
+        self.profiler.attach(self.canvas)
 
         # Control buttons
         self.create_control_buttons()
@@ -188,6 +216,21 @@ class SnakeGame:
         )
         self.restart_btn.pack(side="left", padx=10)
 
+        # Autopilot toggle
+        self.autopilot_btn = ctk.CTkButton(
+            button_container,
+            text="🤖 AUTOPILOT",
+            width=150,
+            height=45,
+            font=("Arial", 16, "bold"),
+            fg_color=self.colors["bg_primary"],
+            hover_color="#2a2a4e",
+            border_width=2,
+            border_color=self.colors["snake_head"],
+            command=self.toggle_autopilot,
+        )
+        self.autopilot_btn.pack(side="left", padx=10)
+
         # Exit button
         exit_btn = ctk.CTkButton(
             button_container,
@@ -201,6 +244,20 @@ class SnakeGame:
         )
         exit_btn.pack(side="left", padx=10)
 
+        # Board size
+        self.mode_menu = ctk.CTkOptionMenu(
+            controls_frame,
+            values=list(BOARD_MODES),
+            command=self.set_board_mode,
+            width=200,
+            font=("Arial", 14, "bold"),
+            fg_color=self.colors["bg_primary"],
+            button_color=self.colors["snake_body"],
+            button_hover_color="#00aa55",
+        )
+        self.mode_menu.set(self.board_mode)
+        self.mode_menu.pack(pady=(0, 15))
+
     def create_instructions(self):
         """Create game instructions"""
         instructions_frame = ctk.CTkFrame(
@@ -222,7 +279,8 @@ class SnakeGame:
         🔸 Collect power-ups for special effects:
            💙 Speed Boost  💜 Score Multiplier  💛 Extra Food
         🔸 Avoid hitting walls or yourself
-        🔸 Press SPACE to pause/unpause
+        🔸 Press SPACE to pause/unpause, P to toggle autopilot, F3 for frame stats
+        🔸 Pick Big Arena for a 500x500 board that scrolls with the snake
         """
 
         instructions_label = ctk.CTkLabel(
@@ -245,274 +303,64 @@ class SnakeGame:
         """Handle keyboard input"""
         key = event.keysym.lower()
 
-        # Movement keys
-        if key in ["up", "w"] and self.direction != "Down":
-            self.next_direction = "Up"
-        elif key in ["down", "s"] and self.direction != "Up":
-            self.next_direction = "Down"
-        elif key in ["left", "a"] and self.direction != "Right":
-            self.next_direction = "Left"
-        elif key in ["right", "d"] and self.direction != "Left":
-            self.next_direction = "Right"
+        # Movement keys are queued; reversals are rejected against the last queued turn
+        if key in KEY_DIRECTIONS:
+            if not self.autopilot:
+                self.inputs.push(KEY_DIRECTIONS[key], self.engine.direction)
         elif key == "space":
             self.toggle_pause()
+        elif key == "p":
+            self.toggle_autopilot()
+        elif key == "f3":
+            self.profiler.toggle()
+
+    def toggle_autopilot(self):
+        """Let the pathfinding planner steer instead of the keyboard"""
+        self.autopilot = not self.autopilot
+        self.inputs.clear()
+        if self.autopilot_btn:
+            self.autopilot_btn.configure(
+                fg_color=self.colors["snake_head"] if self.autopilot else self.colors["bg_primary"]
+            )
 
-    def generate_food(self) -> Tuple[int, int]:
-        """Generate random food position"""
-        while True:
-            x = random.randint(0, self.grid_width - 1)
-            y = random.randint(0, self.grid_height - 1)
-            if (x, y) not in self.snake:
-                return (x, y)
-
-    def generate_power_up(self):
-        """Generate random power-up"""
-        if random.random() < 0.15 and len(self.power_ups) < 2:  # 15% chance
-            while True:
-                x = random.randint(0, self.grid_width - 1)
-                y = random.randint(0, self.grid_height - 1)
-                if (x, y) not in self.snake and (x, y) != self.food:
-                    power_type = random.choice(list(self.power_up_types.keys()))
-                    self.power_ups.append(
-                        {
-                            "pos": (x, y),
-                            "type": power_type,
-                            "timer": 200,  # Disappears after 200 game ticks
-                        }
-                    )
-                    break
-
-    def update_power_ups(self):
-        """Update power-up timers and effects"""
-        # Update power-up timers
-        self.power_ups = [pu for pu in self.power_ups if pu["timer"] > 0]
-        for pu in self.power_ups:
-            pu["timer"] -= 1
-
-        # Update active effects
-        for effect in self.active_effects:
-            if self.active_effects[effect] > 0:
-                self.active_effects[effect] -= 1
-
-    def move_snake(self):
-        """Move the snake and handle game logic"""
+    def move_snake(self) -> bool:
+        """Advance the engine one logic tick; returns False to stop the loop"""
         if not self.game_running or self.game_paused:
-            return
+            return False
 
-        # Update direction
-        self.direction = self.next_direction
-
-        # Calculate new head position
-        head_x, head_y = self.snake[0]
-
-        if self.direction == "Up":
-            new_head = (head_x, head_y - 1)
-        elif self.direction == "Down":
-            new_head = (head_x, head_y + 1)
-        elif self.direction == "Left":
-            new_head = (head_x - 1, head_y)
-        else:  # Right
-            new_head = (head_x + 1, head_y)
-
-        # Check wall collision
-        if (
-            new_head[0] < 0
-            or new_head[0] >= self.grid_width
-            or new_head[1] < 0
-            or new_head[1] >= self.grid_height
-        ):
-            self.game_over()
-            return
+        pressed = None
+        if self.autopilot:
+            self.next_direction = self.planner.choose() or self.engine.direction
+        else:
+            pressed = self.inputs.pop()
+            self.next_direction = pressed[0] if pressed else self.engine.direction
 
-        # Check self collision
-        if new_head in self.snake:
+        result = self.recorder.step(self.next_direction)
+        if pressed:
+            self.inputs.applied(pressed[1])
+        if not result["alive"]:
             self.game_over()
-            return
-
-        # Add new head
-        self.snake.insert(0, new_head)
-
-        # Check food collision
-        ate_food = False
-        if new_head == self.food:
-            ate_food = True
-            score_multiplier = 2 if self.active_effects["double_score"] > 0 else 1
-            self.score += 10 * score_multiplier
-            self.food = self.generate_food()
-
-            # Level up every 100 points
-            new_level = (self.score // 100) + 1
-            if new_level > self.level:
-                self.level = new_level
-                self.speed = max(50, self.speed - 10)  # Increase speed
+            return False
 
+        if result["ate_food"] or result["power_up"]:
             self.update_score_display()
-
-        # Check power-up collision
-        for i, power_up in enumerate(self.power_ups):
-            if new_head == power_up["pos"]:
-                self.collect_power_up(power_up)
-                self.power_ups.pop(i)
-                break
-
-        # Remove tail if no food eaten
-        if not ate_food:
-            self.snake.pop()
-
-        # Update power-ups and generate new ones
-        self.update_power_ups()
-        self.generate_power_up()
-
-        # Draw game
-        self.draw_game()
-
-        # Schedule next move
-        current_speed = self.speed
-        if self.active_effects["speed_boost"] > 0:
-            current_speed = max(50, current_speed // 2)
-
-        self.move_callback_id = self.parent_frame.after(current_speed, self.move_snake)
-
-    def collect_power_up(self, power_up):
-        """Handle power-up collection"""
-        power_type = power_up["type"]
-        power_data = self.power_up_types[power_type]
-
-        # Add points
-        score_multiplier = 2 if self.active_effects["double_score"] > 0 else 1
-        self.score += power_data["points"] * score_multiplier
-
-        # Apply effect
-        effect = power_data["effect"]
-        if effect == "speed":
-            self.active_effects["speed_boost"] = 100  # 100 ticks
-        elif effect == "double_score":
-            self.active_effects["double_score"] = 150  # 150 ticks
-        elif effect == "extra_food":
-            # Add extra food point
-            self.score += 20 * score_multiplier
-
-        self.update_score_display()
+        return True
 
     def draw_game(self):
-        """Draw the game state"""
-        if not self.canvas:
+        """Draw the game state (incrementally, see SnakeCanvasRenderer)"""
+        if not self.renderer:
             return
-            
-        self.canvas.delete("all")
-
-        # Draw grid
-        for i in range(self.grid_width + 1):
-            x = i * self.cell_size
-            self.canvas.create_line(
-                x, 0, x, self.canvas_height, fill=self.colors["grid"], width=1
-            )
-
-        for i in range(self.grid_height + 1):
-            y = i * self.cell_size
-            self.canvas.create_line(
-                0, y, self.canvas_width, y, fill=self.colors["grid"], width=1
-            )
-
-        # Draw snake
-        for i, (x, y) in enumerate(self.snake):
-            x1, y1 = x * self.cell_size, y * self.cell_size
-            x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-
-            if i == 0:  # Head
-                self.canvas.create_oval(
-                    x1 + 2,
-                    y1 + 2,
-                    x2 - 2,
-                    y2 - 2,
-                    fill=self.colors["snake_head"],
-                    outline=self.colors["text"],
-                    width=2,
-                )
-                # Eyes
-                eye_size = 3
-                self.canvas.create_oval(
-                    x1 + 5, y1 + 5, x1 + 5 + eye_size, y1 + 5 + eye_size, fill="white"
-                )
-                self.canvas.create_oval(
-                    x2 - 8, y1 + 5, x2 - 8 + eye_size, y1 + 5 + eye_size, fill="white"
-                )
-            else:  # Body
-                self.canvas.create_rectangle(
-                    x1 + 1,
-                    y1 + 1,
-                    x2 - 1,
-                    y2 - 1,
-                    fill=self.colors["snake_body"],
-                    outline=self.colors["snake_head"],
-                    width=1,
-                )
-
-        # Draw food
-        fx, fy = self.food
-        fx1, fy1 = fx * self.cell_size, fy * self.cell_size
-        fx2, fy2 = fx1 + self.cell_size, fy1 + self.cell_size
-        self.canvas.create_oval(
-            fx1 + 2,
-            fy1 + 2,
-            fx2 - 2,
-            fy2 - 2,
-            fill=self.colors["food"],
-            outline="darkred",
-            width=2,
-        )
 
-        # Draw power-ups
-        for power_up in self.power_ups:
-            px, py = power_up["pos"]
-            px1, py1 = px * self.cell_size, py * self.cell_size
-            px2, py2 = px1 + self.cell_size, py1 + self.cell_size
-
-            color = self.power_up_types[power_up["type"]]["color"]
-            self.canvas.create_rectangle(
-                px1 + 3, py1 + 3, px2 - 3, py2 - 3, fill=color, outline="white", width=2
-            )
-
-            # Add symbol
-            symbol = (
-                "⚡"
-                if power_up["type"] == "speed_boost"
-                else "💎" if power_up["type"] == "score_multiplier" else "🍎"
-            )
-            self.canvas.create_text(
-                px1 + self.cell_size // 2,
-                py1 + self.cell_size // 2,
-                text=symbol,
-                fill="white",
-                font=("Arial", 8),
-            )
-
-        # Draw active effects indicator
-        if any(self.active_effects.values()):
-            effects_text = []
-            if self.active_effects["speed_boost"] > 0:
-                effects_text.append("⚡ Speed Boost")
-            if self.active_effects["double_score"] > 0:
-                effects_text.append("💎 Double Score")
-
-            if effects_text:
-                self.canvas.create_text(
-                    10,
-                    10,
-                    text=" | ".join(effects_text),
-                    fill=self.colors["accent"],
-                    font=("Arial", 10),
-                    anchor="nw",
-                )
+        self.renderer.render()
 
     def update_score_display(self):
         """Update score display"""
         if self.score_label:
-            self.score_label.configure(text=f"Score: {self.score}")
+            self.score_label.configure(text=f"Score: {self.engine.score}")
         if self.level_label:
-            self.level_label.configure(text=f"Level: {self.level}")
-        if self.score > self.high_score:
-            self.high_score = self.score
+            self.level_label.configure(text=f"Level: {self.engine.level}")
+        if self.engine.score > self.high_score:
+            self.high_score = self.engine.score
             if self.high_score_label:
                 self.high_score_label.configure(text=f"High Score: {self.high_score}")
 
@@ -529,13 +377,14 @@ class SnakeGame:
         self.game_paused = False
         if self.start_pause_btn:
             self.start_pause_btn.configure(text="⏸️ PAUSE")
-        self.move_snake()
+        self.loop.start()
 
     def toggle_pause(self):
         """Toggle pause state"""
         if self.game_running:
             self.game_paused = not self.game_paused
             if self.game_paused:
+                self.loop.stop()
                 if self.start_pause_btn:
                     self.start_pause_btn.configure(text="▶️ RESUME")
                 # Draw pause message
@@ -554,10 +403,13 @@ class SnakeGame:
                     self.start_pause_btn.configure(text="⏸️ PAUSE")
                 if self.canvas:
                     self.canvas.delete("pause")
-                self.move_snake()
+                self.loop.start()
 
     def game_over(self):
         """Handle game over"""
+        self.last_replay = self.recorder.finish()
+        if self.profiler.enabled:
+            self.save_profile()
         self.game_running = False
         self.game_paused = False
         if self.start_pause_btn:
@@ -568,7 +420,7 @@ class SnakeGame:
             self.canvas.create_text(
                 self.canvas_width // 2,
                 self.canvas_height // 2,
-                text=f"GAME OVER!\nScore: {self.score}\nPress RESTART to play again",
+                text=f"GAME OVER!\nScore: {self.engine.score}\nPress RESTART to play again",
                 fill=self.colors["food"],
                 font=("Arial", 16, "bold"),
                 justify="center",
@@ -577,22 +429,40 @@ class SnakeGame:
 
     def restart_game(self):
         """Restart the game"""
-        self.snake = [(12, 10), (11, 10), (10, 10)]
-        self.direction = "Right"
+        self.loop.stop()
+        self.engine.reset()
+        self.recorder.start()
         self.next_direction = "Right"
-        self.food = self.generate_food()
-        self.power_ups = []
-        self.score = 0
-        self.level = 1
-        self.speed = 150
+        self.inputs.clear()
         self.game_running = False
         self.game_paused = False
-        self.active_effects = {"speed_boost": 0, "double_score": 0}
 
         if self.start_pause_btn:
             self.start_pause_btn.configure(text="🎮 START GAME")
         self.update_score_display()
-        self.draw_game()
+        if self.canvas:
+            self.canvas.delete("game_over")
+            self.canvas.delete("pause")
+        if self.renderer:
+            self.renderer.reset()
+
+    def set_board_mode(self, mode: str):
+        """Switch board size; starts a fresh game on a new engine"""
+        if mode not in BOARD_MODES or mode == self.board_mode:
+            return
+        self.loop.stop()
+        self.board_mode = mode
+        self.grid_width, self.grid_height = BOARD_MODES[mode]
+        self.engine = SnakeEngine(self.grid_width, self.grid_height)
+        self.recorder = ReplayRecorder(self.engine)
+        self.planner = SnakePlanner(self.engine)
+        if self.canvas:
+            self.canvas.delete("all")
+            self.renderer = SnakeCanvasRenderer(
+                self.canvas, self.engine, self.cell_size, self.colors, viewport=VIEWPORT
+            )
+            self.profiler.attach(self.canvas)
+        self.restart_game()
 
     def return_to_menu(self):
         """FIXED: Exit the game and return to menu properly"""
@@ -603,9 +473,7 @@ class SnakeGame:
         self.game_paused = False
         
         # Cancel any scheduled moves
-        if self.move_callback_id:
-            self.parent_frame.after_cancel(self.move_callback_id)
-            self.move_callback_id = None
+        self.loop.stop()
         
         # Clear the parent frame
         self.clear_parent_frame()
@@ -624,10 +492,26 @@ class SnakeGame:
         """FIXED: Cleanup method for proper resource management"""
         self.game_running = False
         self.game_paused = False
-        
-        if self.move_callback_id:
-            self.parent_frame.after_cancel(self.move_callback_id)
-            self.move_callback_id = None
+        self.loop.stop()
+        self.timers.close()
+
+    def get_loop_stats(self) -> dict:
+        """Measured tick rate and jitter of the game loop"""
+        return self.loop.stats()
+
+    def save_profile(self):
+        """Write the profiler ring buffer to data/profiles as CSV"""
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.profile_dir, f"snake_{stamp}.csv")
+        try:
+            self.profiler.dump_csv(path)
+            print(f"SnakeGame: Profile written to {path}")
+        except OSError as e:
+            print(f"SnakeGame: Could not write profile: {e}")
+
+    def get_input_stats(self) -> dict:
+        """Input-to-move latency of queued key presses"""
+        return self.inputs.stats()
 
 
 def start_snake_game(parent_frame: ctk.CTkFrame, return_callback: Callable = None):
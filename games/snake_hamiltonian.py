@@ -0,0 +1,190 @@
+"""
+Snake Hamiltonian Solver - games/snake_hamiltonian.py
+Perfect-play bot: follows a precomputed Hamiltonian cycle and fills the board
+
+The cycle visits every cell once, so a snake that only ever moves to the
+next cell on it can never trap itself. To avoid walking the whole board
+for every food, the solver may cut across the cycle toward the food, but
+only to a cell that stays behind the tail in cycle order with room to
+spare; once the snake covers half the board it just follows the cycle.
+
+Each decision looks at the four neighbours of the head and does a few
+modular subtractions, so per-tick cost is O(1) at any snake length.
+Needs an even number of rows or columns (an odd x odd grid has no cycle).
+"""
+
+import time
+from typing import Dict, List, Optional
+
+from games.snake_bots import SnakeBot, register_bot
+from games.snake_engine import DIRECTIONS, SnakeEngine
+
+# Cells kept free between the new head and the tail when cutting across
+SHORTCUT_BUFFER = 3
+
+
+def build_cycle(width: int, height: int) -> List[int]:
+    """
+    Cell indices (y * width + x) in Hamiltonian cycle order.
+
+    With an even row count: run along row 0, snake back and forth through
+    columns 1..W-1 of the remaining rows, and return up column 0. An odd row
+    count with an even column count uses the transposed layout.
+    """
+    if width < 2 or height < 2 or (width % 2 and height % 2):
+        raise ValueError(f"No Hamiltonian cycle on a {width}x{height} grid (needs an even side)")
+
+    if height % 2:
+        # Build on the transposed grid, then map (x, y) back
+        return [(cell % height) * width + cell // height for cell in build_cycle(height, width)]
+
+    cells = [x for x in range(width)]
+    for y in range(1, height):
+        columns = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        cells.extend(y * width + x for x in columns)
+    cells.extend(y * width for y in range(height - 1, 0, -1))
+    return cells
+
+
+class HamiltonianSolver:
+    """Cycle-following move choice with safe shortcuts, for one engine"""
+
+    def __init__(self, engine: SnakeEngine):
+        self.engine = engine
+        self.width = engine.grid_width
+        self.height = engine.grid_height
+        self.size = self.width * self.height
+        cycle = build_cycle(self.width, self.height)
+        self.order = [0] * self.size
+        for position, cell in enumerate(cycle):
+            self.order[cell] = position
+        self.align()
+
+        # Counters for benchmarking / debugging
+        self.shortcuts = 0
+        self.cycle_moves = 0
+
+    def align(self):
+        """Run the cycle in whichever direction does not lead back into the neck"""
+        snake = self.engine.snake
+        if len(snake) < 2:
+            return
+        head = self.engine.cell_index(snake[0])
+        neck = self.engine.cell_index(snake[1])
+        if self.distance(head, neck) == 1:
+            self.order = [(self.size - o) % self.size for o in self.order]
+
+    def distance(self, a: int, b: int) -> int:
+        """Steps from a to b along the cycle"""
+        return (self.order[b] - self.order[a]) % self.size
+
+    def choose(self) -> Optional[str]:
+        engine = self.engine
+        width, size = self.width, self.size
+        hx, hy = engine.snake[0]
+        head = hy * width + hx
+        tail = engine.cell_index(engine.snake[-1])
+        length = len(engine.snake)
+
+        # How far along the cycle the head may jump without closing on the tail
+        to_tail = self.distance(head, tail) or size
+        budget = to_tail - length - SHORTCUT_BUFFER
+        if length * 2 >= size:
+            budget = 0
+        to_food = size
+        if engine.food is not None:
+            to_food = self.distance(head, engine.cell_index(engine.food))
+            if to_food < to_tail:
+                budget -= 1  # eating grows the body by one
+
+        best = None
+        best_distance = 0
+        follow = None
+        for name, (dx, dy) in DIRECTIONS.items():
+            x, y = hx + dx, hy + dy
+            if not (0 <= x < width and 0 <= y < self.height):
+                continue
+            cell = y * width + x
+            if engine.occupied[cell]:
+                continue
+            d = self.distance(head, cell)
+            if d == 1:
+                follow = name
+            if d <= budget and d <= to_food and d > best_distance:
+                best, best_distance = name, d
+
+        if best is not None and best_distance > 1:
+            self.shortcuts += 1
+            return best
+        self.cycle_moves += 1
+        return follow if follow is not None else best
+
+
+class HamiltonianBot(SnakeBot):
+    """Tournament wrapper around HamiltonianSolver"""
+
+    name = "hamiltonian"
+
+    def reset(self, engine):
+        self.solver = HamiltonianSolver(engine)
+
+    def choose(self, engine):
+        if getattr(self, "solver", None) is None or self.solver.engine is not engine:
+            self.solver = HamiltonianSolver(engine)
+        return self.solver.choose()
+
+
+register_bot(HamiltonianBot.name, HamiltonianBot)
+
+
+def benchmark_fill(sizes=((10, 10), (25, 20), (40, 40)), seed: int = 0) -> List[Dict]:
+    """
+    Play until the board is full and time the solver and the engine per tick,
+    split by how full the board was, so late-game cost is visible.
+    """
+    results = []
+    for width, height in sizes:
+        engine = SnakeEngine(width, height, seed=seed)
+        solver = HamiltonianSolver(engine)
+        size = width * height
+        solver_max = {"early": 0.0, "late": 0.0}
+        step_max = {"early": 0.0, "late": 0.0}
+        solver_total = step_total = 0.0
+        start = time.perf_counter()
+        while engine.alive and engine.food is not None:
+            phase = "late" if len(engine.snake) * 10 >= size * 9 else "early"
+            t0 = time.perf_counter()
+            move = solver.choose()
+            t1 = time.perf_counter()
+            engine.step(move)
+            t2 = time.perf_counter()
+            solver_total += t1 - t0
+            step_total += t2 - t1
+            solver_max[phase] = max(solver_max[phase], t1 - t0)
+            step_max[phase] = max(step_max[phase], t2 - t1)
+        elapsed = time.perf_counter() - start
+        results.append({
+            "grid": f"{width}x{height}",
+            "filled": engine.alive and engine.food is None,
+            "length": len(engine.snake),
+            "ticks": engine.ticks,
+            "shortcuts": solver.shortcuts,
+            "solver_us_mean": solver_total / engine.ticks * 1e6,
+            "solver_us_max_early": solver_max["early"] * 1e6,
+            "solver_us_max_late": solver_max["late"] * 1e6,
+            "step_us_mean": step_total / engine.ticks * 1e6,
+            "step_us_max_late": step_max["late"] * 1e6,
+            "seconds": elapsed,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'grid':>7} {'filled':>6} {'ticks':>8} {'shortcuts':>9} {'solver':>9} "
+          f"{'max<90%':>9} {'max>=90%':>9} {'step':>8}")
+    for row in benchmark_fill():
+        print(
+            f"{row['grid']:>7} {str(row['filled']):>6} {row['ticks']:>8} {row['shortcuts']:>9} "
+            f"{row['solver_us_mean']:>8.1f}u {row['solver_us_max_early']:>8.1f}u "
+            f"{row['solver_us_max_late']:>8.1f}u {row['step_us_mean']:>7.1f}u"
+        )
@@ -0,0 +1,75 @@
+"""
+Snake Input - games/snake_input.py
+Bounded per-tick direction queue so quick key presses are not dropped
+"""
+
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
+from games.snake_engine import OPPOSITE_DIRECTIONS
+
+
+class DirectionInputQueue:
+    """
+    Key presses are queued with the time they arrived and consumed one per
+    logic tick, so "Up, Left" pressed inside one tick turns twice instead of
+    keeping only the last key.
+
+    Each press is validated against the last *queued* direction (or the
+    current heading when the queue is empty): repeats and reversals are
+    rejected, so a fast U-turn cannot reach the engine. Presses beyond
+    max_size are dropped rather than piling up lag.
+
+    applied() records how long the consumed press waited before the snake
+    actually moved on it; stats() summarises those latencies.
+    """
+
+    def __init__(self, max_size: int = 3, history: int = 240,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.max_size = max_size
+        self.clock = clock
+        self.pending: deque = deque()  # (direction, timestamp)
+        self.latencies = deque(maxlen=history)  # seconds from press to move
+
+        # Counters
+        self.accepted = 0
+        self.rejected = 0
+        self.dropped = 0
+
+    def push(self, direction: str, heading: str, timestamp: Optional[float] = None) -> bool:
+        """Queue a press; heading is the direction the snake currently moves in"""
+        last = self.pending[-1][0] if self.pending else heading
+        if direction == last or direction == OPPOSITE_DIRECTIONS.get(last):
+            self.rejected += 1
+            return False
+        if len(self.pending) >= self.max_size:
+            self.dropped += 1
+            return False
+        self.pending.append((direction, self.clock() if timestamp is None else timestamp))
+        self.accepted += 1
+        return True
+
+    def pop(self) -> Optional[Tuple[str, float]]:
+        """Oldest queued press, or None; call once per logic tick"""
+        return self.pending.popleft() if self.pending else None
+
+    def applied(self, timestamp: float):
+        """The press made at timestamp has just moved the snake"""
+        self.latencies.append(self.clock() - timestamp)
+
+    def clear(self):
+        self.pending.clear()
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Input-to-move latency and queue counters"""
+        latency_ms = sorted(l * 1000.0 for l in self.latencies)
+        return {
+            'accepted': self.accepted,
+            'rejected': self.rejected,
+            'dropped': self.dropped,
+            'queued': len(self.pending),
+            'latency_ms_mean': sum(latency_ms) / len(latency_ms) if latency_ms else None,
+            'latency_ms_p95': latency_ms[int(len(latency_ms) * 0.95)] if latency_ms else None,
+            'latency_ms_max': latency_ms[-1] if latency_ms else None,
+        }
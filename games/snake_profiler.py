@@ -0,0 +1,182 @@
+"""
+Snake Profiler - games/snake_profiler.py
+Per-frame timing of Snake logic and drawing, with an on-canvas overlay and CSV export
+"""
+
+import csv
+import os
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+PROFILE_FIELDS = [
+    "frame",
+    "time_s",
+    "ticks",
+    "logic_ms",
+    "render_ms",
+    "items_created",
+    "tick_rate",
+    "target_rate",
+]
+
+
+class SnakeProfiler:
+    """
+    Wraps the game loop's tick and render callbacks and keeps one record per
+    drawn frame in a ring buffer: logic time spent in the ticks since the
+    previous frame, render time, canvas items created, and the achieved tick
+    rate against the target from the engine's tick interval.
+
+    Timing is always on (a couple of perf_counter calls per callback); the
+    overlay text is only drawn while `enabled`, at most every
+    overlay_interval seconds so it does not skew what it measures.
+    """
+
+    def __init__(self, items_created: Callable[[], int], tick_interval: Callable[[], float],
+                 history: int = 600, overlay_interval: float = 0.25,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.items_created = items_created
+        self.tick_interval = tick_interval
+        self.clock = clock
+        self.overlay_interval = overlay_interval
+        self.records: deque = deque(maxlen=history)
+
+        self.enabled = False
+        self.canvas = None
+        self.overlay_item = None
+        self.overlay_updated = 0.0
+
+        self.started = clock()
+        self.frames = 0
+        self.pending_ticks = 0
+        self.pending_logic = 0.0
+        self.tick_times: deque = deque(maxlen=history)
+
+    def wrap_tick(self, tick: Callable[[], bool]) -> Callable[[], bool]:
+        def timed_tick():
+            start = self.clock()
+            keep_going = tick()
+            end = self.clock()
+            self.pending_logic += end - start
+            self.pending_ticks += 1
+            self.tick_times.append(end)
+            return keep_going
+        return timed_tick
+
+    def wrap_render(self, render: Callable[[], None]) -> Callable[[], None]:
+        def timed_render():
+            items_before = self.items_created()
+            start = self.clock()
+            render()
+            end = self.clock()
+            self.record(end, end - start, self.items_created() - items_before)
+        return timed_render
+
+    def record(self, now: float, render_time: float, items: int):
+        """Close the current frame and store it in the ring buffer"""
+        self.frames += 1
+        self.records.append({
+            "frame": self.frames,
+            "time_s": round(now - self.started, 6),
+            "ticks": self.pending_ticks,
+            "logic_ms": round(self.pending_logic * 1000.0, 4),
+            "render_ms": round(render_time * 1000.0, 4),
+            "items_created": items,
+            "tick_rate": self.tick_rate(),
+            "target_rate": round(1000.0 / self.tick_interval(), 3),
+        })
+        self.pending_ticks = 0
+        self.pending_logic = 0.0
+        if self.enabled and now - self.overlay_updated >= self.overlay_interval:
+            self.overlay_updated = now
+            self.draw_overlay()
+
+    def tick_rate(self, window: float = 1.0) -> Optional[float]:
+        """Ticks per second over the last `window` seconds of ticks"""
+        if len(self.tick_times) < 2:
+            return None
+        newest = self.tick_times[-1]
+        count = 0
+        oldest = newest
+        for stamp in reversed(self.tick_times):
+            if newest - stamp > window:
+                break
+            oldest = stamp
+            count += 1
+        if count < 2 or newest == oldest:
+            return None
+        return round((count - 1) / (newest - oldest), 3)
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Means and maxima over the frames in the ring buffer"""
+        if not self.records:
+            return {"frames": 0}
+        logic = [r["logic_ms"] for r in self.records]
+        render = [r["render_ms"] for r in self.records]
+        items = [r["items_created"] for r in self.records]
+        return {
+            "frames": len(self.records),
+            "logic_ms_mean": sum(logic) / len(logic),
+            "logic_ms_max": max(logic),
+            "render_ms_mean": sum(render) / len(render),
+            "render_ms_max": max(render),
+            "items_per_frame": sum(items) / len(items),
+            "tick_rate": self.records[-1]["tick_rate"],
+            "target_rate": self.records[-1]["target_rate"],
+        }
+
+    # ------------------------------------------------------------------ overlay
+
+    def attach(self, canvas):
+        """Draw the overlay on canvas (call again after the canvas is cleared)"""
+        self.canvas = canvas
+        self.overlay_item = None
+        if self.enabled:
+            self.draw_overlay()
+
+    def toggle(self) -> bool:
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.draw_overlay()
+        elif self.canvas is not None and self.overlay_item is not None:
+            self.canvas.itemconfig(self.overlay_item, state="hidden")
+        return self.enabled
+
+    def overlay_text(self) -> str:
+        stats = self.summary()
+        if not stats["frames"]:
+            return "profiler: waiting for frames"
+        rate = stats["tick_rate"]
+        achieved = f"{rate:.1f}" if rate is not None else "-"
+        return (
+            f"logic {stats['logic_ms_mean']:.2f} ms (max {stats['logic_ms_max']:.2f})\n"
+            f"render {stats['render_ms_mean']:.2f} ms (max {stats['render_ms_max']:.2f})\n"
+            f"items/frame {stats['items_per_frame']:.2f}\n"
+            f"ticks {achieved}/s (target {stats['target_rate']:.1f}/s)"
+        )
+
+    def draw_overlay(self):
+        if self.canvas is None:
+            return
+        if self.overlay_item is None:
+            height = int(self.canvas.cget("height"))
+            self.overlay_item = self.canvas.create_text(
+                8, height - 8, text="", anchor="sw", fill="#ffffff",
+                font=("Courier", 10), tags="profiler",
+            )
+        self.canvas.itemconfig(self.overlay_item, text=self.overlay_text(), state="normal")
+        self.canvas.tag_raise(self.overlay_item)
+
+    # ------------------------------------------------------------------ export
+
+    def dump_csv(self, path: str) -> str:
+        """Write the ring buffer to path as CSV and return the path"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=PROFILE_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.records)
+        return path
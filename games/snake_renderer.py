@@ -0,0 +1,305 @@
+"""
+Snake Renderer - games/snake_renderer.py
+Retained-mode Canvas renderer: items are created once and moved, not redrawn
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+POWER_UP_SYMBOLS = {
+    "speed_boost": "⚡",
+    "score_multiplier": "💎",
+}
+DEFAULT_POWER_UP_SYMBOL = "🍎"
+
+# Snake palette and cell size, shared by SnakeGame and the offline renderer
+CELL_SIZE = 20
+SNAKE_COLORS = {
+    "bg_primary": "#0f0f23",
+    "bg_secondary": "#1a1a2e",
+    "snake_head": "#00ff88",
+    "snake_body": "#00cc66",
+    "food": "#ff6b6b",
+    "wall": "#333333",
+    "grid": "#2a2a2a",
+    "text": "#ffffff",
+    "accent": "#ffd700",
+}
+
+
+class SnakeCanvasRenderer:
+    """
+    Keeps persistent canvas item IDs for the grid, snake, food, power-ups and
+    effect text. Each render() only touches cells that changed since the last
+    one: the tail segment is recycled as the new neck and the head is moved,
+    so frame cost is O(changed cells) rather than O(board + snake).
+
+    viewport=(cols, rows) shows only that window of a larger board. The
+    camera follows the head and re-centres once it comes within `margin`
+    cells of an edge. Only cells inside the viewport get canvas items, so
+    board size does not affect frame time.
+    """
+
+    def __init__(self, canvas, engine, cell_size: int, colors: Dict[str, str],
+                 viewport: Optional[Tuple[int, int]] = None, margin: int = 4):
+        self.canvas = canvas
+        self.engine = engine
+        self.cell_size = cell_size
+        self.colors = colors
+
+        cols, rows = viewport or (engine.grid_width, engine.grid_height)
+        self.view_cols = min(cols, engine.grid_width)
+        self.view_rows = min(rows, engine.grid_height)
+        self.margin = min(margin, self.view_cols // 4, self.view_rows // 4)
+        self.camera = (0, 0)  # top-left board cell shown on the canvas
+
+        self.head_items: Tuple[int, int, int] = ()
+        self.body_cells: Deque[Tuple[int, int]] = deque()  # mirror of snake[1:]
+        self.segment_items: Dict[Tuple[int, int], int] = {}  # visible segments only
+        self.spare_items: List[int] = []  # hidden segment items kept for reuse
+        self.food_item = None
+        self.food_marker = None
+        self.power_up_items: Dict[Tuple, Tuple[int, int]] = {}
+        self.effects_item = None
+        self.effects_text = ""
+        self.drawn_ticks = 0
+        self.drawn_food = None
+        self.items_created = 0  # Running total, handy for profiling
+
+        self.draw_static()
+        self.reset()
+
+    def _create(self, kind: str, *args, **kwargs) -> int:
+        self.items_created += 1
+        return getattr(self.canvas, f"create_{kind}")(*args, **kwargs)
+
+    def _visible(self, pos) -> bool:
+        cx, cy = self.camera
+        return cx <= pos[0] < cx + self.view_cols and cy <= pos[1] < cy + self.view_rows
+
+    def _cell_box(self, pos, inset: int):
+        x1 = (pos[0] - self.camera[0]) * self.cell_size
+        y1 = (pos[1] - self.camera[1]) * self.cell_size
+        return (
+            x1 + inset,
+            y1 + inset,
+            x1 + self.cell_size - inset,
+            y1 + self.cell_size - inset,
+        )
+
+    def draw_static(self):
+        """Draw the viewport grid lines; they never change so this runs once"""
+        width = self.view_cols * self.cell_size
+        height = self.view_rows * self.cell_size
+        for i in range(self.view_cols + 1):
+            x = i * self.cell_size
+            self._create("line", x, 0, x, height, fill=self.colors["grid"], width=1, tags="grid")
+        for i in range(self.view_rows + 1):
+            y = i * self.cell_size
+            self._create("line", 0, y, width, y, fill=self.colors["grid"], width=1, tags="grid")
+
+    def reset(self):
+        """Drop all dynamic items and rebuild them from the engine state"""
+        self.canvas.delete("dynamic")
+        self.head_items = ()
+        self.body_cells.clear()
+        self.segment_items.clear()
+        self.spare_items.clear()
+        self.power_up_items.clear()
+        self.effects_text = ""
+
+        self.food_item = self._create(
+            "oval", 0, 0, 0, 0,
+            fill=self.colors["food"], outline="darkred", width=2,
+            state="hidden", tags="dynamic",
+        )
+        self.drawn_food = None
+        # Small marker on the viewport edge pointing at off-screen food
+        self.food_marker = self._create(
+            "oval", 0, 0, 0, 0, fill=self.colors["food"], outline="",
+            state="hidden", tags="dynamic",
+        )
+        self.effects_item = self._create(
+            "text", 10, 10, text="", fill=self.colors["accent"],
+            font=("Arial", 10), anchor="nw", tags="dynamic",
+        )
+        self.head_items = (
+            self._create(
+                "oval", 0, 0, 0, 0,
+                fill=self.colors["snake_head"], outline=self.colors["text"], width=2,
+                tags="dynamic",
+            ),
+            self._create("oval", 0, 0, 0, 0, fill="white", tags="dynamic"),
+            self._create("oval", 0, 0, 0, 0, fill="white", tags="dynamic"),
+        )
+
+        self.body_cells.extend(list(self.engine.snake)[1:])
+        self._center_camera(self.engine.snake[0])
+        self._refresh_view()
+        self.drawn_ticks = self.engine.ticks
+        self.render()
+
+    def _segment_item(self, pos) -> int:
+        if self.spare_items:
+            item = self.spare_items.pop()
+            self.canvas.coords(item, *self._cell_box(pos, 1))
+            self.canvas.itemconfig(item, state="normal")
+            return item
+        return self._create(
+            "rectangle", *self._cell_box(pos, 1),
+            fill=self.colors["snake_body"], outline=self.colors["snake_head"], width=1,
+            tags="dynamic",
+        )
+
+    def _release_segment(self, pos):
+        item = self.segment_items.pop(pos, None)
+        if item is not None:
+            self.canvas.itemconfig(item, state="hidden")
+            self.spare_items.append(item)
+
+    def _move_head(self, pos):
+        x1, y1, x2, _ = self._cell_box(pos, 0)
+        head, left_eye, right_eye = self.head_items
+        eye_size = 3
+        self.canvas.coords(head, *self._cell_box(pos, 2))
+        self.canvas.coords(left_eye, x1 + 5, y1 + 5, x1 + 5 + eye_size, y1 + 5 + eye_size)
+        self.canvas.coords(right_eye, x2 - 8, y1 + 5, x2 - 8 + eye_size, y1 + 5 + eye_size)
+
+    # ------------------------------------------------------------------ camera
+
+    def _center_camera(self, pos):
+        cx = pos[0] - self.view_cols // 2
+        cy = pos[1] - self.view_rows // 2
+        self.camera = (
+            max(0, min(cx, self.engine.grid_width - self.view_cols)),
+            max(0, min(cy, self.engine.grid_height - self.view_rows)),
+        )
+
+    def _follow(self, head) -> bool:
+        """Re-centre on the head if it is near a viewport edge; True if the camera moved"""
+        cx, cy = self.camera
+        x, y = head[0] - cx, head[1] - cy
+        if (self.margin <= x < self.view_cols - self.margin
+                and self.margin <= y < self.view_rows - self.margin):
+            return False
+        old = self.camera
+        self._center_camera(head)
+        return self.camera != old
+
+    def _refresh_view(self):
+        """Re-place everything after a camera move; O(viewport), not O(board)"""
+        for pos in list(self.segment_items):
+            self._release_segment(pos)
+        occupied, width = self.engine.occupied, self.engine.grid_width
+        head = self.engine.snake[0]
+        cx, cy = self.camera
+        for y in range(cy, cy + self.view_rows):
+            row = y * width
+            for x in range(cx, cx + self.view_cols):
+                if occupied[row + x] and (x, y) != head:
+                    self.segment_items[(x, y)] = self._segment_item((x, y))
+        self._move_head(head)
+        self.drawn_food = ()  # force food and power-ups to be re-placed
+        for key in list(self.power_up_items):
+            for item in self.power_up_items.pop(key):
+                self.canvas.delete(item)
+
+    # ------------------------------------------------------------------ render
+
+    def render(self):
+        """Bring the canvas in line with the engine, touching only what changed"""
+        self._render_snake()
+        self._render_food()
+        self._render_power_ups()
+        self._render_effects()
+
+    def _render_snake(self):
+        snake = self.engine.snake
+        moved = self.engine.ticks - self.drawn_ticks
+        if moved == 0:
+            return
+        if moved < 0 or moved >= len(snake):
+            # Engine was reset or jumped further than the body is long
+            self.body_cells.clear()
+            self.body_cells.extend(list(snake)[1:])
+            self._center_camera(snake[0])
+            self._refresh_view()
+            self.drawn_ticks = self.engine.ticks
+            return
+
+        # Tail cells the body has left since the last frame
+        while len(self.body_cells) > len(snake) - 1 - moved:
+            self._release_segment(self.body_cells.pop())
+        # The first `moved` body cells are new; spare items are reused for them
+        for i in range(moved, 0, -1):
+            pos = snake[i]
+            self.body_cells.appendleft(pos)
+            if self._visible(pos):
+                self.segment_items[pos] = self._segment_item(pos)
+
+        if self._follow(snake[0]):
+            self._refresh_view()
+        else:
+            self._move_head(snake[0])
+        self.drawn_ticks = self.engine.ticks
+
+    def _render_food(self):
+        food = self.engine.food
+        if food == self.drawn_food:
+            return
+        self.drawn_food = food
+        if food is None:
+            self.canvas.itemconfig(self.food_item, state="hidden")
+            self.canvas.itemconfig(self.food_marker, state="hidden")
+        elif self._visible(food):
+            self.canvas.coords(self.food_item, *self._cell_box(food, 2))
+            self.canvas.itemconfig(self.food_item, state="normal")
+            self.canvas.itemconfig(self.food_marker, state="hidden")
+        else:
+            # Pin a marker to the nearest viewport edge cell
+            cx, cy = self.camera
+            edge = (
+                max(cx, min(food[0], cx + self.view_cols - 1)),
+                max(cy, min(food[1], cy + self.view_rows - 1)),
+            )
+            self.canvas.itemconfig(self.food_item, state="hidden")
+            self.canvas.coords(self.food_marker, *self._cell_box(edge, 6))
+            self.canvas.itemconfig(self.food_marker, state="normal")
+
+    def _render_power_ups(self):
+        current = {
+            (pos, pu["type"]) for pos, pu in self.engine.power_ups.items() if self._visible(pos)
+        }
+        for key in [key for key in self.power_up_items if key not in current]:
+            for item in self.power_up_items.pop(key):
+                self.canvas.delete(item)
+        for key in current:
+            if key in self.power_up_items:
+                continue
+            pos, power_type = key
+            color = self.engine.power_up_types[power_type]["color"]
+            x1, y1, _, _ = self._cell_box(pos, 0)
+            rect = self._create(
+                "rectangle", *self._cell_box(pos, 3),
+                fill=color, outline="white", width=2, tags="dynamic",
+            )
+            text = self._create(
+                "text",
+                x1 + self.cell_size // 2,
+                y1 + self.cell_size // 2,
+                text=POWER_UP_SYMBOLS.get(power_type, DEFAULT_POWER_UP_SYMBOL),
+                fill="white", font=("Arial", 8), tags="dynamic",
+            )
+            self.power_up_items[key] = (rect, text)
+
+    def _render_effects(self):
+        effects = []
+        if self.engine.active_effects["speed_boost"] > 0:
+            effects.append("⚡ Speed Boost")
+        if self.engine.active_effects["double_score"] > 0:
+            effects.append("💎 Double Score")
+        text = " | ".join(effects)
+        if text != self.effects_text:
+            self.canvas.itemconfig(self.effects_item, text=text)
+            self.canvas.tag_raise(self.effects_item)
+            self.effects_text = text
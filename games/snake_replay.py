@@ -0,0 +1,172 @@
+"""
+Snake Replay - games/snake_replay.py
+Compact, verifiable replays: the game seed plus a run-length-encoded log of
+the direction the snake moved in on every tick
+
+Binary layout (little endian):
+    b"SNKR" | version u8 | grid_width u16 | grid_height u16 | seed u64
+    | steps u32 | claimed score u32 | runs...
+
+Each run is one varint holding (run_length << 2) | direction_code, so a
+straight line of any length costs one or two bytes.
+"""
+
+import base64
+import struct
+import time
+from typing import Dict, List, Optional, Tuple
+
+from games.snake_engine import SnakeEngine
+
+MAGIC = b"SNKR"
+VERSION = 1
+HEADER = struct.Struct("<4sBHHQII")
+
+DIRECTION_CODES = {"Up": 0, "Down": 1, "Left": 2, "Right": 3}
+CODE_DIRECTIONS = {code: name for name, code in DIRECTION_CODES.items()}
+
+
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated replay data")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class SnakeReplay:
+    """Seed, board size, per-tick directions (as runs) and the claimed score"""
+
+    def __init__(self, seed: int, grid_width: int = 25, grid_height: int = 20,
+                 runs: Optional[List[List]] = None, score: int = 0):
+        self.seed = seed
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.runs: List[List] = runs or []  # [direction, count] pairs
+        self.score = score
+
+    @property
+    def steps(self) -> int:
+        return sum(count for _, count in self.runs)
+
+    def append(self, direction: str):
+        if self.runs and self.runs[-1][0] == direction:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([direction, 1])
+
+    def directions(self):
+        """Yield the direction of every tick in order"""
+        for direction, count in self.runs:
+            for _ in range(count):
+                yield direction
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(
+            HEADER.pack(MAGIC, VERSION, self.grid_width, self.grid_height,
+                        self.seed, self.steps, self.score)
+        )
+        for direction, count in self.runs:
+            _write_varint(out, (count << 2) | DIRECTION_CODES[direction])
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SnakeReplay":
+        if len(data) < HEADER.size:
+            raise ValueError("Replay data too short")
+        magic, version, width, height, seed, steps, score = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a snake replay (bad magic or version)")
+
+        runs = []
+        offset = HEADER.size
+        while offset < len(data):
+            value, offset = _read_varint(data, offset)
+            runs.append([CODE_DIRECTIONS[value & 3], value >> 2])
+        replay = cls(seed, width, height, runs, score)
+        if replay.steps != steps:
+            raise ValueError(f"Replay says {steps} steps but holds {replay.steps}")
+        return replay
+
+    def to_string(self) -> str:
+        """Text form for JSON files or a score entry's additional_data"""
+        return base64.urlsafe_b64encode(self.to_bytes()).decode("ascii")
+
+    @classmethod
+    def from_string(cls, text: str) -> "SnakeReplay":
+        return cls.from_bytes(base64.urlsafe_b64decode(text.encode("ascii")))
+
+
+class ReplayRecorder:
+    """Records the direction the engine moved in after every step()"""
+
+    def __init__(self, engine: SnakeEngine):
+        self.engine = engine
+        self.start()
+
+    def start(self):
+        """Begin a new recording; call right after engine.reset()"""
+        if self.engine.seed is None:
+            raise ValueError("Replays need a seeded engine (no external rng)")
+        self.replay = SnakeReplay(self.engine.seed, self.engine.grid_width, self.engine.grid_height)
+
+    def step(self, action: Optional[str] = None) -> Dict:
+        """engine.step() plus recording"""
+        result = self.engine.step(action)
+        self.record()
+        return result
+
+    def record(self):
+        """Log the tick the engine just ran"""
+        self.replay.append(self.engine.direction)
+
+    def finish(self) -> SnakeReplay:
+        self.replay.score = self.engine.score
+        return self.replay
+
+
+def verify_replay(replay: SnakeReplay) -> Dict:
+    """
+    Re-simulate a replay headlessly and check it against its claimed score.
+    A replay is invalid if it asks for an illegal move (a reversal), keeps
+    going after the snake died, or ends with a different score.
+    """
+    engine = SnakeEngine(replay.grid_width, replay.grid_height, seed=replay.seed)
+    start = time.perf_counter()
+    steps = 0
+    error = None
+    for direction in replay.directions():
+        if not engine.alive:
+            error = f"Input continues after game over at step {steps}"
+            break
+        engine.step(direction)
+        steps += 1
+        if engine.direction != direction:
+            error = f"Illegal direction {direction} at step {steps}"
+            break
+
+    if error is None and engine.score != replay.score:
+        error = f"Claimed score {replay.score} but replay scores {engine.score}"
+
+    return {
+        'valid': error is None,
+        'error': error,
+        'score': engine.score,
+        'level': engine.level,
+        'ticks': engine.ticks,
+        'steps': steps,
+        'alive': engine.alive,
+        'verify_seconds': time.perf_counter() - start,
+    }
@@ -0,0 +1,262 @@
+"""
+Snake Tournament - games/snake_tournament.py
+Runs many headless Snake games across all cores and compares bot policies
+
+Usage:
+    python -m games.snake_tournament --policies greedy bfs random --games 500
+    python -m games.snake_tournament --policies bfs --power-up speed_boost.points=40
+    python -m games.snake_tournament --policies mybots.snake:MyBot --save-scores
+    python -m games.snake_tournament --check
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from games.snake_bots import BOT_POLICIES, load_bot
+from games import snake_autopilot, snake_hamiltonian  # noqa: F401  register "autopilot" and "hamiltonian"
+from games.snake_engine import POWER_UP_TYPES, SnakeEngine
+
+def default_max_ticks(width: int, height: int) -> int:
+    """
+    Tick limit that lets a perfect game fill the board: each food can take
+    up to a board's worth of ticks (a full 25x20 Hamiltonian game is ~38k)
+    """
+    cells = width * height
+    return max(20000, cells * cells // 2)
+
+
+# Leaderboard bot results are saved under, apart from the player's "snake" scores
+BOT_SCORE_GAME_ID = "snake_bots"
+
+
+def run_game(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Play one game to the end and return a ScoreManager-style record:
+    score, player, date and additional_data. Top-level so it pickles
+    for ProcessPoolExecutor.
+    """
+    engine = SnakeEngine(job["width"], job["height"], seed=job["seed"])
+    for name, overrides in job.get("power_up_overrides", {}).items():
+        engine.power_up_types[name].update(overrides)
+    engine.reset(job["seed"])
+
+    bot = load_bot(job["policy"], rng=random.Random(job["seed"] + 1))
+    bot.reset(engine)
+
+    max_ticks = job["max_ticks"]
+    max_idle = job["max_idle_ticks"]
+    idle = 0
+    power_ups = Counter()
+    result = {"alive": True}
+    # food is None once the snake fills the board: stop before it runs into itself
+    while engine.food is not None and engine.ticks < max_ticks and idle < max_idle:
+        result = engine.step(bot.choose(engine))
+        if not result["alive"]:
+            break
+        idle = 0 if result["ate_food"] else idle + 1
+        if result["power_up"]:
+            power_ups[result["power_up"]] += 1
+
+    if not result["alive"]:
+        end_reason = "collision"
+    elif engine.food is None:
+        end_reason = "board_full"
+    elif idle >= max_idle:
+        end_reason = "starved"
+    else:
+        end_reason = "tick_limit"
+
+    return {
+        "score": engine.score,
+        "player": f"bot:{job['policy']}",
+        "date": datetime.now(timezone.utc).isoformat(),
+        "additional_data": {
+            "policy": job["policy"],
+            "seed": job["seed"],
+            "level": engine.level,
+            "length": len(engine.snake),
+            "ticks": engine.ticks,
+            "end_reason": end_reason,
+            "power_ups": dict(power_ups),
+            "grid": f"{job['width']}x{job['height']}",
+        },
+    }
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Score and level distributions per policy"""
+    by_policy: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        by_policy.setdefault(record["additional_data"]["policy"], []).append(record)
+
+    summary = {}
+    for policy, games in by_policy.items():
+        scores = sorted(r["score"] for r in games)
+        deciles = statistics.quantiles(scores, n=10) if len(scores) > 1 else [scores[0]] * 9
+        summary[policy] = {
+            "games": len(games),
+            "score_mean": statistics.fmean(scores),
+            "score_median": statistics.median(scores),
+            "score_p10": deciles[0],
+            "score_p90": deciles[-1],
+            "score_max": scores[-1],
+            "ticks_mean": statistics.fmean(r["additional_data"]["ticks"] for r in games),
+            "levels": dict(sorted(Counter(r["additional_data"]["level"] for r in games).items())),
+            "end_reasons": dict(Counter(r["additional_data"]["end_reason"] for r in games)),
+        }
+    return summary
+
+
+def parse_power_up_overrides(values: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Turn ["speed_boost.points=40"] into {"speed_boost": {"points": 40}}"""
+    overrides: Dict[str, Dict[str, Any]] = {}
+    for value in values:
+        try:
+            key, raw = value.split("=", 1)
+            name, field = key.split(".", 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Expected TYPE.FIELD=VALUE, got '{value}'")
+        if name not in POWER_UP_TYPES:
+            raise argparse.ArgumentTypeError(f"Unknown power-up type '{name}'")
+        try:
+            parsed: Any = int(raw)
+        except ValueError:
+            parsed = raw
+        overrides.setdefault(name, {})[field] = parsed
+    return overrides
+
+
+def run_tournament(policies: List[str], games: int, width: int = 25, height: int = 20,
+                   seed: int = 0, workers: Optional[int] = None, max_ticks: Optional[int] = None,
+                   max_idle_ticks: Optional[int] = None,
+                   power_up_overrides: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    """Play `games` games per policy (same seeds for every policy) and return the records"""
+    jobs = [
+        {
+            "policy": policy,
+            "seed": seed + i,
+            "width": width,
+            "height": height,
+            "max_ticks": max_ticks or default_max_ticks(width, height),
+            "max_idle_ticks": max_idle_ticks or width * height * 2,
+            "power_up_overrides": power_up_overrides or {},
+        }
+        for policy in policies
+        for i in range(games)
+    ]
+
+    if workers == 1:
+        return [run_game(job) for job in jobs]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_game, jobs, chunksize=chunksize))
+
+
+def save_to_score_manager(records: List[Dict[str, Any]], data_dir: str,
+                          game_id: str = BOT_SCORE_GAME_ID) -> int:
+    """
+    Store records under game_id in one ScoreManager save, without awarding
+    player achievements; returns how many made the top 10
+    """
+    from utils.score_manager import ScoreManager
+
+    manager = ScoreManager(data_dir)
+    return manager.add_scores(game_id, records, award_achievements=False)
+
+
+def check_board_full(sizes=((7, 6), (6, 6), (8, 5)), seeds: int = 3) -> List[str]:
+    """
+    Hamiltonian games on small boards must end as "board_full" with the
+    snake covering every cell; returns a description of each failure
+    """
+    failures = []
+    for width, height in sizes:
+        for seed in range(seeds):
+            record = run_game({
+                "policy": "hamiltonian",
+                "seed": seed,
+                "width": width,
+                "height": height,
+                "max_ticks": default_max_ticks(width, height),
+                "max_idle_ticks": width * height * 2,
+            })
+            data = record["additional_data"]
+            if data["end_reason"] != "board_full" or data["length"] != width * height:
+                failures.append(f"{width}x{height} seed {seed}: {data['end_reason']}, length {data['length']}")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run headless Snake bot tournaments")
+    parser.add_argument("--policies", nargs="+", default=sorted(BOT_POLICIES),
+                        help="registry names or module:Class plugin paths")
+    parser.add_argument("--games", type=int, default=100, help="games per policy")
+    parser.add_argument("--width", type=int, default=25)
+    parser.add_argument("--height", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--max-ticks", type=int, default=None,
+                        help="tick limit per game (default: enough to fill the board)")
+    parser.add_argument("--max-idle-ticks", type=int, default=None,
+                        help="end a game after this many ticks without food (default 2x board)")
+    parser.add_argument("--power-up", action="append", default=[], metavar="TYPE.FIELD=VALUE",
+                        help="override a power_up_types entry, e.g. speed_boost.points=40")
+    parser.add_argument("--output", help="write summary and records as JSON")
+    parser.add_argument("--save-scores", action="store_true",
+                        help=f"also record the games on the '{BOT_SCORE_GAME_ID}' leaderboard")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--check", action="store_true",
+                        help="verify that filled boards end as board_full, then exit")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        failures = check_board_full()
+        for failure in failures:
+            print(f"FAIL {failure}")
+        print("board_full check: " + ("FAILED" if failures else "ok"))
+        return 1 if failures else 0
+
+    try:
+        for policy in args.policies:
+            load_bot(policy)
+        overrides = parse_power_up_overrides(args.power_up)
+    except (ValueError, ImportError, AttributeError, argparse.ArgumentTypeError) as e:
+        parser.error(str(e))
+
+    records = run_tournament(
+        args.policies, args.games, args.width, args.height, args.seed, args.workers,
+        args.max_ticks, args.max_idle_ticks, overrides,
+    )
+    summary = summarize(records)
+
+    print(f"{'policy':<16}{'games':>7}{'mean':>9}{'median':>9}{'p10':>8}{'p90':>8}{'max':>8}  levels")
+    for policy, stats in summary.items():
+        levels = " ".join(f"L{level}:{count}" for level, count in stats["levels"].items())
+        print(
+            f"{policy:<16}{stats['games']:>7}{stats['score_mean']:>9.1f}{stats['score_median']:>9.1f}"
+            f"{stats['score_p10']:>8.1f}{stats['score_p90']:>8.1f}{stats['score_max']:>8}  {levels}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"summary": summary, "records": records}, f, indent=2, default=str)
+        print(f"Results written to {args.output}")
+
+    if args.save_scores:
+        high_scores = save_to_score_manager(records, args.data_dir)
+        print(f"Saved {len(records)} scores ({high_scores} made the top 10)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
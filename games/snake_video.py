@@ -0,0 +1,320 @@
+"""
+Snake Video - games/snake_video.py
+Renders Snake replays to image sequences or raw video without Tk
+
+Requires numpy. Frames are drawn into one RGB buffer with the live game's
+palette and cell size, so the board matches what SnakeCanvasRenderer shows.
+Only cells that changed since the previous tick are repainted, from
+pre-rendered cell tiles.
+
+Text is not drawn, since that would need a font rasterizer: power-up cells
+appear as their colored squares without the ⚡/💎/🍎 symbol, and the active
+effects line (Speed Boost | Double Score) is left out.
+
+Usage:
+    python -m games.snake_video REPLAY --out frames/ --format png
+    python -m games.snake_video replay.txt --out game.rgb --format raw
+
+REPLAY is a replay string (SnakeReplay.to_string) or a file containing one.
+Raw output is packed rgb24, playable with
+    ffplay -f rawvideo -pixel_format rgb24 -video_size WxH game.rgb
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+import zlib
+from typing import Dict, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from games.snake_engine import SnakeEngine
+from games.snake_renderer import CELL_SIZE, SNAKE_COLORS
+from games.snake_replay import SnakeReplay
+
+FORMATS = ("png", "ppm", "raw")
+
+# Tk color names used by the canvas renderer
+NAMED_COLORS = {
+    "white": (255, 255, 255),
+    "darkred": (139, 0, 0),
+}
+
+
+def parse_color(color: str) -> Tuple[int, int, int]:
+    """'#rrggbb' or a Tk color name used by the game -> (r, g, b)"""
+    if color in NAMED_COLORS:
+        return NAMED_COLORS[color]
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def write_ppm(path: str, frame) -> None:
+    height, width, _ = frame.shape
+    with open(path, "wb") as f:
+        f.write(b"P6\n%d %d\n255\n" % (width, height))
+        f.write(frame.tobytes())
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def write_png(path: str, frame, level: int = 1) -> None:
+    """Minimal truecolor PNG writer; every row uses the Up filter (type 2)"""
+    height, width, _ = frame.shape
+    flat = frame.reshape(height, width * 3)
+    rows = np.empty((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 0] = 2
+    rows[0, 1:] = flat[0]
+    # Board rows repeat cell after cell, so row differences are mostly zero
+    np.subtract(flat[1:], flat[:-1], out=rows[1:, 1:])
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(_png_chunk(b"IDAT", zlib.compress(rows.tobytes(), level)))
+        f.write(_png_chunk(b"IEND", b""))
+
+
+class SnakeFrameRenderer:
+    """
+    Keeps an (H*cell, W*cell, 3) uint8 frame in step with a SnakeEngine.
+
+    Each update() repaints the old head as body, the vacated tail as empty
+    board, and the head, food and power-up cells; any other change (reset,
+    skipped ticks) falls back to a full redraw.
+    """
+
+    def __init__(self, engine: SnakeEngine, cell_size: int = CELL_SIZE,
+                 colors: Optional[Dict[str, str]] = None):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("SnakeFrameRenderer requires numpy (pip install numpy)")
+
+        self.engine = engine
+        self.cell_size = cell_size
+        self.colors = colors or SNAKE_COLORS
+        width, height = engine.grid_width, engine.grid_height
+        self.frame = np.zeros((height * cell_size, width * cell_size, 3), dtype=np.uint8)
+        # Same memory viewed as [cell_y, pixel_y, cell_x, pixel_x, rgb]
+        self.cells = self.frame.reshape(height, cell_size, width, cell_size, 3)
+        self.tiles = self._build_tiles()
+
+        self.drawn_ticks = -1
+        self.head = None
+        self.tail = None
+        self.overlay: Dict[Tuple[int, int], str] = {}
+        self.redraw()
+
+    # ------------------------------------------------------------------ tiles
+
+    def _build_tiles(self) -> Dict[str, "np.ndarray"]:
+        cs = self.cell_size
+        c = self.colors
+        background = np.empty((cs, cs, 3), dtype=np.uint8)
+        background[:] = parse_color(c["bg_primary"])
+        # Canvas grid lines sit on each cell's top and left edge
+        background[0, :] = parse_color(c["grid"])
+        background[:, 0] = parse_color(c["grid"])
+
+        centre = np.arange(cs) + 0.5
+        ys, xs = np.meshgrid(centre, centre, indexing="ij")
+
+        def rect(x1, y1, x2, y2):
+            return (xs >= x1) & (xs < x2) & (ys >= y1) & (ys < y2)
+
+        def oval(x1, y1, x2, y2):
+            rx, ry = (x2 - x1) / 2.0, (y2 - y1) / 2.0
+            if rx <= 0 or ry <= 0:
+                return np.zeros((cs, cs), dtype=bool)
+            return ((xs - x1 - rx) / rx) ** 2 + ((ys - y1 - ry) / ry) ** 2 <= 1.0
+
+        def shape(kind, inset, fill, outline=None, outline_width=0):
+            tile = background.copy()
+            outer = kind(inset, inset, cs - inset, cs - inset)
+            tile[outer] = parse_color(fill)
+            if outline and outline_width:
+                w = outline_width
+                inner = kind(inset + w, inset + w, cs - inset - w, cs - inset - w)
+                tile[outer & ~inner] = parse_color(outline)
+            return tile
+
+        tiles = {
+            "empty": background,
+            "body": shape(rect, 1, c["snake_body"], c["snake_head"], 1),
+            "food": shape(oval, 2, c["food"], "darkred", 2),
+        }
+        head = shape(oval, 2, c["snake_head"], c["text"], 2)
+        eye = 3
+        head[oval(5, 5, 5 + eye, 5 + eye)] = parse_color("white")
+        head[oval(cs - 8, 5, cs - 8 + eye, 5 + eye)] = parse_color("white")
+        tiles["head"] = head
+        for name, data in self.engine.power_up_types.items():
+            tiles[f"power_up:{name}"] = shape(rect, 3, data["color"], "white", 2)
+        return tiles
+
+    # ------------------------------------------------------------------ drawing
+
+    def _paint(self, pos, tile: str):
+        self.cells[pos[1], :, pos[0], :] = self.tiles[tile]
+
+    def _current_overlay(self) -> Dict[Tuple[int, int], str]:
+        overlay = {pos: f"power_up:{pu['type']}" for pos, pu in self.engine.power_ups.items()}
+        if self.engine.food is not None:
+            overlay[self.engine.food] = "food"
+        overlay[self.engine.snake[0]] = "head"
+        return overlay
+
+    def redraw(self):
+        """Paint the whole board from the engine state"""
+        engine = self.engine
+        self.cells[:] = self.tiles["empty"][None, :, None, :, :]
+        body = list(engine.snake)[1:]
+        if body:
+            xs = np.fromiter((x for x, _ in body), dtype=np.intp, count=len(body))
+            ys = np.fromiter((y for _, y in body), dtype=np.intp, count=len(body))
+            self.cells[ys, :, xs, :] = self.tiles["body"]
+        self.overlay = self._current_overlay()
+        for pos, tile in self.overlay.items():
+            self._paint(pos, tile)
+        self.head, self.tail = engine.snake[0], engine.snake[-1]
+        self.drawn_ticks = engine.ticks
+
+    def update(self):
+        """Bring the frame up to date with the engine; returns the frame"""
+        engine = self.engine
+        moved = engine.ticks - self.drawn_ticks
+        if moved == 0:
+            return self.frame
+        if moved != 1:
+            self.redraw()
+            return self.frame
+
+        overlay = self._current_overlay()
+        for pos in self.overlay:
+            if pos not in overlay:
+                self._paint(pos, "body" if engine.is_occupied(*pos) else "empty")
+        self._paint(self.head, "body")
+        if not engine.is_occupied(*self.tail):
+            self._paint(self.tail, "empty")
+        for pos, tile in overlay.items():
+            self._paint(pos, tile)
+
+        self.overlay = overlay
+        self.head, self.tail = engine.snake[0], engine.snake[-1]
+        self.drawn_ticks = engine.ticks
+        return self.frame
+
+
+def render_replay(replay: SnakeReplay, out: str, fmt: str = "png",
+                  cell_size: int = CELL_SIZE, colors: Optional[Dict[str, str]] = None,
+                  every: int = 1, png_level: int = 1) -> Dict:
+    """
+    Replay a game and write one frame per `every` ticks (plus the first and
+    last). Image formats write out/frame_00000.png etc.; "raw" writes every
+    frame into the single file `out`. Returns frame count, size and timing;
+    speedup is game time over render time.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}', expected one of {', '.join(FORMATS)}")
+
+    engine = SnakeEngine(replay.grid_width, replay.grid_height, seed=replay.seed)
+    renderer = SnakeFrameRenderer(engine, cell_size, colors)
+    height, width, _ = renderer.frame.shape
+
+    raw_file = None
+    if fmt == "raw":
+        directory = os.path.dirname(out)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        raw_file = open(out, "wb")
+    else:
+        os.makedirs(out, exist_ok=True)
+
+    frames = 0
+
+    def emit(frame):
+        nonlocal frames
+        if raw_file is not None:
+            raw_file.write(frame.tobytes())
+        elif fmt == "png":
+            write_png(os.path.join(out, f"frame_{frames:05d}.png"), frame, png_level)
+        else:
+            write_ppm(os.path.join(out, f"frame_{frames:05d}.ppm"), frame)
+        frames += 1
+
+    start = time.perf_counter()
+    game_ms = 0
+    steps = replay.steps
+    try:
+        emit(renderer.update())
+        for step, direction in enumerate(replay.directions(), 1):
+            if not engine.alive:
+                break
+            game_ms += engine.tick_interval()
+            engine.step(direction)
+            if step % every == 0 or step == steps or not engine.alive:
+                emit(renderer.update())
+    finally:
+        if raw_file is not None:
+            raw_file.close()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "frames": frames,
+        "width": width,
+        "height": height,
+        "format": fmt,
+        "path": out,
+        "score": engine.score,
+        "render_seconds": elapsed,
+        "game_seconds": game_ms / 1000.0,
+        "speedup": (game_ms / 1000.0) / elapsed if elapsed > 0 else None,
+    }
+
+
+def load_replay(value: str) -> SnakeReplay:
+    """Replay from a string, or from a file holding the string"""
+    if os.path.isfile(value):
+        with open(value) as f:
+            value = f.read().strip()
+    return SnakeReplay.from_string(value)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render a Snake replay to images or raw video")
+    parser.add_argument("replay", help="replay string or a file containing one")
+    parser.add_argument("--out", required=True, help="output directory (png/ppm) or file (raw)")
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("--cell-size", type=int, default=CELL_SIZE)
+    parser.add_argument("--every", type=int, default=1, help="write every Nth tick")
+    args = parser.parse_args(argv)
+
+    if not NUMPY_AVAILABLE:
+        parser.error("numpy is required (pip install numpy)")
+    try:
+        replay = load_replay(args.replay)
+    except (ValueError, OSError) as e:
+        parser.error(f"Could not read replay: {e}")
+
+    stats = render_replay(replay, args.out, args.format, args.cell_size, every=max(1, args.every))
+    print(
+        f"{stats['frames']} frames ({stats['width']}x{stats['height']}) in "
+        f"{stats['render_seconds']:.2f}s, {stats['speedup']:.0f}x real time -> {stats['path']}"
+    )
+    if args.format == "raw":
+        print(
+            f"Play with: ffplay -f rawvideo -pixel_format rgb24 "
+            f"-video_size {stats['width']}x{stats['height']} {stats['path']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
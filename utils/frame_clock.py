@@ -0,0 +1,325 @@
+"""
+Shared frame clock for Ultimate Gaming Platform
+One Tk after() loop runs every game timer from a deadline heap, so timers
+can be paused, cancelled and measured in one place
+"""
+
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+Period = Union[float, Callable[[], float]]
+
+# Timers due this close to a wake-up run in the same frame (seconds)
+FRAME_SLACK = 0.001
+
+
+class ClockTimer:
+    """One subscription: a deadline, and a period in ms for repeating timers"""
+
+    __slots__ = ("deadline", "period", "callback", "client", "token", "remaining")
+
+    def __init__(self, deadline: float, period: Optional[Period], callback: Callable, client):
+        self.deadline = deadline
+        self.period = period
+        self.callback = callback
+        self.client = client
+        self.token = None  # matches the live heap entry; None once cancelled
+        self.remaining = None  # seconds left, while the client is paused
+
+    def period_seconds(self) -> float:
+        period = self.period() if callable(self.period) else self.period
+        return max(period, 1) / 1000.0
+
+
+class ClockClient:
+    """
+    A game's view of the FrameClock. after()/after_cancel() match the Tk
+    widget methods, so it can stand in for a widget (e.g. FixedTimestepLoop).
+    """
+
+    def __init__(self, frame_clock: "FrameClock", name: str):
+        self.frame_clock = frame_clock
+        self.name = name
+        self.timers: Set[ClockTimer] = set()
+        self.paused = False
+
+    def after(self, delay_ms: float, callback: Callable) -> ClockTimer:
+        """Run callback once, delay_ms from now"""
+        return self.frame_clock.schedule(self, delay_ms, callback)
+
+    def at(self, deadline: float, callback: Callable) -> ClockTimer:
+        """Run callback once when the clock reaches deadline (seconds, clock() time base)"""
+        return self.frame_clock.schedule(self, (deadline - self.frame_clock.clock()) * 1000, callback)
+
+    def every(self, period_ms: Period, callback: Callable, delay_ms: Optional[float] = None) -> ClockTimer:
+        """
+        Run callback every period_ms (a number or a callable returning one)
+        until it returns False or is cancelled. The first call is one period
+        from now unless delay_ms is given.
+        """
+        return self.frame_clock.schedule(self, delay_ms, callback, period=period_ms)
+
+    def after_cancel(self, timer: Optional[ClockTimer]):
+        if timer is not None:
+            self.frame_clock.cancel(timer)
+
+    cancel = after_cancel
+
+    def cancel_all(self):
+        for timer in list(self.timers):
+            self.frame_clock.cancel(timer)
+
+    def close(self):
+        """Cancel every timer and unregister from the clock (game teardown)"""
+        self.cancel_all()
+        self.frame_clock.remove_client(self)
+
+    def pause(self):
+        """Hold every timer of this client, keeping the time each had left"""
+        if self.paused:
+            return
+        self.paused = True
+        now = self.frame_clock.clock()
+        for timer in self.timers:
+            timer.remaining = max(0.0, timer.deadline - now)
+            timer.token = None  # drop the heap entry; resume() pushes a new one
+
+    def resume(self):
+        if not self.paused:
+            return
+        self.paused = False
+        now = self.frame_clock.clock()
+        for timer in self.timers:
+            timer.deadline = now + (timer.remaining or 0.0)
+            timer.remaining = None
+            self.frame_clock._push(timer)
+        self.frame_clock._arm()
+
+
+class FrameClock:
+    """
+    Owns a single pending widget.after() callback, always set for the
+    earliest deadline across all clients. Each wake-up is one frame: every
+    timer that is due runs, then the callback is re-armed.
+
+    Repeating timers keep fixed-timestep deadlines (deadline += period); a
+    timer more than a period behind is re-anchored on the current time
+    instead of running a burst. A callback returning False ends its timer.
+
+    Cancelling is lazy: heap entries carry a token that stops matching the
+    timer once it is cancelled or rescheduled, and are discarded when popped.
+    """
+
+    def __init__(self, widget, history: int = 240, clock: Callable[[], float] = time.perf_counter):
+        self.widget = widget
+        self.clock = clock
+        self.heap: List = []
+        self.tokens = itertools.count()
+        self.clients: List[ClockClient] = []
+        self.callback_id = None
+        self.wake_at: Optional[float] = None
+        self.paused_at: Optional[float] = None
+
+        # Stats
+        self.frames = 0
+        self.callbacks = 0
+        self.reanchored = 0
+        self.frame_work = deque(maxlen=history)  # seconds of callback work per frame
+        self.frame_callbacks = deque(maxlen=history)  # callbacks run per frame
+        self.lateness = deque(maxlen=history)  # seconds each callback ran after its deadline
+        self.client_work: Dict[str, List[float]] = {}  # name -> [callbacks, seconds]
+
+    # ------------------------------------------------------------------ clients
+
+    def client(self, name: str) -> ClockClient:
+        client = ClockClient(self, name)
+        self.clients.append(client)
+        return client
+
+    def remove_client(self, client: ClockClient):
+        if client in self.clients:
+            self.clients.remove(client)
+
+    def cancel_owner(self, name: str):
+        """Cancel every timer of every client called name (e.g. a game id)"""
+        for client in self.clients:
+            if client.name == name:
+                client.cancel_all()
+        self.clients = [c for c in self.clients if c.name != name]
+
+    # ------------------------------------------------------------------ timers
+
+    def schedule(self, client: ClockClient, delay_ms: Optional[float], callback: Callable,
+                 period: Optional[Period] = None) -> ClockTimer:
+        timer = ClockTimer(0.0, period, callback, client)
+        if delay_ms is None:
+            delay = timer.period_seconds() if period is not None else 0.0
+        else:
+            delay = max(0.0, delay_ms / 1000.0)
+        timer.deadline = self.clock() + delay
+        if client not in self.clients:
+            self.clients.append(client)  # re-registers after cancel_owner()
+        client.timers.add(timer)
+        if client.paused:
+            timer.remaining = delay
+        else:
+            self._push(timer)
+            self._arm()
+        return timer
+
+    def cancel(self, timer: ClockTimer):
+        was_live = timer.token is not None
+        timer.token = None
+        timer.client.timers.discard(timer)
+        if was_live and self.wake_at is not None and timer.deadline <= self.wake_at + FRAME_SLACK:
+            # It may have been what the pending after() was for
+            self._arm()
+
+    def _push(self, timer: ClockTimer):
+        timer.token = next(self.tokens)
+        heapq.heappush(self.heap, (timer.deadline, timer.token, timer))
+
+    def _peek(self) -> Optional[float]:
+        """Earliest live deadline, discarding stale heap entries on top"""
+        heap = self.heap
+        while heap and heap[0][2].token != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def _arm(self):
+        """Make the pending after() fire at the earliest deadline"""
+        if self.paused_at is not None:
+            return
+        deadline = self._peek()
+        if deadline is None:
+            self._disarm()
+            return
+        if self.callback_id is not None and self.wake_at is not None and self.wake_at <= deadline:
+            # An early wake-up is harmless; it re-arms for what is left
+            return
+        self._disarm()
+        delay_ms = max(1, int(round((deadline - self.clock()) * 1000)))
+        self.wake_at = deadline
+        self.callback_id = self.widget.after(delay_ms, self._pump)
+
+    def _disarm(self):
+        if self.callback_id is not None:
+            try:
+                self.widget.after_cancel(self.callback_id)
+            except Exception:
+                pass
+        self.callback_id = None
+        self.wake_at = None
+
+    def _pump(self):
+        self.callback_id = None
+        self.wake_at = None
+        if self.paused_at is not None:
+            return
+
+        clock = self.clock
+        # after() has millisecond resolution: run what is due within FRAME_SLACK
+        due = clock() + FRAME_SLACK
+        # Entries pushed during this frame (tokens past this one) wait for the
+        # next frame, so a callback rescheduling itself with no delay cannot spin
+        first_new = next(self.tokens)
+        deferred = []
+        work = 0.0
+        ran = 0
+        heap = self.heap
+        while heap and heap[0][0] <= due:
+            entry = heapq.heappop(heap)
+            deadline, token, timer = entry
+            if timer.token != token:
+                continue
+            if token > first_new:
+                deferred.append(entry)
+                continue
+            client = timer.client
+            start = clock()
+            self.lateness.append(start - deadline)
+            if timer.period is None:
+                timer.token = None
+                client.timers.discard(timer)
+            try:
+                result = timer.callback()
+            except Exception as e:
+                # One failing game timer must not stall the others
+                print(f"FrameClock: error in {client.name} timer: {e}")
+                result = False
+            end = clock()
+            work += end - start
+            ran += 1
+            totals = self.client_work.setdefault(client.name, [0, 0.0])
+            totals[0] += 1
+            totals[1] += end - start
+
+            if timer.period is not None and timer.token == token:
+                if result is False:
+                    self.cancel(timer)
+                else:
+                    period = timer.period_seconds()
+                    timer.deadline += period
+                    if end - timer.deadline > period:
+                        timer.deadline = end + period
+                        self.reanchored += 1
+                    self._push(timer)
+
+        for entry in deferred:
+            heapq.heappush(heap, entry)
+        self.frames += 1
+        self.callbacks += ran
+        self.frame_work.append(work)
+        self.frame_callbacks.append(ran)
+        self._arm()
+
+    # ------------------------------------------------------------------ control
+
+    def pause(self):
+        """Freeze every timer; resume() shifts all deadlines by the paused time"""
+        if self.paused_at is None:
+            self.paused_at = self.clock()
+            self._disarm()
+
+    def resume(self):
+        if self.paused_at is None:
+            return
+        shift = self.clock() - self.paused_at
+        self.paused_at = None
+        # A uniform shift keeps the heap ordered
+        self.heap = [(deadline + shift, token, timer) for deadline, token, timer in self.heap]
+        for _, token, timer in self.heap:
+            if timer.token == token:
+                timer.deadline += shift
+        self._arm()
+
+    def stop(self):
+        """Cancel everything (application shutdown)"""
+        for client in self.clients:
+            client.cancel_all()
+        self.heap = []
+        self._disarm()
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-frame callback work and lateness, plus totals per client"""
+        work_ms = [w * 1000.0 for w in self.frame_work]
+        late_ms = [late * 1000.0 for late in self.lateness]
+        return {
+            'frames': self.frames,
+            'callbacks': self.callbacks,
+            'timers': sum(len(c.timers) for c in self.clients),
+            'reanchored': self.reanchored,
+            'work_ms_mean': sum(work_ms) / len(work_ms) if work_ms else None,
+            'work_ms_max': max(work_ms) if work_ms else None,
+            'callbacks_per_frame': (sum(self.frame_callbacks) / len(self.frame_callbacks)
+                                    if self.frame_callbacks else None),
+            'late_ms_mean': sum(late_ms) / len(late_ms) if late_ms else None,
+            'late_ms_max': max(late_ms) if late_ms else None,
+            'clients': {
+                name: {'callbacks': int(count), 'work_ms': seconds * 1000.0}
+                for name, (count, seconds) in self.client_work.items()
+            },
+        }
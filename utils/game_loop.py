@@ -0,0 +1,135 @@
+"""
+Fixed-timestep game loop for Ultimate Gaming Platform
+Schedules logic ticks against perf_counter() deadlines so the tick rate
+does not drift by the time spent in logic and drawing
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+class FixedTimestepLoop:
+    """
+    Drives tick() at a target period and render() at its own, capped rate.
+
+    Deadlines advance by the target period rather than being re-measured from
+    "now", so work time does not stretch the period. If the loop falls behind
+    it runs up to max_catch_up ticks back to back, then skips the rest and
+    re-anchors on the current time.
+
+    tick() returns False to stop the loop (e.g. on game over).
+    tick_interval() returns the current period in milliseconds, so it can
+    change with level or power-ups.
+    """
+
+    def __init__(
+        self,
+        widget,
+        tick: Callable[[], bool],
+        render: Callable[[], Any],
+        tick_interval: Callable[[], float],
+        render_interval: float = 16,
+        max_catch_up: int = 5,
+        history: int = 240,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.widget = widget
+        self.tick = tick
+        self.render = render
+        self.tick_interval = tick_interval
+        self.render_interval = render_interval / 1000.0
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+
+        self.running = False
+        self.callback_id = None
+        self.next_tick = 0.0
+        self.next_render = 0.0
+        self.dirty = False
+
+        # Stats
+        self.ticks = 0
+        self.frames = 0
+        self.skipped_ticks = 0
+        self.jitter = deque(maxlen=history)  # seconds late per tick
+        self.tick_times = deque(maxlen=history)  # perf_counter() of each tick
+
+    def start(self):
+        """Start (or resume) the loop; the first tick runs immediately"""
+        if self.running:
+            return
+        self.running = True
+        now = self.clock()
+        self.next_tick = now
+        self.next_render = now
+        self._pump()
+
+    def stop(self):
+        """Stop the loop and cancel the pending callback"""
+        self.running = False
+        if self.callback_id is not None:
+            try:
+                self.widget.after_cancel(self.callback_id)
+            except Exception:
+                pass
+            self.callback_id = None
+
+    def _pump(self):
+        self.callback_id = None
+        if not self.running:
+            return
+
+        now = self.clock()
+        ran = 0
+        while self.running and now >= self.next_tick:
+            self.jitter.append(now - self.next_tick)
+            self.tick_times.append(now)
+            self.ticks += 1
+            ran += 1
+            self.dirty = True
+            if self.tick() is False:
+                self.running = False
+                break
+            self.next_tick += self.tick_interval() / 1000.0
+            now = self.clock()
+            if ran >= self.max_catch_up and now >= self.next_tick:
+                # Too far behind to catch up: drop the backlog and re-anchor
+                period = self.tick_interval() / 1000.0
+                behind = int((now - self.next_tick) / period) + 1
+                self.skipped_ticks += behind
+                self.next_tick += behind * period
+                break
+
+        if self.dirty and now >= self.next_render:
+            self.render()
+            self.frames += 1
+            self.dirty = False
+            self.next_render = now + self.render_interval
+
+        if not self.running:
+            return
+
+        wake = self.next_tick
+        if self.dirty:
+            wake = min(wake, self.next_render)
+        delay_ms = max(1, int(round((wake - self.clock()) * 1000)))
+        self.callback_id = self.widget.after(delay_ms, self._pump)
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Measured tick timing: jitter is how late each tick ran against its deadline"""
+        jitter_ms = [j * 1000.0 for j in self.jitter]
+        tick_rate = None
+        if len(self.tick_times) > 1:
+            span = self.tick_times[-1] - self.tick_times[0]
+            if span > 0:
+                tick_rate = (len(self.tick_times) - 1) / span
+        return {
+            'ticks': self.ticks,
+            'frames': self.frames,
+            'skipped_ticks': self.skipped_ticks,
+            'target_interval_ms': self.tick_interval(),
+            'tick_rate': tick_rate,
+            'jitter_ms_mean': sum(jitter_ms) / len(jitter_ms) if jitter_ms else None,
+            'jitter_ms_max': max(jitter_ms) if jitter_ms else None,
+        }
@@ -2,9 +2,13 @@ import json
 import os
 from datetime import datetime
 import importlib
+import sqlite3
 import sys
 import customtkinter as ctk
 
+from utils.frame_clock import FrameClock
+from utils.question_bank import QUIZ_POOL_SIZE, QuestionBank, as_quiz_lists, ensure_bank
+
 class GameManager:
     def __init__(self, main_app):
         self.main_app = main_app
@@ -18,6 +22,10 @@ class GameManager:
         # Ensure data directory exists
         os.makedirs(self.data_dir, exist_ok=True)
         
+        # One Tk after() loop for every game timer; games get it as clock=
+        root = getattr(main_app, 'root', None)
+        self.clock = FrameClock(root) if root is not None else None
+        
         self.session_data = {
             'games_played': 0,
             'total_time': 0,
@@ -55,14 +63,20 @@ class GameManager:
         
         self.load_all_data()
     
-    def load_quiz_data(self):
-        """Load quiz data with error handling"""
+    def load_quiz_data(self, category=None, difficulty=None, count=QUIZ_POOL_SIZE):
+        """
+        Load `count` random questions (optionally one category/difficulty)
+        from the compiled question bank, compiling it first if the data
+        modules changed. Only the selected rows are read.
+        """
         try:
-            from data.CorrectAnswer import correct_answers
-            from data.Questions import questions
-            from data.Options import options
-            return questions, options, correct_answers
-        except ImportError as e:
+            bank_path = ensure_bank(self.data_dir)
+            with QuestionBank(bank_path) as bank:
+                rows = bank.sample(count, category, difficulty)
+            if not rows:
+                raise ValueError(f"no questions for category={category!r}, difficulty={difficulty!r}")
+            return as_quiz_lists(rows)
+        except (ImportError, ValueError, OSError, sqlite3.Error) as e:
             print(f"Warning: Could not load quiz data files: {e}")
             # Provide fallback quiz data
             fallback_questions = [
@@ -134,13 +148,15 @@ class GameManager:
                 if game_id == 'quiz':
                     # Load quiz data
                     questions, options, correct_answers = self.load_quiz_data()
-                    game_instance = game_class(parent_frame, questions, options, correct_answers, self.return_to_menu)
+                    game_instance = game_class(parent_frame, questions, options, correct_answers, self.return_to_menu,
+                                               clock=self.clock)
                 
                 elif game_id == 'memory':
                     # Memory game initialization patterns
                     try:
-                        # Try with return_callback parameter
-                        game_instance = game_class(parent_frame, return_callback=self.return_to_menu)
+                        # Try with return_callback and the shared clock
+                        game_instance = game_class(parent_frame, return_callback=self.return_to_menu,
+                                                   clock=self.clock)
                     except TypeError:
                         try:
                             # Try with callback as second parameter
@@ -156,8 +172,9 @@ class GameManager:
                 elif game_id == 'snake':
                     # Snake game initialization patterns
                     try:
-                        # Try with return_callback parameter
-                        game_instance = game_class(parent_frame, return_callback=self.return_to_menu)
+                        # Try with return_callback and the shared clock
+                        game_instance = game_class(parent_frame, return_callback=self.return_to_menu,
+                                                   clock=self.clock)
                     except TypeError:
                         try:
                             # Try with callback as second parameter
@@ -286,6 +303,10 @@ class GameManager:
                 except Exception as e:
                     print(f"Error during game cleanup: {e}")
             
+            # Drop any timers the game left on the shared clock
+            if self.clock:
+                self.clock.cancel_owner(self.current_game)
+            
             # Remove the game instance
             del self.game_instances[self.current_game]
         
@@ -378,6 +399,10 @@ class GameManager:
             'achievements': self.session_data['achievements']
         }
     
+    def get_clock_stats(self) -> dict:
+        """Per-frame timer work measured by the shared clock"""
+        return self.clock.stats() if self.clock else {}
+    
     def get_game_state(self, game_id: str) -> dict:
         """Get saved state for a specific game"""
         return self.game_states.get(game_id, {})
@@ -418,6 +443,8 @@ class GameManager:
                     game_instance.cleanup()
             except Exception as e:
                 print(f"Error cleaning up game {game_id}: {e}")
+        if self.clock:
+            self.clock.stop()
         
         # Clear all instances
         self.game_instances.clear()
@@ -0,0 +1,128 @@
+"""
+Headless widget stand-ins for Ultimate Gaming Platform
+Lets timing and stress scripts run the game classes without a display, by
+patching a game module's ctk/tkinter names from outside for one run
+"""
+
+import contextlib
+import heapq
+import itertools
+import tkinter
+from typing import Callable, Dict, List, Tuple
+
+
+class StubWidget:
+    """
+    Stand-in for every ctk/Tk widget: draws nothing, counts widgets created
+    and method calls made on them. Unknown methods are no-ops returning 0.
+    """
+
+    created = 0
+    calls = 0
+
+    def __init__(self, *args, **kwargs):
+        StubWidget.created += 1
+        self.options = kwargs
+        self.children = []
+        self.parent = args[0] if args and isinstance(args[0], StubWidget) else None
+        if self.parent:
+            self.parent.children.append(self)
+
+    def __getitem__(self, key):
+        return self.options.get(key, 0)
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_children(self):
+        return list(self.children)
+
+    def destroy(self):
+        StubWidget.calls += 1
+        if self.parent and self in self.parent.children:
+            self.parent.children.remove(self)
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            StubWidget.calls += 1
+            return 0
+        return method
+
+
+class StubModule:
+    """ctk / tkinter replacement whose widget classes are all StubWidget"""
+
+    TclError = tkinter.TclError
+
+    def __getattr__(self, name):
+        return StubWidget
+
+
+class VirtualTimeRoot(StubWidget):
+    """
+    Stub root window whose after()/after_cancel() work on a virtual clock.
+    advance() runs whatever comes due; clock() is the matching time source
+    for FrameClock and the games.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.now = 0.0
+        self.queue: List[Tuple[float, int, str]] = []
+        self.callbacks: Dict[str, Callable] = {}
+        self.ids = itertools.count(1)
+
+    def clock(self) -> float:
+        return self.now
+
+    def after(self, delay_ms, callback=None):
+        number = next(self.ids)
+        after_id = f"after#{number}"
+        self.callbacks[after_id] = callback
+        heapq.heappush(self.queue, (self.now + delay_ms / 1000.0, number, after_id))
+        return after_id
+
+    def after_idle(self, callback):
+        return self.after(0, callback)
+
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+
+    def advance(self, seconds: float):
+        """Move the clock forward, running due callbacks in deadline order"""
+        end = self.now + seconds
+        while self.queue and self.queue[0][0] <= end:
+            due, _, after_id = heapq.heappop(self.queue)
+            callback = self.callbacks.pop(after_id, None)
+            if callback is None:
+                continue  # cancelled
+            self.now = max(self.now, due)
+            callback()
+        self.now = end
+
+    @property
+    def pending(self) -> int:
+        """after() callbacks scheduled and not yet run or cancelled"""
+        return len(self.callbacks)
+
+
+def widget_work() -> Tuple[int, int]:
+    """(widgets created, widget calls) so far, for per-step deltas"""
+    return StubWidget.created, StubWidget.calls
+
+
+@contextlib.contextmanager
+def stub_widgets(*modules):
+    """Point each module's ctk and tkinter names at StubModule until the block exits"""
+    stub = StubModule()
+    saved = []
+    for module in modules:
+        for name in ("ctk", "tkinter"):
+            if hasattr(module, name):
+                saved.append((module, name, getattr(module, name)))
+                setattr(module, name, stub)
+    try:
+        yield stub
+    finally:
+        for module, name, value in saved:
+            setattr(module, name, value)
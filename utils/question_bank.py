@@ -0,0 +1,368 @@
+"""
+Compiled question bank for Ultimate Gaming Platform
+Builds one indexed SQLite file from the quiz data and reads back only the
+questions a game selects
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+BANK_VERSION = 1
+BANK_FILE = "quiz_bank.db"
+
+# Python list modules in the data directory the default bank is compiled from
+SOURCE_FILES = ("Questions.py", "Options.py", "CorrectAnswer.py")
+
+# Questions drawn from the bank per quiz launch; QuizGame plays 10 of them,
+# so a restart still gets a fresh set
+QUIZ_POOL_SIZE = 50
+
+DEFAULT_CATEGORY = "General"
+DEFAULT_DIFFICULTY = 1
+
+# (question, options, correct option index, category, difficulty)
+Record = Tuple[str, List[str], int, str, int]
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE questions (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    options TEXT NOT NULL,
+    correct INTEGER NOT NULL
+);
+CREATE TABLE groups (
+    category TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    first_id INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (category, difficulty)
+);
+"""
+
+
+def correct_index(options: Sequence, answer, number: int = 0) -> int:
+    """Position of answer among options (compared as stripped text); ValueError if absent"""
+    if isinstance(answer, int) and not isinstance(answer, bool):
+        if 0 <= answer < len(options):
+            return answer
+        raise ValueError(f"Question {number}: answer index {answer} out of range for {len(options)} options")
+    target = str(answer).strip()
+    for i, option in enumerate(options):
+        if str(option).strip() == target:
+            return i
+    raise ValueError(f"Question {number}: correct answer {target!r} is not among its options {list(options)}")
+
+
+def answer_indices(options: Sequence[Sequence[str]], correct_answers: Sequence) -> array:
+    """
+    Correct option index per question as a byte array, from answer texts or
+    indices; ValueError if any answer is not among its question's options
+    """
+    if len(options) != len(correct_answers):
+        raise ValueError(f"Mismatched data lengths: Options({len(options)}), Answers({len(correct_answers)})")
+    return array("B", (correct_index(opts, answer, i + 1)
+                        for i, (opts, answer) in enumerate(zip(options, correct_answers))))
+
+
+def records_from_lists(questions: Sequence[str], options: Sequence[Sequence[str]],
+                       correct_answers: Sequence, categories: Optional[Sequence[str]] = None,
+                       difficulties: Optional[Sequence[int]] = None) -> Iterable[Record]:
+    """Records from the parallel lists used by data/, validating each answer"""
+    if not (len(questions) == len(options) == len(correct_answers)):
+        raise ValueError(
+            f"Mismatched data lengths: Questions({len(questions)}), "
+            f"Options({len(options)}), Answers({len(correct_answers)})"
+        )
+    for i, (question, opts, answer) in enumerate(zip(questions, options, correct_answers)):
+        opts = [str(option).strip() for option in opts]
+        category = categories[i] if categories else DEFAULT_CATEGORY
+        difficulty = difficulties[i] if difficulties else DEFAULT_DIFFICULTY
+        yield str(question), opts, correct_index(opts, answer, i + 1), category, int(difficulty)
+
+
+def compile_bank(records: Iterable[Record], path: str, batch: int = 10000) -> Dict[str, Any]:
+    """
+    Write records to a new bank at path (replacing it once complete).
+
+    Rows are stored sorted by (category, difficulty), so every group is a
+    contiguous id range listed in the groups table; sampling a group then
+    needs no scan. Records are staged in batches, so the input may be a
+    generator larger than memory.
+    """
+    start = time.perf_counter()
+    temp_path = path + ".tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    conn = sqlite3.connect(temp_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        conn.execute(
+            "CREATE TEMP TABLE staging (category TEXT, difficulty INTEGER, question TEXT, "
+            "options TEXT, correct INTEGER)"
+        )
+        rows = []
+        for question, options, correct, category, difficulty in records:
+            rows.append((category, difficulty, question, json.dumps(options, ensure_ascii=False), correct))
+            if len(rows) >= batch:
+                conn.executemany("INSERT INTO staging VALUES (?, ?, ?, ?, ?)", rows)
+                rows = []
+        if rows:
+            conn.executemany("INSERT INTO staging VALUES (?, ?, ?, ?, ?)", rows)
+
+        conn.execute(
+            "INSERT INTO questions (category, difficulty, question, options, correct) "
+            "SELECT category, difficulty, question, options, correct FROM staging "
+            "ORDER BY category, difficulty, rowid"
+        )
+        conn.execute(
+            "INSERT INTO groups SELECT category, difficulty, MIN(id), COUNT(*) "
+            "FROM questions GROUP BY category, difficulty"
+        )
+        total = conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("version", str(BANK_VERSION)),
+            ("count", str(total)),
+            ("compiled", time.strftime("%Y-%m-%dT%H:%M:%S")),
+        ])
+        conn.execute("DROP TABLE staging")
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(temp_path, path)
+
+    return {
+        "path": path,
+        "questions": total,
+        "bytes": os.path.getsize(path),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def compile_data_modules(data_dir: str = "data", path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Compile the data/ list modules into data_dir/quiz_bank.db. Modules may
+    also define `categories` and `difficulties` lists parallel to the questions.
+    """
+    from data.Questions import questions
+    from data.Options import options
+    from data.CorrectAnswer import correct_answers
+    import data.Questions as question_module
+
+    records = records_from_lists(
+        questions, options, correct_answers,
+        getattr(question_module, "categories", None),
+        getattr(question_module, "difficulties", None),
+    )
+    return compile_bank(records, path or os.path.join(data_dir, BANK_FILE))
+
+
+def bank_is_stale(data_dir: str = "data", path: Optional[str] = None) -> bool:
+    """True when the bank is missing or older than one of the source modules"""
+    path = path or os.path.join(data_dir, BANK_FILE)
+    if not os.path.exists(path):
+        return True
+    compiled = os.path.getmtime(path)
+    for name in SOURCE_FILES:
+        source = os.path.join(data_dir, name)
+        if os.path.exists(source) and os.path.getmtime(source) > compiled:
+            return True
+    return False
+
+
+def ensure_bank(data_dir: str = "data") -> str:
+    """Path to the default bank, compiling it first if the sources changed"""
+    path = os.path.join(data_dir, BANK_FILE)
+    if bank_is_stale(data_dir, path):
+        stats = compile_data_modules(data_dir, path)
+        print(f"Compiled {stats['questions']} quiz questions into {path}")
+    return path
+
+
+class QuestionBank:
+    """
+    Read-only view of a compiled bank. Only the small groups table is read
+    on open; sample() picks ids from the group ranges and fetches just those
+    rows by primary key, so its cost does not depend on the bank size.
+    """
+
+    def __init__(self, path: str):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No question bank at {path}")
+        self.path = path
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+        if int(meta.get("version", 0)) != BANK_VERSION:
+            self.conn.close()
+            raise ValueError(f"{path} is bank version {meta.get('version')}, expected {BANK_VERSION}")
+        # (category, difficulty, first_id, count), in id order
+        self.groups: List[Tuple[str, int, int, int]] = list(self.conn.execute(
+            "SELECT category, difficulty, first_id, count FROM groups ORDER BY first_id"
+        ))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _ranges(self, category: Optional[str], difficulty: Optional[int]) -> List[Tuple[int, int]]:
+        return [
+            (first_id, count) for group_category, group_difficulty, first_id, count in self.groups
+            if (category is None or group_category == category)
+            and (difficulty is None or group_difficulty == difficulty)
+        ]
+
+    def count(self, category: Optional[str] = None, difficulty: Optional[int] = None) -> int:
+        return sum(count for _, count in self._ranges(category, difficulty))
+
+    def categories(self) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for category, _, _, count in self.groups:
+            totals[category] = totals.get(category, 0) + count
+        return totals
+
+    def difficulties(self) -> Dict[int, int]:
+        totals: Dict[int, int] = {}
+        for _, difficulty, _, count in self.groups:
+            totals[difficulty] = totals.get(difficulty, 0) + count
+        return totals
+
+    def sample(self, count: int, category: Optional[str] = None, difficulty: Optional[int] = None,
+               rng=None) -> List[Dict[str, Any]]:
+        """Up to `count` random questions matching the filters (None matches any)"""
+        ranges = self._ranges(category, difficulty)
+        starts = []
+        total = 0
+        for _, size in ranges:
+            starts.append(total)
+            total += size
+        if total == 0:
+            return []
+        picks = (rng or random).sample(range(total), min(count, total))
+        ids = []
+        for position in picks:
+            group = bisect_right(starts, position) - 1
+            ids.append(ranges[group][0] + position - starts[group])
+        return self.fetch(ids)
+
+    def fetch(self, ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """Rows for the given ids, in that order"""
+        rows = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT id, question, options, correct, category, difficulty "
+                f"FROM questions WHERE id IN ({marks})", chunk
+            ):
+                rows[row[0]] = {
+                    "id": row[0],
+                    "question": row[1],
+                    "options": json.loads(row[2]),
+                    "correct": row[3],
+                    "category": row[4],
+                    "difficulty": row[5],
+                }
+        return [rows[i] for i in ids if i in rows]
+
+
+def as_quiz_lists(rows: Sequence[Dict[str, Any]]) -> Tuple[List[str], List[List[str]], List[int]]:
+    """(questions, options, correct option indices) in the form QuizGame takes"""
+    questions = [row["question"] for row in rows]
+    options = [row["options"] for row in rows]
+    correct_answers = [row["correct"] for row in rows]
+    return questions, options, correct_answers
+
+
+def synthetic_records(count: int, categories: Sequence[str] = ("Science", "History", "Sports", "Entertainment"),
+                      levels: int = 5, seed: int = 0) -> Iterable[Record]:
+    """Generated questions for sizing and benchmarking large banks"""
+    rng = random.Random(seed)
+    for i in range(count):
+        options = [f"Answer {i}-{k}" for k in range(4)]
+        yield (f"Synthetic question {i}?", options, rng.randrange(4),
+               rng.choice(categories), rng.randint(1, levels))
+
+
+def benchmark(sizes: Sequence[int] = (1_000, 100_000, 1_000_000), picks: int = 10,
+              repeats: int = 200, directory: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Compile synthetic banks and time opening them and sampling `picks` questions"""
+    import tempfile
+
+    results = []
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"bank_{size}.db")
+            stats = compile_bank(synthetic_records(size), path)
+            rng = random.Random(1)
+
+            start = time.perf_counter()
+            for _ in range(repeats):
+                with QuestionBank(path) as bank:
+                    bank.sample(picks, rng=rng)
+            load_ms = (time.perf_counter() - start) * 1000 / repeats
+
+            with QuestionBank(path) as bank:
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    bank.sample(picks, category="Science", difficulty=3, rng=rng)
+                filtered_ms = (time.perf_counter() - start) * 1000 / repeats
+
+            results.append({
+                "questions": size,
+                "compile_seconds": stats["seconds"],
+                "megabytes": stats["bytes"] / 1e6,
+                "open_and_sample_ms": load_ms,
+                "filtered_sample_ms": filtered_ms,
+            })
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compile and inspect quiz question banks")
+    parser.add_argument("--data-dir", default="data", help="directory holding the list modules")
+    parser.add_argument("--out", help="bank path (default: <data-dir>/quiz_bank.db)")
+    parser.add_argument("--benchmark", action="store_true", help="time synthetic banks up to 1M questions")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        for row in benchmark():
+            print(
+                f"{row['questions']:>9,} questions: compile {row['compile_seconds']:6.2f}s  "
+                f"{row['megabytes']:7.1f} MB  open+sample {row['open_and_sample_ms']:.3f} ms  "
+                f"filtered sample {row['filtered_sample_ms']:.3f} ms"
+            )
+        return 0
+
+    try:
+        stats = compile_data_modules(args.data_dir, args.out)
+    except (ImportError, ValueError) as e:
+        print(f"Could not compile question bank: {e}")
+        return 1
+    with QuestionBank(stats["path"]) as bank:
+        print(f"Compiled {stats['questions']} questions into {stats['path']} ({stats['bytes']:,} bytes)")
+        for category, count in sorted(bank.categories().items()):
+            print(f"  {category}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,6 @@ import json
 import os
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Set
-import customtkinter as ctk
 
 class ScoreManager:
     def __init__(self, data_dir: str = "data"):
@@ -208,6 +207,36 @@ class ScoreManager:
         self.save_scores()
         return is_high_score
     
+    def add_scores(self, game_id: str, entries: List[Dict[str, Any]],
+                   award_achievements: bool = True) -> int:
+        """
+        Add many {'score', 'player', 'additional_data'} entries and save once;
+        returns how many made the top 10
+        """
+        timestamp = self._get_current_timestamp()
+        new_entries = [
+            {
+                'score': entry['score'],
+                'player': entry.get('player', 'Player'),
+                'date': timestamp,
+                'additional_data': entry.get('additional_data') or {}
+            }
+            for entry in entries
+        ]
+        
+        board = self.scores.get(game_id, []) + new_entries
+        board.sort(key=lambda x: x['score'], reverse=True)
+        self.scores[game_id] = board[:10]
+        
+        kept = {id(entry) for entry in self.scores[game_id]}
+        high_scores = sum(1 for entry in new_entries if id(entry) in kept)
+        
+        if high_scores and award_achievements:
+            self.check_achievement('high_scorer')
+        
+        self.save_scores()
+        return high_scores
+    
     def get_high_scores(self, game_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get high scores for a specific game"""
         return self.scores.get(game_id, [])[:limit]